@@ -3,7 +3,7 @@ import streamlit as st
 from dotenv import load_dotenv
 
 # Project Imports
-from job_hunter.data_manager import DataManager
+from job_hunter.data_manager import DataManager, thaw
 from job_hunter.mission_state import MissionProgress
 from tools.browser_manager import BrowserManager
 
@@ -27,7 +27,7 @@ db = DataManager()
 if 'page' not in st.session_state: st.session_state['page'] = 'home'
 if 'resumes' not in st.session_state: st.session_state['resumes'] = db.load_resume_config()
 if 'applied_jobs' not in st.session_state: st.session_state['applied_jobs'] = db.load_applied()
-if 'job_cache' not in st.session_state: st.session_state['job_cache'] = db.load_cache()
+if 'job_cache' not in st.session_state: st.session_state['job_cache'] = thaw(db.load_cache())
 
 def navigate_to(page):
     st.session_state['page'] = page
@@ -62,6 +62,13 @@ with st.sidebar:
                 perc = min(progress.current_step / progress.total_steps, 1.0)
                 st.progress(perc, text=f"Progress: {progress.current_step}/{progress.total_steps}")
 
+            # Scouting workers running in parallel
+            running = {w.get('task') for w in progress.workers.values() if w.get('task')}
+            if progress.workers:
+                st.caption("Workers:")
+                for name, w in sorted(progress.workers.items()):
+                    st.caption(f"🛠️ {name} · {w.get('platform', '-')} · {w.get('jobs', 0)} jobs · {w.get('status', '')}")
+
             # Tasks List
             if progress.tasks:
                 st.markdown("---")
@@ -69,7 +76,7 @@ with st.sidebar:
                 with st.container(height=300):
                     for i, task in enumerate(progress.tasks):
                         label = task.get('label')
-                        is_current = (i == progress.current_task_idx)
+                        is_current = (i == progress.current_task_idx) or label in running
 
                         if task.get('completed'):
                             st.markdown(f"✅ ~~{i+1}. {label}~~")
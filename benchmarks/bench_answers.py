@@ -0,0 +1,101 @@
+"""
+Question -> answer matching: the original per-pattern loops vs the precompiled AnswerIndex.
+
+    python -m benchmarks.bench_answers [questions] [patterns]
+"""
+import random
+import sys
+import time
+
+from job_hunter.answer_index import AnswerIndex, answer_index_for, normalize
+
+WORDS = ["years", "experience", "python", "sql", "authorized", "work", "sponsorship", "visa",
+         "relocate", "remote", "notice", "period", "salary", "expectation", "start", "degree",
+         "english", "german", "level", "license", "driving", "travel", "willing", "how", "many",
+         "do", "you", "have", "are", "what", "is", "your", "with", "in", "the", "of"]
+
+
+def make_answers(n_patterns, rng):
+    answers = {}
+    while len(answers) < n_patterns:
+        pattern = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))) + f" {len(answers)}"
+        answers[pattern] = str(rng.randrange(10))
+    return answers
+
+
+def make_questions(n_questions, answers, rng):
+    patterns = list(answers)
+    questions = []
+    for i in range(n_questions):
+        kind = i % 4
+        if kind == 0:
+            questions.append(rng.choice(patterns).upper() + "?")
+        elif kind == 1:
+            questions.append(f"Please tell us: {rng.choice(patterns)} (required)")
+        else:
+            questions.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 9))) + "?")
+    return questions
+
+
+def match_naive(answers, question_text):
+    """get_answer_for_question before the index."""
+    q_norm = normalize(question_text)
+    if not q_norm:
+        return None
+    for pattern, answer in answers.items():
+        if normalize(pattern) == q_norm:
+            return answer
+    for pattern, answer in answers.items():
+        p_norm = normalize(pattern)
+        if not p_norm:
+            continue
+        if p_norm in q_norm or q_norm in p_norm:
+            return answer
+    q_words = set(q_norm.split())
+    best_match = None
+    max_overlap = 0
+    for pattern, answer in answers.items():
+        p_words = set(normalize(pattern).split())
+        if not p_words:
+            continue
+        overlap = len(q_words.intersection(p_words))
+        if overlap > max_overlap:
+            if overlap >= 2 or overlap == len(p_words):
+                max_overlap = overlap
+                best_match = answer
+    return best_match
+
+
+def main(n_questions=200, n_patterns=5_000):
+    rng = random.Random(7)
+    answers = make_answers(n_patterns, rng)
+    questions = make_questions(n_questions, answers, rng)
+
+    t0 = time.perf_counter()
+    expected = [match_naive(answers, q) for q in questions]
+    naive = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = AnswerIndex(answers)
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = [index.match(q) for q in questions]
+    lookup = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for q in questions:
+        answer_index_for(answers).match(q)
+    cached = time.perf_counter() - t0
+
+    assert got == expected, "index disagrees with the naive loops"
+    print(f"{n_questions} questions x {n_patterns} patterns "
+          f"({sum(a is not None for a in expected)} answered)")
+    print(f"  naive loops:         {naive * 1000:8.1f} ms")
+    print(f"  index build:         {build * 1000:8.1f} ms (once per answers version)")
+    print(f"  index match:         {lookup * 1000:8.1f} ms")
+    print(f"  cached + match:      {cached * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,81 @@
+"""
+Blacklist filtering: per-pattern `in` loops vs the compiled BlacklistMatcher.
+
+    python -m benchmarks.bench_blacklist [jobs] [patterns]
+"""
+import random
+import sys
+import time
+
+from job_hunter.blacklist_matcher import BLOCK, KEEP, RESCUE, matcher_for
+
+WORDS = ["senior", "junior", "data", "analyst", "engineer", "marketing", "sales", "manager",
+         "python", "cloud", "platform", "product", "support", "backend", "frontend", "lead",
+         "scientist", "werkstudent", "intern", "consultant", "devops", "finance", "hr", "ops"]
+
+
+def make_blacklist(n_patterns, rng):
+    companies = [f"company {i} {rng.choice(WORDS)}" for i in range(n_patterns // 2)]
+    titles = [f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}" for i in range(n_patterns // 2 - 20)]
+    titles += WORDS[5:8]
+    safe_phrases = [f"{rng.choice(WORDS)} analysis {i}" for i in range(17)] + ["analyst"]
+    return {"companies": companies, "titles": titles, "safe_phrases": safe_phrases}
+
+
+def make_jobs(n_jobs, rng):
+    return [{"title": " ".join(rng.choice(WORDS).title() for _ in range(4)),
+             "company": f"Company {rng.randrange(5000)} GmbH"} for _ in range(n_jobs)]
+
+
+def classify_naive(blacklist, jobs):
+    """The loops save_scouted_jobs used before the matcher."""
+    bl_companies = [c.lower() for c in blacklist.get("companies", []) if c]
+    bl_titles = [t.lower() for t in blacklist.get("titles", []) if t]
+    safe_phrases = [s.lower() for s in blacklist.get("safe_phrases", []) if s]
+    decisions = []
+    for job in jobs:
+        j_title = job.get('title', 'Unknown').lower()
+        j_company = job.get('company', 'Unknown').lower()
+        if any(c in j_company for c in bl_companies):
+            decisions.append(BLOCK)
+        elif not any(t in j_title for t in bl_titles):
+            decisions.append(KEEP)
+        elif any(s in j_title for s in safe_phrases):
+            decisions.append(RESCUE)
+        else:
+            decisions.append(BLOCK)
+    return decisions
+
+
+def main(n_jobs=10_000, n_patterns=1_000):
+    rng = random.Random(42)
+    blacklist = make_blacklist(n_patterns, rng)
+    jobs = make_jobs(n_jobs, rng)
+
+    t0 = time.perf_counter()
+    expected = classify_naive(blacklist, jobs)
+    naive = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    matcher = matcher_for(blacklist)
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = matcher.classify(jobs)
+    scan = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    matcher_for(blacklist).classify(jobs)
+    cached = time.perf_counter() - t0
+
+    assert got == expected, "matcher disagrees with the naive loops"
+    print(f"{n_jobs} jobs x {n_patterns} patterns "
+          f"({expected.count(BLOCK)} blocked, {expected.count(RESCUE)} rescued)")
+    print(f"  naive loops:         {naive * 1000:8.1f} ms")
+    print(f"  matcher build:       {build * 1000:8.1f} ms (once per blacklist version)")
+    print(f"  matcher classify:    {scan * 1000:8.1f} ms")
+    print(f"  cached + classify:   {cached * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,63 @@
+"""
+Encode/decode time and file size of the hot stores: stdlib json (pretty, as before) vs
+the codec (compact, and pretty for exports).
+
+    python -m benchmarks.bench_codec [jobs]
+
+Realistic shapes: scouted jobs as stored (rich description moved to the blob store, so a
+reference) and one analysis cache entry per job.
+"""
+import hashlib
+import json
+import sys
+import time
+
+from job_hunter import codec
+from job_hunter.blob_store import make_ref
+
+
+def make_job(i):
+    return {"title": f"Senior Data Engineer (m/w/d) {i}", "company": f"Company {i % 997} GmbH",
+            "location": "München, Bayern, Deutschland", "platform": "LinkedIn",
+            "link": f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+            "description": "Short teaser text for the job card. " * 4,
+            "rich_description": make_ref(hashlib.sha256(str(i).encode()).hexdigest(), 2400),
+            "language": "de", "scraped_at": "2024-06-11T10:00:00", "Found_job": "Data Engineer"}
+
+
+def make_analysis(i):
+    return {"score": i % 100, "reasoning": "Strong overlap in Python and data pipeline experience. " * 6,
+            "missing_skills": ["Kubernetes", "Scala"], "matching_skills": ["Python", "SQL", "Airflow", "Spark"],
+            "language": "de", "_analyzed_at": "2024-06-11T10:00:00"}
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, result
+
+
+def main(n_jobs=5000):
+    stores = {
+        "scouted_jobs": [make_job(i) for i in range(n_jobs)],
+        "analysis_cache": {f"Job {i}_resume.pdf": make_analysis(i) for i in range(n_jobs)},
+    }
+    variants = [
+        ("stdlib json, indent=2", lambda d: json.dumps(d, indent=2, ensure_ascii=False).encode("utf-8"), json.loads),
+        (f"codec ({codec.BACKEND}), compact", lambda d: codec.dumps(d), codec.loads),
+        (f"codec ({codec.BACKEND}), pretty", lambda d: codec.dumps(d, pretty=True), codec.loads),
+    ]
+    for name, data in stores.items():
+        print(f"{name}: {n_jobs} records")
+        for label, encode, decode in variants:
+            enc_ms, payload = timed(lambda: encode(data))
+            dec_ms, _ = timed(lambda: decode(payload))
+            print(f"  {label:<30} encode {enc_ms:7.1f} ms   decode {dec_ms:7.1f} ms   "
+                  f"size {len(payload) / 2**20:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
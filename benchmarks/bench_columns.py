@@ -0,0 +1,71 @@
+"""
+Dashboard data load: frames rebuilt from the raw stores (as before) vs the columnar
+snapshot from DataManager.job_columns.
+
+    python -m benchmarks.bench_columns [jobs]
+
+Runs in a temporary directory.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from job_hunter.data_manager import DataManager, SCOUTED_FILE, APPLIED_FILE, read_cache
+from job_hunter.job_columns import job_columns_cache
+from ui.metrics import frame_from_columns
+
+
+def make_job(i):
+    return {"title": f"Data Engineer {i}", "company": f"Company {i % 997} GmbH", "location": "Berlin, Germany",
+            "link": f"https://www.linkedin.com/jobs/view/{4000000000 + i}", "platform": "LinkedIn",
+            "description": "Short teaser text for the job card. " * 4, "language": ["en", "de"][i % 2],
+            "scraped_at": "2024-06-11T10:00:00", "Found_job": "Data Engineer"}
+
+
+def timed(label, fn):
+    t0 = time.perf_counter()
+    result = fn()
+    print(f"  {label:<40} {(time.perf_counter() - t0) * 1000:8.1f} ms   ({len(result)} rows)")
+
+
+def legacy_applied_frame(applied):
+    return pd.DataFrame([{
+        "Platform": r["job_details"].get("Platform") or r["job_details"].get("platform") or "Unknown",
+        "Found_job": r["job_details"].get("Found_job") or r["job_details"].get("found_job") or "Unknown",
+        "Language": r["job_details"].get("Language") or r["job_details"].get("language") or "Unknown",
+        "created_at": r.get("created_at")} for r in applied.values()])
+
+
+def main(n_jobs=50_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        db = DataManager()
+        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+            json.dump([make_job(i) for i in range(n_jobs)], f)
+        with open(APPLIED_FILE, "w", encoding="utf-8") as f:
+            json.dump({f"Job {i}": {"job_details": make_job(i), "status": "applied",
+                                    "created_at": "2024-06-11T10:00:00"} for i in range(n_jobs)}, f)
+        print(f"{n_jobs} scouted + {n_jobs} applied jobs")
+
+        read_cache.invalidate()
+        timed("load + DataFrame (cold)", lambda: pd.DataFrame(db.load_scouted()))
+        timed("load + DataFrame (cached store)", lambda: pd.DataFrame(db.load_scouted()))
+        timed("applied dict -> DataFrame (cached store)", lambda: legacy_applied_frame(db.load_applied()))
+
+        read_cache.invalidate()
+        timed("job_columns scouted (first build + save)", lambda: frame_from_columns(db.job_columns("scouted")))
+        job_columns_cache.invalidate()
+        read_cache.invalidate()
+        timed("job_columns scouted (new process, .npz)", lambda: frame_from_columns(db.job_columns("scouted")))
+        timed("job_columns scouted (rerun)", lambda: frame_from_columns(db.job_columns("scouted")))
+        timed("job_columns applied (first build + save)", lambda: frame_from_columns(db.job_columns("applied")))
+        timed("job_columns applied (rerun)", lambda: frame_from_columns(db.job_columns("applied")))
+        os.chdir("/")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,86 @@
+"""
+Pause -> Resume reaction time of a waiting mission loop: sleep-and-reload polling (as
+before: 5s pause loop, 2s intervention loop) vs the mission control channel, for a waiter
+thread in the same process (Streamlit sessions) and a waiter in another process.
+
+    python -m benchmarks.bench_mission_control [rounds]
+
+Runs in a temporary directory.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from job_hunter.mission_control import mission_control
+from job_hunter.mission_state import MissionProgress
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WAITER = """
+import sys, time
+from job_hunter.mission_control import mission_control
+from job_hunter.mission_state import MissionProgress
+mission_control.listen()
+print("ready", flush=True)
+mission_control.wait_until(lambda: not MissionProgress.load().is_paused, timeout=30)
+print(time.time(), flush=True)
+"""
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    print(f"  {label:<44} median {latencies[len(latencies) // 2] * 1000:8.2f} ms   max {latencies[-1] * 1000:8.2f} ms")
+
+
+def polling(interval, rounds):
+    # Resume lands uniformly within the sleep: the loop notices it at the end of the interval
+    return [interval - interval * (i + 0.5) / rounds for i in range(rounds)]
+
+
+def in_process(rounds):
+    latencies = []
+    for _ in range(rounds):
+        MissionProgress.load().update(is_paused=True)
+        woke = []
+        waiter = threading.Thread(target=lambda: woke.append(
+            mission_control.wait_until(lambda: not MissionProgress.load().is_paused, timeout=30) and time.perf_counter()))
+        waiter.start()
+        time.sleep(0.05)
+        t0 = time.perf_counter()
+        MissionProgress.load().update(is_paused=False)
+        waiter.join()
+        latencies.append(woke[0] - t0)
+    return latencies
+
+
+def other_process(rounds):
+    latencies = []
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    for _ in range(rounds):
+        MissionProgress.load().update(is_paused=True)
+        proc = subprocess.Popen([sys.executable, "-c", WAITER], stdout=subprocess.PIPE, text=True, env=env)
+        proc.stdout.readline()  # listening
+        time.sleep(0.05)
+        t0 = time.time()
+        MissionProgress.load().update(is_paused=False)
+        latencies.append(float(proc.stdout.readline()) - t0)
+        proc.wait()
+    return latencies
+
+
+def main(rounds=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        MissionProgress(mission_type="Scout & Analyze", is_active=True).save()
+        print(f"{rounds} pause/resume rounds")
+        report("polling every 5s (pause loop, before)", polling(5, rounds))
+        report("polling every 2s (intervention loop, before)", polling(2, rounds))
+        report("control channel, same process", in_process(rounds))
+        report("control channel, other process", other_process(rounds))
+        os.chdir("/")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
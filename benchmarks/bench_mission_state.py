@@ -0,0 +1,62 @@
+"""
+Mission bookkeeping per processed backlog item: full MissionProgress rewrite (as before)
+vs one event journal line (pop_backlog / increment / update).
+
+    python -m benchmarks.bench_mission_state [backlog size]
+
+Runs in a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from job_hunter.mission_state import EVENTS_FILE, STATE_FILE, MissionProgress
+
+STEPS = 200
+
+
+def make_job(i):
+    return {"title": f"Data Engineer {i}", "company": f"Company {i}", "link": f"https://example.org/jobs/{i}",
+            "rich_description": f"Job {i}: build data pipelines. " * 100, "_resume_text": "Resume text. " * 300}
+
+
+def timed(label, step):
+    t0 = time.perf_counter()
+    for _ in range(STEPS):
+        step()
+    per_step = (time.perf_counter() - t0) * 1000 / STEPS
+    size = sum(os.path.getsize(p) for p in (STATE_FILE, EVENTS_FILE) if os.path.exists(p))
+    print(f"  {label:<40} {per_step:8.2f} ms/step   (state on disk: {size / 1024:.0f} KB)")
+
+
+def main(backlog=2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        print(f"Analysis backlog of {backlog} jobs, {STEPS} steps")
+        for label, journaled in (("full rewrite per step (before)", False), ("event journal per step", True)):
+            progress = MissionProgress(mission_type="Scout & Analyze", is_active=True,
+                                       analysis_backlog=[make_job(i) for i in range(backlog)])
+            progress.save()
+
+            def step():
+                if journaled:
+                    progress.update(status="Analyzing...", current_step=1)
+                    progress.increment("jobs_applied")
+                    progress.pop_backlog("analysis_backlog")
+                else:
+                    progress.status, progress.current_step = "Analyzing...", 1
+                    progress.jobs_applied += 1
+                    progress.analysis_backlog.pop(0)
+                    for _ in range(3):
+                        progress.save()
+            timed(label, step)
+            t0 = time.perf_counter()
+            loaded = MissionProgress.load()
+            print(f"  {'load (UI poll)':<40} {(time.perf_counter() - t0) * 1000:8.2f} ms        "
+                  f"({len(loaded.analysis_backlog)} jobs left)")
+        os.chdir("/")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,57 @@
+"""
+Detail fetches per minute on a simulated platform that shows a CAPTCHA whenever two page
+loads come closer than its tolerance: fixed random.uniform(3, 5) sleeps (as before) vs the
+adaptive rate limiter with the same 3-5 s range, for a tolerant and a strict platform.
+Runs on a virtual clock, so it takes no real time.
+
+    python -m benchmarks.bench_rate_limiter [page loads]
+"""
+import random
+import sys
+
+from job_hunter.rate_limiter import RateLimiter
+
+PAGE_SECONDS = 1.0          # load and parse time of a page
+CAPTCHA_PENALTY = 60.0      # solving / waiting out a CAPTCHA
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def run(pause, tolerance, loads, limiter=None, clock=None):
+    clock = clock or Clock()
+    last, blocks = None, 0
+    for _ in range(loads):
+        clock.sleep(pause(clock))
+        blocked = last is not None and clock.now - last < tolerance
+        last = clock.now
+        clock.sleep(PAGE_SECONDS + (CAPTCHA_PENALTY if blocked else 0))
+        blocks += blocked
+        if limiter:
+            (limiter.blocked if blocked else limiter.clean)("Platform")
+    return loads / clock.now * 60, blocks
+
+
+def main(loads=500):
+    random.seed(1)
+    print(f"{loads} page loads, {PAGE_SECONDS:.0f} s each, {CAPTCHA_PENALTY:.0f} s per CAPTCHA")
+    for tolerance in (3.0, 5.5):
+        fixed = run(lambda clock: random.uniform(3, 5), tolerance, loads)
+        clock = Clock()
+        limiter = RateLimiter(sleep=clock.sleep, clock=clock)
+        adaptive = run(lambda clock: limiter.delay("Platform", 3, 5), tolerance, loads, limiter, clock)
+        print(f"  platform tolerating a load every {tolerance:.1f} s")
+        print(f"    fixed 3-5 s sleeps (before)  {fixed[0]:6.1f} loads/min   {fixed[1]:4d} CAPTCHAs")
+        print(f"    adaptive rate limiter        {adaptive[0]:6.1f} loads/min   {adaptive[1]:4d} CAPTCHAs")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,61 @@
+"""
+Wall-clock time of a scouting backlog (3 resumes x 5 titles x 2 locations x 5 platforms =
+150 searches) with 1..5 ScoutPool workers, one search per platform at a time. Then a
+mission with analysis: all searches first and the analysis afterwards (as before) vs the
+pipeline, where each scraped job goes to the analysis stage right away. Searches, detail
+fetches and analyses are simulated by sleeping.
+
+    python -m benchmarks.bench_scout_pool [seconds per search]
+"""
+import sys
+import time
+
+from job_hunter.scout_pool import DONE, STAGE_DONE, ScoutPool, Stage
+
+PLATFORMS = ("LinkedIn", "Indeed", "Xing", "Stepstone", "ZipRecruiter")
+BACKLOG = [{"keyword": f"title {t}", "location": loc, "platform": p, "role_name": f"resume {r}"}
+           for r in range(3) for t in range(5) for loc in ("Berlin", "Remote") for p in PLATFORMS]
+JOBS_PER_SEARCH = 2
+
+
+def pipeline(search_seconds, workers=3):
+    def scrape(worker, item, report, emit):
+        time.sleep(search_seconds)                  # search
+        for i in range(JOBS_PER_SEARCH):
+            time.sleep(search_seconds / 2)          # detail fetch
+            emit({"search": item, "job": i})
+        return [None] * JOBS_PER_SEARCH
+
+    analyze = lambda stage, job: time.sleep(search_seconds / 2)  # one LLM browser
+    jobs = len(BACKLOG) * JOBS_PER_SEARCH
+
+    t0 = time.perf_counter()
+    for _ in ScoutPool(workers=workers).run(BACKLOG, lambda w, i, r, e: scrape(w, i, r, lambda job: None)):
+        pass
+    for _ in range(jobs):
+        analyze(None, None)
+    phased = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    analyzed = sum(1 for event, *_ in ScoutPool(workers=workers).run(BACKLOG, scrape, stage=Stage("analysis", analyze))
+                   if event == STAGE_DONE)
+    streamed = time.perf_counter() - t0
+    print(f"{len(BACKLOG)} searches, {jobs} jobs analyzed, {workers} workers")
+    print(f"  scout, then analyze (before)   {phased:6.2f} s")
+    print(f"  pipeline                       {streamed:6.2f} s   ({analyzed} analyzed, {streamed / phased * 100:5.1f}%)")
+
+
+def main(search_seconds=0.02):
+    search = lambda worker, item, report, emit: time.sleep(search_seconds) or []
+    print(f"{len(BACKLOG)} searches of {search_seconds * 1000:.0f} ms")
+    for workers in range(1, len(PLATFORMS) + 1):
+        t0 = time.perf_counter()
+        done = sum(1 for event, *_ in ScoutPool(workers=workers, per_platform=1).run(BACKLOG, search) if event == DONE)
+        elapsed = time.perf_counter() - t0
+        print(f"  {workers} worker(s): {elapsed:6.2f} s   ({done} searches, "
+              f"{elapsed / (len(BACKLOG) * search_seconds) * 100:5.1f}% of sequential)")
+    pipeline(search_seconds)
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:2]))
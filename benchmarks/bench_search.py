@@ -0,0 +1,73 @@
+"""
+Explorer search: pandas str.contains over the description column (as before) vs the
+full-text index behind DataManager.search_jobs (JSON stores) and the SQLite FTS5 tables.
+
+    python -m benchmarks.bench_search [jobs]
+
+Runs in a temporary directory.
+"""
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from job_hunter.data_manager import DataManager, SCOUTED_FILE, read_cache
+from job_hunter.sqlite_store import SQLiteDataManager
+
+SKILLS = ("python java spark airflow kubernetes react typescript sql dbt snowflake aws azure gcp docker terraform "
+          "scala golang rust kafka tableau excel sap salesforce figma pytorch").split()
+PHRASES = ("data platform", "machine learning", "on call", "remote first", "customer success", "product owner")
+FILLER = [f"word{i}" for i in range(20_000)]
+FILLER_WEIGHTS = list(itertools.accumulate(1 / (i + 1) for i in range(len(FILLER))))  # Zipf-like
+QUERIES = ("python", '"data platform"', "spark airflow -java", 'python "machine learning" NOT remote',
+           "kubernetes terraform aws")
+
+
+def make_job(i, rng):
+    words = rng.choices(FILLER, cum_weights=FILLER_WEIGHTS, k=300) + rng.sample(SKILLS, 6)
+    words += " ".join(rng.sample(PHRASES, 2)).split()
+    rng.shuffle(words)
+    return {"title": f"Data Engineer {i}", "company": f"Company {i % 997} GmbH",
+            "link": f"https://www.linkedin.com/jobs/view/{4000000000 + i}", "platform": "LinkedIn",
+            "rich_description": " ".join(words)}
+
+
+def timed(label, fn, repeat=1):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:<48} {(time.perf_counter() - t0) * 1000 / repeat:8.1f} ms   ({len(result)} hits)")
+
+
+def main(n_jobs=50_000):
+    rng = random.Random(7)
+    jobs = [make_job(i, rng) for i in range(n_jobs)]
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        db = DataManager()
+        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+            json.dump(jobs, f)
+        print(f"{n_jobs} scouted jobs")
+
+        read_cache.invalidate()
+        df = pd.DataFrame(db.load_scouted())
+        timed("pandas str.contains('python') + ~'java'",
+              lambda: df[df["rich_description"].str.contains("python") & ~df["rich_description"].str.contains("java")])
+        timed("search index build (first search)", lambda: db.search_jobs("python"))
+        for query in QUERIES:
+            timed(f"search_jobs {query}", lambda: db.search_jobs(query), repeat=5)
+
+        sdb = SQLiteDataManager()
+        timed("SQLite backend: reindex_search", lambda: [None] * sdb.reindex_search())
+        for query in QUERIES:
+            timed(f"SQLite search_jobs {query}", lambda: sdb.search_jobs(query), repeat=5)
+        os.chdir("/")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,61 @@
+"""
+Peak memory and time: full loaders vs the streaming iter_scouted / iter_applied.
+
+    python -m benchmarks.bench_streaming [jobs]
+
+Runs in a temporary directory; counts links the way archive/metrics-style callers do.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from job_hunter.data_manager import DataManager, SCOUTED_FILE, APPLIED_FILE, read_cache
+
+
+def make_job(i):
+    return {"title": f"Data Engineer {i}", "company": f"Company {i % 997} GmbH", "location": "Berlin, Germany",
+            "link": f"https://www.linkedin.com/jobs/view/{4000000000 + i}", "platform": "LinkedIn",
+            "description": "Short teaser text for the job card. " * 4, "language": "en",
+            "scraped_at": "2024-06-11T10:00:00", "Found_job": "Data Engineer"}
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<34} {elapsed * 1000:8.0f} ms   peak {peak / 2**20:8.1f} MB   -> {result}")
+    return result
+
+
+def main(n_jobs=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        db = DataManager()
+        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+            json.dump([make_job(i) for i in range(n_jobs)], f, indent=2)
+        with open(APPLIED_FILE, "w", encoding="utf-8") as f:
+            json.dump({f"Job {i}": {"job_details": make_job(i), "status": "applied",
+                                    "created_at": "2024-06-11T10:00:00"} for i in range(n_jobs)}, f, indent=2)
+        print(f"{n_jobs} scouted + {n_jobs} applied jobs "
+              f"({(os.path.getsize(SCOUTED_FILE) + os.path.getsize(APPLIED_FILE)) / 2**20:.0f} MB on disk)")
+
+        read_cache.invalidate()
+        measure("load_scouted + links", lambda: len({j.get("link") for j in db.load_scouted()}))
+        read_cache.invalidate()
+        measure("iter_scouted(fields=link)", lambda: len({j.get("link") for j in db.iter_scouted(("link",))}))
+
+        read_cache.invalidate()
+        measure("load_applied + count", lambda: sum(1 for r in db.load_applied().values() if r.get("status")))
+        read_cache.invalidate()
+        measure("iter_applied(fields=status)", lambda: sum(1 for _, r in db.iter_applied(("status",)) if r))
+        os.chdir("/")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,51 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over many literal patterns: one pass over a text finds every
+    pattern occurring in it. Each pattern carries a value; a state's output is the
+    merge() of the values of all patterns ending there (including via failure links).
+    Subclasses add the scan loop that suits them (see BlacklistMatcher, AnswerIndex).
+    """
+    def __init__(self, merge, empty=None):
+        self.merge = merge
+        self.empty = empty
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [empty]
+
+    def add(self, pattern, value):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(self.empty)
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state] = self._combine(self._out[state], value)
+
+    def _combine(self, a, b):
+        if a == self.empty:
+            return b
+        if b == self.empty:
+            return a
+        return self.merge(a, b)
+
+    def link(self):
+        """Breadth-first failure links; each state inherits the output of its fallback."""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = self._combine(out[nxt], out[fail[nxt]])
+        return self
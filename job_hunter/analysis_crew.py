@@ -3,10 +3,16 @@ import os
 import re
 import json
 import uuid
-import random
 import time
+from job_hunter.rate_limiter import rate_limiter
 from tools.browser_llm import BrowserLLM
 
+
+def llm_provider():
+    """The browser LLM in use (also the key of its rate limit)."""
+    return os.getenv("BROWSER_LLM_PROVIDER", "ChatGPT")
+
+
 class JobAnalysisCrew:
     def __init__(self, job_text: str, resume_text: str, profile_name: str = "default"):
         self.job_text = job_text
@@ -110,7 +116,7 @@ class JobAnalysisCrew:
         # Respect headless setting from bot config
         headless = bot_config.get("settings", {}).get("ai_headless", True)
 
-        provider = os.getenv("BROWSER_LLM_PROVIDER", "ChatGPT")
+        provider = llm_provider()
         
         # Reuse existing browser session if provided
         if browser_llm is None:
@@ -123,8 +129,8 @@ class JobAnalysisCrew:
         if analysis_id is None:
             analysis_id = str(uuid.uuid4())[:8]
 
-        # Add human-like variation
-        time.sleep(random.uniform(1, 3))
+        # Add human-like variation, paced per provider
+        rate_limiter.wait(provider, 1, 3)
 
         # Construct a combined prompt
         prompt = f"""
@@ -203,6 +209,8 @@ Specific Instructions:
             response_text = browser_llm.ask(prompt, timeout=400)
 
             if response_text.startswith("ERROR:"):
+                if any(x in response_text.lower() for x in ["rate limit", "too many requests", "blocked"]):
+                    rate_limiter.blocked(provider, "rate limit")
                 # 1. Hard Driver Crash
                 if any(x in response_text.lower() for x in ["invalid session id", "stacktrace:", "no such window"]):
                     if attempt < max_retries:
@@ -225,6 +233,7 @@ Specific Instructions:
                 return {"error": response_text}
             
             # 3. Analyze content quality
+            rate_limiter.clean(provider)
             results = self._clean_json(response_text)
 
             is_empty = not results or (isinstance(results, dict) and len(results) <= 1 and "status" in results)
@@ -0,0 +1,125 @@
+import re
+import threading
+from bisect import bisect_right
+from collections import Counter
+
+from job_hunter.aho_corasick import AhoCorasick
+
+_SEPARATOR = "\x00"  # never survives normalize(), so no question can match across two patterns
+
+
+def normalize(text):
+    # Remove non-alphanumeric chars and extra spaces
+    return re.sub(r'[^\w\s]', '', text.lower()).strip()
+
+
+def _first(a, b):
+    return a if a < b else b
+
+
+class AnswerIndex(AhoCorasick):
+    """
+    Precompiled form of the bot_config answer patterns for get_answer_for_question.
+
+    Keeps the original three-step priority, first pattern (in config order) winning ties:
+      1. exact match on normalized text          -> hash map lookup
+      2. pattern in question or question in pattern -> Aho-Corasick scan of the question
+         plus one str.find over all patterns joined together
+      3. best word overlap (>= 2 words, or every word of a short pattern)
+                                                 -> inverted token index
+    The automaton's output per state is the smallest pattern position ending there.
+    """
+    def __init__(self, answers):
+        super().__init__(merge=_first)
+        self.answers = []        # position -> answer, in config order
+        self.exact = {}          # normalized pattern -> first answer
+        self.postings = {}       # word -> positions of patterns containing it
+        self.sizes = []          # position -> number of distinct words
+        normalized = []
+        for pattern, answer in answers.items():
+            p_norm = normalize(pattern)
+            if not p_norm:
+                continue
+            pos = len(self.answers)
+            self.answers.append(answer)
+            self.exact.setdefault(p_norm, answer)
+            self.add(p_norm, pos)
+            normalized.append(p_norm)
+            words = set(p_norm.split())
+            self.sizes.append(len(words))
+            for word in words:
+                self.postings.setdefault(word, []).append(pos)
+        self.link()
+        self._joined = _SEPARATOR.join(normalized)
+        # Start offset of every pattern inside _joined, for mapping a find() hit back to its position
+        self._offsets = []
+        offset = 0
+        for p_norm in normalized:
+            self._offsets.append(offset)
+            offset += len(p_norm) + 1
+
+    def _substring_match(self, q_norm):
+        """Smallest position whose pattern is inside the question or contains it, or None."""
+        goto, fail, out = self._goto, self._fail, self._out
+        best = None
+        state = 0
+        for ch in q_norm:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = out[state]
+            if hit is not None and (best is None or hit < best):
+                best = hit
+                if best == 0:
+                    return 0
+
+        at = self._joined.find(q_norm)
+        if at >= 0:
+            # Patterns are joined in config order, so the first hit is the earliest pattern
+            pos = bisect_right(self._offsets, at) - 1
+            if best is None or pos < best:
+                best = pos
+        return best
+
+    def _overlap_match(self, q_norm):
+        counts = Counter()
+        for word in set(q_norm.split()):
+            posting = self.postings.get(word)
+            if posting:
+                counts.update(posting)
+        best, best_overlap = None, 0
+        sizes = self.sizes
+        for pos, overlap in counts.items():
+            if overlap >= 2 or overlap == sizes[pos]:
+                if overlap > best_overlap or (overlap == best_overlap and pos < best):
+                    best, best_overlap = pos, overlap
+        return best
+
+    def match(self, question_text):
+        q_norm = normalize(question_text)
+        if not q_norm:
+            return None
+        if q_norm in self.exact:
+            return self.exact[q_norm]
+        pos = self._substring_match(q_norm)
+        if pos is None:
+            pos = self._overlap_match(q_norm)
+        return None if pos is None else self.answers[pos]
+
+
+_index = None
+_index_source = None
+_index_guard = threading.Lock()
+
+
+def answer_index_for(answers):
+    """
+    Returns the AnswerIndex for an answers mapping, rebuilding it only when the mapping
+    differs from the one it was last built for (i.e. after add_answer / delete_answer).
+    """
+    global _index, _index_source
+    with _index_guard:
+        if _index is None or answers != _index_source:
+            _index = AnswerIndex(answers)
+            _index_source = dict(answers)
+        return _index
@@ -6,12 +6,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from job_hunter.data_manager import DataManager
+from job_hunter.mission_control import mission_control
 from job_hunter.mission_state import MissionProgress
 from job_hunter.vision_core import VisionCore
 from tools.logger import logger
 from tools.browser_manager import BrowserManager
 from tools.human_actions import type_human_like
 
+INTERVENTION_TIMEOUT = 600  # seconds the vision loop waits for a human to resolve a question
+
 def random_wait(min_sec=1, max_sec=3):
     time.sleep(random.uniform(min_sec, max_sec))
 
@@ -202,15 +205,10 @@ class JobApplier:
                 if progress.is_active:
                     progress.update(pending_question=reason)
                 
-                # Halt executing actions until human resolves via UI
-                wait_intervals = 0
-                max_intervals = 300 # 10 mins
-                while progress.pending_question is not None and wait_intervals < max_intervals:
-                    random_wait(2, 2)
-                    progress = MissionProgress.load()
-                    wait_intervals += 1
-                    
-                if wait_intervals >= max_intervals:
+                # Halt executing actions until human resolves via UI ("I've answered it" publishes RESOLVED)
+                resolved = mission_control.wait_until(lambda: MissionProgress.load().pending_question is None,
+                                                      timeout=INTERVENTION_TIMEOUT)
+                if not resolved:
                     return False, "Timed out waiting for human intervention.", False
                     
                 logger.info("▶️ Human resolved intervention. Resuming vision loop.")
@@ -0,0 +1,153 @@
+import os
+from datetime import datetime
+
+from job_hunter import codec
+from job_hunter.storage import fsync_batcher, read_lock, write_lock
+
+SEGMENT_MAX_BYTES = 1024 * 1024  # a new segment file is started past this size
+SEPARATOR = "\n\n<br>\n\n---\n\n<br>\n\n"  # between reports in the rendered (newest first) view
+_TAIL_CHUNK = 4096
+
+
+class AuditLogbook:
+    """
+    Append-only career audit history: reports go to numbered segment files
+    (segment-00001.md, ...) and each gets one line in index.jsonl with its timestamp,
+    segment, byte offset and length.
+
+    append() writes to the end of the current segment and index, so it never reads the
+    history. latest(n) reads the last n index lines from the end of the index and only the
+    segments they point to. render() yields the newest-first markdown view report by
+    report. A legacy career_audit.md (newest first, one file) is imported on first use.
+    """
+    def __init__(self, root, legacy_path=None, segment_max_bytes=SEGMENT_MAX_BYTES):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.legacy_path = legacy_path
+        self.segment_max_bytes = segment_max_bytes
+
+    def _segment_path(self, segment):
+        return os.path.join(self.root, f"segment-{segment:05d}.md")
+
+    # --- WRITE ---
+    def append(self, text, at=None):
+        """Stores one report. Returns its index entry."""
+        os.makedirs(self.root, exist_ok=True)
+        with write_lock(self.index_path):
+            self._import_legacy()
+            return self._append(text, at or datetime.now().isoformat(timespec="seconds"))
+
+    def _append(self, text, at):
+        last = self._tail(1)
+        segment = last[0]["segment"] if last else 1
+        seq = last[0]["seq"] + 1 if last else 1
+        path = self._segment_path(segment)
+        offset = os.path.getsize(path) if os.path.exists(path) else 0
+        data = text.encode("utf-8")
+        if offset and offset + len(data) > self.segment_max_bytes:
+            segment, offset = segment + 1, 0
+            path = self._segment_path(segment)
+        # Segment first: a crash before the index line leaves unreferenced bytes, never a dangling entry
+        with open(path, "ab") as f:
+            f.write(data)
+        entry = {"seq": seq, "at": at, "segment": segment, "offset": offset, "length": len(data)}
+        with open(self.index_path, "ab+") as f:
+            # A line torn by a crash stays on its own line, where readers skip it
+            torn = False
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+            f.write((b"\n" if torn else b"") + codec.dumps(entry) + b"\n")
+        fsync_batcher.schedule(path)
+        fsync_batcher.schedule(self.index_path)
+        return entry
+
+    def _import_legacy(self):
+        if not self.legacy_path or os.path.exists(self.index_path) or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                reports = [r for r in f.read().split(SEPARATOR) if r.strip()]
+            at = datetime.fromtimestamp(os.path.getmtime(self.legacy_path)).isoformat(timespec="seconds")
+        except:
+            return
+        for text in reversed(reports):  # the legacy file is newest first
+            self._append(text, at)
+        os.replace(self.legacy_path, self.legacy_path + ".migrated")
+
+    # --- READ ---
+    def _tail(self, n):
+        """The last n index entries, oldest first; reads the index backwards in small chunks."""
+        if n <= 0 or not os.path.exists(self.index_path):
+            return []
+        entries = []
+        with open(self.index_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            rest = b""
+            while end > 0 and len(entries) < n:
+                start = max(0, end - _TAIL_CHUNK)
+                f.seek(start)
+                lines = (f.read(end - start) + rest).split(b"\n")
+                end = start
+                # The first piece may be the tail of an earlier line: keep it for the next chunk
+                rest = lines.pop(0) if end > 0 else b""
+                for line in reversed(lines):
+                    if len(entries) == n:
+                        break
+                    try:
+                        entries.append(codec.loads(line))
+                    except:
+                        pass  # empty or torn line (crash mid-append)
+        return entries[::-1]
+
+    def _read(self, entry):
+        with open(self._segment_path(entry["segment"]), "rb") as f:
+            f.seek(entry["offset"])
+            return f.read(entry["length"]).decode("utf-8")
+
+    def entries(self, n=None):
+        """Index entries, newest first (all of them when n is None)."""
+        self._ensure_imported()
+        if not os.path.exists(self.index_path):
+            return []
+        if n is None:
+            with read_lock(self.index_path), open(self.index_path, "rb") as f:
+                lines = f.read().splitlines()
+            entries = []
+            for line in lines:
+                try:
+                    entries.append(codec.loads(line))
+                except:
+                    pass
+            return entries[::-1]
+        with read_lock(self.index_path):
+            return self._tail(n)[::-1]
+
+    def latest(self, n=1):
+        """The newest n reports as (timestamp, markdown) pairs, newest first."""
+        return [(entry["at"], self._read(entry)) for entry in self.entries(n)]
+
+    def render(self, n=None):
+        """Yields the newest-first markdown view (like the old career_audit.md) piece by piece."""
+        for i, entry in enumerate(self.entries(n)):
+            if i:
+                yield SEPARATOR
+            yield self._read(entry)
+
+    def __len__(self):
+        last = self.entries(1)
+        return last[0]["seq"] if last else 0
+
+    def _ensure_imported(self):
+        if self.legacy_path and not os.path.exists(self.index_path) and os.path.exists(self.legacy_path):
+            os.makedirs(self.root, exist_ok=True)
+            with write_lock(self.index_path):
+                self._import_legacy()
+
+
+if __name__ == "__main__":
+    import sys
+    from job_hunter.data_manager import DataManager
+    for chunk in DataManager().audit_logbook().render():
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
@@ -0,0 +1,87 @@
+import operator
+import threading
+
+from job_hunter.aho_corasick import AhoCorasick
+
+# Pattern kinds, OR-ed into one bitmask per automaton state
+COMPANY = 1
+TITLE = 2
+SAFE = 4
+
+# Decisions returned by BlacklistMatcher.classify
+KEEP = "keep"
+BLOCK = "block"
+RESCUE = "rescue"
+
+
+class BlacklistMatcher(AhoCorasick):
+    """
+    Aho-Corasick automaton over all blacklist patterns (companies, titles, safe phrases).
+
+    Scanning a text costs one pass over its characters regardless of how many patterns
+    there are, instead of one `in` check per pattern. Matching is case-insensitive
+    substring matching, exactly like the loops it replaces in save_scouted_jobs.
+    """
+    def __init__(self, companies=(), titles=(), safe_phrases=()):
+        super().__init__(merge=operator.or_, empty=0)
+        for kind, patterns in ((COMPANY, companies), (TITLE, titles), (SAFE, safe_phrases)):
+            for pattern in patterns:
+                if pattern:
+                    self.add(pattern.lower(), kind)
+        self.link()
+
+    def scan(self, text, want=COMPANY | TITLE | SAFE):
+        """Returns the bitmask of pattern kinds found in text (stops early once all wanted kinds are seen)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        found = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+                if found & want == want:
+                    break
+        return found & want
+
+    def classify(self, jobs):
+        """
+        One decision per job: BLOCK (blacklisted company, or blacklisted title without a
+        safe phrase), RESCUE (blacklisted title saved by a safe phrase) or KEEP.
+        """
+        decisions = []
+        for job in jobs:
+            if self.scan(job.get('company', 'Unknown'), COMPANY):
+                decisions.append(BLOCK)
+                continue
+            found = self.scan(job.get('title', 'Unknown'), TITLE | SAFE)
+            if not found & TITLE:
+                decisions.append(KEEP)
+            elif found & SAFE and 'title' in job:
+                # A missing title is blacklist-checked as "Unknown" but never rescued
+                decisions.append(RESCUE)
+            else:
+                decisions.append(BLOCK)
+        return decisions
+
+
+_matchers = {}
+_matchers_guard = threading.Lock()
+_MAX_MATCHERS = 4
+
+
+def matcher_for(blacklist):
+    """
+    Returns the compiled matcher for a blacklist dict, building it only when the pattern
+    lists differ from the ones it was last built for (i.e. after save_blacklist).
+    """
+    key = tuple(tuple(blacklist.get(kind) or ()) for kind in ("companies", "titles", "safe_phrases"))
+    with _matchers_guard:
+        matcher = _matchers.get(key)
+        if matcher is None:
+            matcher = BlacklistMatcher(*key)
+            if len(_matchers) >= _MAX_MATCHERS:
+                _matchers.pop(next(iter(_matchers)))
+            _matchers[key] = matcher
+        return matcher
@@ -0,0 +1,190 @@
+import hashlib
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from job_hunter.storage import atomic_write_bytes
+
+try:
+    import zstandard
+except ImportError:  # optional: zlib is always available
+    zstandard = None
+
+BLOB_DIR = os.path.join("data", "blobs")
+BLOB_PREFIX = "blob:"
+
+# Long text fields that are stored once by content hash instead of inline in every record
+BLOB_FIELDS = ("rich_description", "cover_letter", "tailored_resume", "_resume_text", "resume_text")
+BLOB_MIN_CHARS = 512  # shorter values stay inline; a reference is ~80 chars
+
+GC_GRACE_SECONDS = 3600  # never collect fresh blobs: their record may not be written yet
+
+
+def is_blob_ref(value):
+    return isinstance(value, str) and value.startswith(BLOB_PREFIX)
+
+
+def make_ref(digest, length):
+    """blob:<sha256 hex>:<text length>; the length lets callers compare sizes without loading."""
+    return f"{BLOB_PREFIX}{digest}:{length}"
+
+
+def parse_ref(ref):
+    digest, _, length = ref[len(BLOB_PREFIX):].partition(":")
+    return digest, int(length or 0)
+
+
+class BlobStore:
+    """
+    Content-addressed store for long texts (job descriptions, resumes, AI artifacts).
+    Each distinct text is written once to data/blobs/<2 hex>/<sha256>.<codec>, compressed
+    with zstd when the zstandard package is installed and zlib otherwise. Records keep
+    only the "blob:..." reference; resolve() loads the text when something needs it.
+    """
+    def __init__(self, root=BLOB_DIR, cache_size=256):
+        self.root = root
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # digest -> text (blobs are immutable)
+        self._lock = threading.Lock()
+
+    def _path(self, digest, ext):
+        return os.path.join(self.root, digest[:2], f"{digest}.{ext}")
+
+    def put(self, text):
+        """Stores text (if not already present) and returns its reference."""
+        raw = text.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        for ext in ("zst", "z"):
+            try:
+                os.utime(self._path(digest, ext))  # referenced again: gc's grace period starts over
+                break
+            except OSError:
+                pass
+        else:
+            if zstandard:
+                atomic_write_bytes(self._path(digest, "zst"), zstandard.ZstdCompressor(level=10).compress(raw))
+            else:
+                atomic_write_bytes(self._path(digest, "z"), zlib.compress(raw, 6))
+        self._remember(digest, text)
+        return make_ref(digest, len(text))
+
+    def get(self, ref):
+        """Text of a reference. Raises FileNotFoundError if the blob is gone."""
+        digest, _ = parse_ref(ref)
+        with self._lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+        try:
+            with open(self._path(digest, "z"), "rb") as f:
+                raw = zlib.decompress(f.read())
+        except FileNotFoundError:
+            if not zstandard:
+                raise
+            with open(self._path(digest, "zst"), "rb") as f:
+                raw = zstandard.ZstdDecompressor().decompress(f.read())
+        text = raw.decode("utf-8")
+        self._remember(digest, text)
+        return text
+
+    def _remember(self, digest, text):
+        with self._lock:
+            self._cache[digest] = text
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def resolve(self, value, default=""):
+        """The text behind value if it is a reference, else value itself (inline/legacy data)."""
+        if not is_blob_ref(value):
+            return value
+        try:
+            return self.get(value)
+        except (OSError, ValueError, zlib.error):
+            return default
+
+    def externalize(self, obj):
+        """
+        Returns obj with every long BLOB_FIELDS string (at any depth) replaced by a
+        reference. Containers are only copied where something changed.
+        """
+        if isinstance(obj, dict):
+            out = None
+            for key, value in obj.items():
+                if key in BLOB_FIELDS and isinstance(value, str) and len(value) >= BLOB_MIN_CHARS \
+                        and not is_blob_ref(value):
+                    new = self.put(value)
+                else:
+                    new = self.externalize(value)
+                if new is not value:
+                    if out is None:
+                        out = dict(obj)
+                    out[key] = new
+            return obj if out is None else out
+        if isinstance(obj, list):
+            out = None
+            for i, value in enumerate(obj):
+                new = self.externalize(value)
+                if new is not value:
+                    if out is None:
+                        out = list(obj)
+                    out[i] = new
+            return obj if out is None else out
+        return obj
+
+    def gc(self, live_refs, grace_seconds=GC_GRACE_SECONDS):
+        """Deletes blobs not in live_refs (and older than the grace period). Returns the count."""
+        live = {parse_ref(ref)[0] for ref in live_refs}
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        if not os.path.isdir(self.root):
+            return 0
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                digest = name.split(".")[0]
+                path = os.path.join(shard_dir, name)
+                if digest in live or name.endswith(".tmp"):
+                    continue
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+def collect_refs(obj, refs=None):
+    """All blob references inside obj."""
+    refs = set() if refs is None else refs
+    if isinstance(obj, dict):
+        for value in obj.values():
+            collect_refs(value, refs)
+    elif isinstance(obj, list):
+        for value in obj:
+            collect_refs(value, refs)
+    elif is_blob_ref(obj):
+        refs.add(obj)
+    return refs
+
+
+def text_length(value):
+    """Length of a (possibly referenced) text without loading the blob."""
+    if is_blob_ref(value):
+        return parse_ref(value)[1]
+    return len(str(value or ""))
+
+
+blob_store = BlobStore()
+resolve_text = blob_store.resolve
+
+
+if __name__ == "__main__":
+    from job_hunter.data_manager import DataManager
+    print(DataManager().migrate_blobs())
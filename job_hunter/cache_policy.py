@@ -0,0 +1,173 @@
+import threading
+import time
+from datetime import datetime
+
+from job_hunter import codec
+from job_hunter.key_index import SortedKeyIndex
+from tools.logger import logger
+
+CACHE_MAX_ENTRIES = 5000
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+ERROR_TTL_SECONDS = 3 * 24 * 3600  # failed/skipped analyses are retried after this
+POLICY_INTERVAL = 60.0            # seconds between background runs
+EVICT_CHUNK = 100                 # keys deleted per store write (keeps each lock hold short)
+
+
+class CachePolicy:
+    """Limits for the analysis cache (see CachePolicyEngine)."""
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES,
+                 error_ttl=ERROR_TTL_SECONDS, interval=POLICY_INTERVAL, chunk=EVICT_CHUNK):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.error_ttl = error_ttl
+        self.interval = interval
+        self.chunk = chunk
+
+
+def is_error_entry(entry):
+    return isinstance(entry, dict) and ("error" in entry or entry.get("status") in ("failed", "skipped"))
+
+
+def _analyzed_ts(entry):
+    try:
+        return datetime.fromisoformat(entry["_analyzed_at"]).timestamp()
+    except:
+        return 0.0
+
+
+class CachePolicyEngine:
+    """
+    Keeps the analysis cache within its policy:
+      - error/failed/skipped entries expire after error_ttl (so the job gets analyzed again);
+      - above max_entries or max_bytes, entries for jobs that no scouted, applied or parked
+        job references (by job key, or by key prefix for entries without one) are evicted
+        least recently used first (last access in this process, else _analyzed_at).
+        Referenced analyses are never evicted.
+
+    save_cache schedules a run on a background thread (at most one per interval); evictions
+    are deleted in small chunks and summed up in report().
+    """
+    def __init__(self, policy=None):
+        self.policy = policy or CachePolicy()
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._thread = None
+        self._db = None
+        self._last_run = time.time()  # the first background run waits one interval too
+        self._accessed = {}  # cache key -> last access (time.time())
+        self._sizes = {}     # cache key -> (_analyzed_at, serialized size)
+        self._report = {"runs": 0, "expired": 0, "evicted": 0, "bytes_freed": 0, "last": None}
+
+    # --- access tracking ---
+    def touch(self, *keys):
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                if key:
+                    self._accessed[key] = now
+
+    def report(self):
+        with self._lock:
+            return dict(self._report)
+
+    # --- scheduling ---
+    def schedule(self, db):
+        """Runs the policy for db in the background, unless a run is pending or happened recently."""
+        with self._lock:
+            self._db = db
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run_later, name="cache-policy", daemon=True)
+            self._thread.start()
+
+    def _run_later(self):
+        wait = self._last_run + self.policy.interval - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        with self._lock:
+            db = self._db
+        try:
+            self.run(db)
+        except Exception as e:
+            logger.error(f"Cache policy run failed: {e}")
+        finally:
+            with self._lock:
+                self._thread = None
+
+    # --- the policy ---
+    def _entry_size(self, key, entry):
+        stamp = entry.get("_analyzed_at")
+        cached = self._sizes.get(key)
+        if cached and cached[0] == stamp and stamp is not None:
+            return cached[1]
+        size = len(codec.dumps(entry)) + len(key.encode("utf-8"))
+        self._sizes[key] = (stamp, size)
+        return size
+
+    def plan(self, cache, referenced_prefixes, now=None, referenced_job_keys=()):
+        """
+        Returns (expired keys, evicted keys, bytes freed) for a cache snapshot without changing
+        anything. An entry is referenced if its _job_key or its key prefix belongs to a job on record.
+        """
+        now = time.time() if now is None else now
+        policy = self.policy
+        sizes = {key: self._entry_size(key, entry) for key, entry in cache.items()}
+        for key in list(self._sizes):
+            if key not in cache:
+                del self._sizes[key]
+
+        expired = [key for key, entry in cache.items()
+                   if is_error_entry(entry) and now - _analyzed_ts(entry) >= policy.error_ttl]
+        gone = set(expired)
+        count = len(cache) - len(expired)
+        total = sum(sizes.values()) - sum(sizes[key] for key in expired)
+
+        evicted = []
+        if count > policy.max_entries or total > policy.max_bytes:
+            referenced = SortedKeyIndex(cache.keys()).with_any_prefix(referenced_prefixes)
+            referenced.update(key for key, entry in cache.items()
+                              if isinstance(entry, dict) and entry.get("_job_key") in referenced_job_keys)
+            with self._lock:
+                accessed = dict(self._accessed)
+            candidates = sorted((key for key in cache if key not in gone and key not in referenced),
+                                key=lambda k: max(accessed.get(k, 0.0), _analyzed_ts(cache[k])))
+            for key in candidates:
+                if count <= policy.max_entries and total <= policy.max_bytes:
+                    break
+                evicted.append(key)
+                count -= 1
+                total -= sizes[key]
+        freed = sum(sizes[key] for key in expired) + sum(sizes[key] for key in evicted)
+        return expired, evicted, freed
+
+    def run(self, db):
+        """One policy pass over db's cache. Returns this run's report."""
+        with self._run_lock:
+            return self._run(db)
+
+    def _run(self, db):
+        cache = db.load_cache()
+        expired, evicted, freed = self.plan(cache, db._referenced_cache_prefixes(),
+                                            referenced_job_keys=db._referenced_job_keys())
+        keys = expired + evicted
+        for start in range(0, len(keys), self.policy.chunk):
+            # Entries rewritten since the snapshot (e.g. a retried analysis) are left alone
+            db.evict_cache_entries({key: cache[key].get("_analyzed_at") for key in keys[start:start + self.policy.chunk]})
+        with self._lock:
+            for key in keys:
+                self._accessed.pop(key, None)
+            self._last_run = time.time()
+            last = {"expired": len(expired), "evicted": len(evicted), "bytes_freed": freed,
+                    "at": datetime.now().isoformat()}
+            self._report["runs"] += 1
+            self._report["expired"] += len(expired)
+            self._report["evicted"] += len(evicted)
+            self._report["bytes_freed"] += freed
+            self._report["last"] = last
+        if keys:
+            logger.info(f"Cache policy: expired {len(expired)} failed/skipped entries, "
+                        f"evicted {len(evicted)} unreferenced entries ({freed / 1024:.0f} KB)")
+        return last
+
+
+cache_policy_engine = CachePolicyEngine()
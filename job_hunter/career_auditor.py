@@ -1,5 +1,6 @@
 from datetime import datetime
 from tools.browser_llm import BrowserLLM
+from .blob_store import resolve_text
 from .data_manager import DataManager
 
 class CareerAuditor:
@@ -21,7 +22,7 @@ class CareerAuditor:
         
         for job_id, job_data in applied_jobs.items():
             details = job_data.get('job_details', {})
-            description = details.get('Rich Description') or details.get('rich_description') or details.get('Job Description') or details.get('description') or ''
+            description = resolve_text(details.get('Rich Description') or details.get('rich_description') or details.get('Job Description') or details.get('description') or '')
             title = details.get('Job Title', 'Unknown Role')
             
             # Metadata collection
@@ -0,0 +1,50 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: fastest encoder/decoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: used when orjson is missing
+    msgspec = None
+
+BACKEND = "orjson" if orjson else "msgspec" if msgspec else "json"
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+_msgspec_encoder = msgspec.json.Encoder() if msgspec and not orjson else None
+_msgspec_decoder = msgspec.json.Decoder() if msgspec and not orjson else None
+
+
+def dumps(obj, pretty=False):
+    """
+    UTF-8 JSON bytes via the fastest installed codec. pretty=True gives the 2-space indented
+    layout people read; otherwise the output is compact (no whitespace).
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except TypeError:
+            pass  # e.g. ints beyond 64 bit: the stdlib encoder below handles anything json did
+    elif _msgspec_encoder:
+        try:
+            data = _msgspec_encoder.encode(obj)
+            return msgspec.json.format(data, indent=2) if pretty else data
+        except (TypeError, msgspec.EncodeError):
+            pass  # e.g. dict subclasses (frozen views)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Parses JSON bytes or str. Raises ValueError on invalid input, like json.loads."""
+    if orjson:
+        return orjson.loads(data)
+    if _msgspec_decoder:
+        try:
+            return _msgspec_decoder.decode(data.encode("utf-8") if isinstance(data, str) else data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
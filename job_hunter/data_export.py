@@ -0,0 +1,47 @@
+import os
+
+from job_hunter import codec
+from job_hunter.data_manager import DATA_DIR, MISSION_STATE_FILE
+from job_hunter.journal import JsonJournal, journal_path_for
+from job_hunter.mission_state import load_state as load_mission_state
+from job_hunter.storage import atomic_write_bytes, read_lock
+
+EXPORT_DIR = os.path.join(DATA_DIR, "export")
+
+
+def export_data(out_dir=EXPORT_DIR, pretty=False, data_dir=DATA_DIR):
+    """
+    Writes a consistent copy of every JSON store in data_dir to out_dir: journaled stores
+    (and the mission state) with their journal folded in, compact stores (scouted jobs,
+    analysis cache, mission state) re-indented when pretty. Returns {file name: bytes written}.
+    """
+    written = {}
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        if not name.endswith(".json") or not os.path.isfile(path):
+            continue
+        try:
+            with read_lock(path):
+                if os.path.abspath(path) == os.path.abspath(MISSION_STATE_FILE):
+                    data = load_mission_state()  # checkpoint plus its event journal
+                elif os.path.exists(journal_path_for(path)):
+                    data = JsonJournal(path).load()
+                else:
+                    with open(path, "rb") as f:
+                        data = codec.loads(f.read())
+        except:
+            print(f"Skipped {name}: not valid JSON")
+            continue
+        payload = codec.dumps(data, pretty=pretty)
+        atomic_write_bytes(os.path.join(out_dir, name), payload)
+        written[name] = len(payload)
+    return written
+
+
+if __name__ == "__main__":
+    import sys
+    args = sys.argv[1:]
+    out = args[args.index("--out") + 1] if "--out" in args else EXPORT_DIR
+    for name, size in export_data(out, pretty="--pretty" in args).items():
+        print(f"{name}: {size / 1024:.0f} KB")
+    print(f"Exported to {out}")
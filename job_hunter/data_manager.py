@@ -1,8 +1,30 @@
+import itertools
 import json
 import os
-import re
+import threading
 import yaml
+from contextlib import contextmanager
 from datetime import datetime
+from job_hunter.answer_index import answer_index_for
+from job_hunter.blacklist_matcher import KEEP, RESCUE, matcher_for
+from job_hunter.blob_store import blob_store, collect_refs, text_length
+from job_hunter import codec
+from job_hunter.audit_log import AuditLogbook
+from job_hunter.cache_policy import cache_policy_engine
+from job_hunter.identity_index import IdentityIndex, identity_cache
+from job_hunter.job_key import JobKey, JobKeyIndex, job_key_indexes, job_key_of, resume_stem
+from job_hunter.journal import JsonJournal, journal_path_for
+from job_hunter.job_columns import (APPLIED_COLUMNS, APPLIED_FIELDS, SCOUTED_COLUMNS, SCOUTED_FIELDS, JobColumns,
+                                    applied_row, columns_path_for, job_columns_cache, scouted_key, scouted_row)
+from job_hunter.json_stream import iter_array, iter_object, project
+from job_hunter.key_index import SortedKeyIndex, store_key_indexes
+from job_hunter.mission_state import load_state as load_mission_state
+from job_hunter.near_duplicates import NearDuplicateIndex, near_duplicate_cache
+from job_hunter.resume_files import resume_file
+from job_hunter.search_cache import load_search_cache
+from job_hunter.search_index import APPLIED, SCOUTED, SEARCH_FIELDS, fts5_available, search_index_for, search_text
+from job_hunter.storage import atomic_write_json, atomic_write_text, read_json, read_lock, write_lock
+from tools.logger import logger
 
 DATA_DIR = "data"
 SCOUTED_FILE = os.path.join(DATA_DIR, "scouted_jobs.json")
@@ -11,46 +33,687 @@ MESSAGED_CONTACTS_FILE = os.path.join(DATA_DIR, "messaged_contacts.json")
 PARKED_FILE = os.path.join(DATA_DIR, "parked_jobs.json")
 BLACKLIST_FILE = os.path.join(DATA_DIR, "blacklist.json")
 CACHE_FILE = os.path.join(DATA_DIR, "analysis_cache.json")
-AUDIT_FILE = os.path.join(DATA_DIR, "career_audit.md")
+AUDIT_FILE = os.path.join(DATA_DIR, "career_audit.md")  # legacy single-file logbook, imported into AUDIT_DIR
+AUDIT_DIR = os.path.join(DATA_DIR, "career_audit")
+ACTIVE_RESUMES_FILE = os.path.join(DATA_DIR, "active_resumes.json")
+BOT_CONFIG_FILE = os.path.join(DATA_DIR, "bot_config.json")
+MISSION_STATE_FILE = os.path.join(DATA_DIR, "mission_state.json")  # MissionProgress checkpoint (+ events journal)
+COLUMNS_DIR = os.path.join(DATA_DIR, "columns")  # columnar dashboard snapshots (see job_columns.py)
+SEARCH_INDEX_FILE = os.path.join(DATA_DIR, "search_index.db")  # full-text index (see search_index.py)
+# Hot, machine-only stores are written compact; `python -m job_hunter.data_export --pretty` for reading
+COMPACT_STORES = (SCOUTED_FILE, CACHE_FILE, MISSION_STATE_FILE)
+RESUME_RUNTIME_KEYS = ("pdf", "pdf_bytes")  # resume entry fields that never go to resume_config.json
+
+
+def _is_compact_store(path):
+    return os.path.abspath(path) in {os.path.abspath(p) for p in COMPACT_STORES}
+
+
+# --- READ CACHE ---
+class FrozenDict(dict):
+    """Read-only dict handed out by the read cache. Use thaw() for a mutable copy."""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached data is read-only. Use thaw() to get a mutable copy.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+
+class FrozenList(list):
+    """Read-only list handed out by the read cache. Use thaw() for a mutable copy."""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached data is read-only. Use thaw() to get a mutable copy.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (list, (thaw(self),))
+
+
+def freeze(obj):
+    """Recursively converts parsed JSON into FrozenDict/FrozenList."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def apply_frozen(view, record):
+    """Returns a new frozen view with one journal record applied (top-level copy only)."""
+    new = FrozenDict(view)
+    key = record.get("key")
+    if record.get("op") == "set":
+        if record.get("last"):
+            dict.pop(new, key, None)
+        dict.__setitem__(new, key, freeze(record.get("value")))
+    elif record.get("op") == "del":
+        dict.pop(new, key, None)
+    return new
+
+
+def thaw(obj):
+    """Returns a plain, mutable deep copy of (possibly frozen) JSON data."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+class JsonReadCache:
+    """
+    Process-wide read-through cache of parsed JSON files.
+    Entries are validated against the file's (mtime_ns, size, inode), so writes from
+    other DataManager instances, missions or processes are picked up on the next read.
+    """
+    def __init__(self):
+        self._entries = {}  # path -> (signature, frozen value)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def signature(path, extra_paths=()):
+        """(mtime_ns, size, inode) of the file plus any companion files (None if missing)."""
+        st = os.stat(path)
+        sig = [(st.st_mtime_ns, st.st_size, st.st_ino)]
+        for extra in extra_paths:
+            try:
+                st = os.stat(extra)
+                sig.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except FileNotFoundError:
+                sig.append(None)
+        return tuple(sig)
+
+    @staticmethod
+    def _size(sig):
+        return sum(part[1] for part in sig if part)
+
+    def get(self, path, postprocess=None, loader=None, extra_paths=()):
+        """
+        Returns a frozen view of the parsed file. Raises if the file is missing or invalid.
+        loader/extra_paths let journaled stores replay their journal and include it in the signature.
+        """
+        key = os.path.abspath(path)
+        sig = self.signature(path, extra_paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == sig:
+                self.hits += 1
+                self.bytes_saved += self._size(sig)
+                self.per_file.setdefault(os.path.basename(path), [0, 0])[0] += 1
+                return entry[1]
+
+        if loader:
+            data = loader()
+        else:
+            with open(path, "rb") as f:
+                data = codec.loads(f.read())
+        if postprocess:
+            data = postprocess(data)
+        value = freeze(data)
+
+        with self._lock:
+            self.misses += 1
+            self.bytes_parsed += self._size(sig)
+            self.per_file.setdefault(os.path.basename(path), [0, 0])[1] += 1
+            self._entries[key] = (sig, value)
+        return value
+
+    def peek(self, path, extra_paths=()):
+        """The cached view if it is current, else None (never parses). Raises if the file is missing."""
+        key = os.path.abspath(path)
+        sig = self.signature(path, extra_paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == sig:
+                self.hits += 1
+                self.bytes_saved += self._size(sig)
+                self.per_file.setdefault(os.path.basename(path), [0, 0])[0] += 1
+                return entry[1]
+        return None
+
+    def apply(self, path, before_sig, after_sig, fn):
+        """
+        Updates a cached view in place of re-parsing after our own incremental write.
+        Only applies if the entry was current right before the write; otherwise drops it.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == before_sig:
+                self._entries[key] = (after_sig, fn(entry[1]))
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.bytes_parsed = 0
+        self.bytes_saved = 0
+        self.per_file = {}  # basename -> [hits, misses]
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_parsed": self.bytes_parsed,
+            "bytes_saved": self.bytes_saved,
+            "files": {name: {"hits": h, "misses": m} for name, (h, m) in self.per_file.items()},
+        }
+
+
+read_cache = JsonReadCache()
+
+
+# --- BATCHED WRITES ---
+class WriteBatch:
+    """
+    Unit of work opened by DataManager.batch(). While it is open, every store written by
+    this thread (through any DataManager instance) is staged in memory and read back from
+    there; on exit each touched store is written exactly once: full-file stores get one
+    atomic rewrite, journaled stores one append with all their records.
+
+    Stores are not locked for the whole batch (that would stall every reader for as long
+    as the batch is open), only while each one is flushed. Journaled records are simply
+    appended to whatever is on disk then; a full-file store that another writer changed
+    in the meantime is overwritten with a warning, so keep read-modify-write sequences
+    that must not lose concurrent updates (park_job, add_answer, ...) out of batches.
+    """
+    def __init__(self):
+        self.depth = 0
+        self.staged = {}     # path -> frozen view of the full-file store as it will be written
+        self.bases = {}      # path -> store signature when the batch first touched it
+        self.journaled = {}  # path -> {"view": frozen view, "records": [...], "rewrite": bool}
+        self.stats = {"batch_reads": 0, "store_reads": 0, "staged_writes": 0, "journal_records": 0,
+                      "files_written": 0, "journal_appends": 0}
+
+    def touched(self):
+        return set(self.staged) | set(self.journaled)
+
+
+_batches = threading.local()
+
+
+def current_batch():
+    """The WriteBatch open in this thread, if any."""
+    return getattr(_batches, "batch", None)
+
 
 class DataManager:
+    def __new__(cls, *args, **kwargs):
+        # STORAGE_BACKEND=sqlite swaps in the SQLite-backed implementation (same API)
+        if cls is DataManager and os.getenv("STORAGE_BACKEND", "json").lower() == "sqlite":
+            from job_hunter.sqlite_store import SQLiteDataManager
+            cls = SQLiteDataManager
+        return super().__new__(cls)
+
     def __init__(self):
+        # Append-only journal for the analysis cache and applied jobs (STORAGE_JOURNAL=off to disable)
+        self.journal_mode = os.getenv("STORAGE_JOURNAL", "on").lower() not in ("0", "off", "false", "no")
         self._ensure_files()
 
+    def _load_json(self, path, default, fresh=False, postprocess=None):
+        """
+        Loads a JSON store. By default returns a read-only view served from the shared
+        read cache; fresh=True parses the file again and returns a mutable object
+        (used by the save/delete methods that modify what they load).
+        """
+        batch = current_batch()
+        if batch:
+            view = batch.staged.get(os.path.abspath(path))
+            if view is not None:
+                batch.stats["batch_reads"] += 1
+                return thaw(view) if fresh else view
+            batch.bases.setdefault(os.path.abspath(path), self._store_signature(path))
+            batch.stats["store_reads"] += 1
+        try:
+            if fresh:
+                data = read_json(path)
+                return postprocess(data) if postprocess else data
+            return read_cache.get(path, postprocess, loader=lambda: read_json(path))
+        except:
+            return default() if callable(default) else default
+
+    def _write_json(self, path, data):
+        """Atomic replace under the file's write lock; readers never see a torn file."""
+        data = blob_store.externalize(data)  # long texts go to the blob store, records keep references
+        batch = current_batch()
+        if batch:
+            batch.bases.setdefault(os.path.abspath(path), self._store_signature(path))
+            batch.staged[os.path.abspath(path)] = freeze(data)
+            batch.stats["staged_writes"] += 1
+            return
+        with write_lock(path):
+            atomic_write_json(path, data, pretty=not _is_compact_store(path))
+            read_cache.invalidate(path)
+
+    def _load_journaled(self, path, fresh=False):
+        """Loads a journaled dict store: snapshot + replayed journal."""
+        batch = current_batch()
+        if batch:
+            entry = batch.journaled.get(os.path.abspath(path))
+            if entry:
+                batch.stats["batch_reads"] += 1
+                return thaw(entry["view"]) if fresh else entry["view"]
+            batch.stats["store_reads"] += 1
+
+        journal = JsonJournal(path)
+
+        def load():
+            with read_lock(path):
+                return journal.load()
+        try:
+            if fresh:
+                return load()
+            return read_cache.get(path, loader=load, extra_paths=(journal.journal_path,))
+        except:
+            return {}
+
+    def _iter_store(self, path, journaled=False):
+        """
+        Streams a store's records (list stores) or (key, value) pairs (journaled stores).
+        Served from the batch or the read cache when the store is already in memory;
+        otherwise the file is parsed one record at a time and nothing is cached.
+        """
+        batch = current_batch()
+        if batch and os.path.abspath(path) in batch.touched():
+            view = self._load_journaled(path) if journaled else self._load_json(path, list)
+            yield from (view.items() if journaled else view)
+            return
+
+        journal = JsonJournal(path)
+        try:
+            view = read_cache.peek(path, (journal.journal_path,) if journaled else ())
+        except OSError:
+            view = None
+        if view is not None:
+            yield from (view.items() if journaled else view)
+            return
+
+        with read_lock(path):
+            # The open handle keeps this snapshot even if the store is replaced meanwhile
+            try:
+                f = open(path, "r", encoding="utf-8")
+            except OSError:
+                f = None
+            records = list(journal.records()) if journaled else None
+        try:
+            if journaled:
+                yield from journal.iter_items(iter_object(f) if f else (), records)
+            elif f:
+                yield from iter_array(f)
+        except ValueError as e:
+            logger.warning(f"Stopped streaming {path}: {e}")
+        finally:
+            if f:
+                f.close()
+
+    def _journal_write(self, path, op, key, value=None, move_to_end=False):
+        """
+        Records one set/del on a journaled store. In journal mode this appends a single line
+        (cost independent of store size) and patches the cached view; otherwise the whole
+        store is rewritten as before.
+        """
+        journal = JsonJournal(path)
+        value = blob_store.externalize(value)
+        record = {"op": op, "key": key, "value": value, "last": move_to_end}
+
+        batch = current_batch()
+        if batch:
+            entry = self._batch_journal_entry(batch, path)
+            entry["view"] = apply_frozen(entry["view"], record)
+            entry["records"].append(record)
+            entry["rewrite"] = entry["rewrite"] or not self.journal_mode
+            batch.stats["journal_records"] += 1
+            sig = self._store_signature(path, (journal.journal_path,))
+            store_key_indexes.patch(os.path.abspath(path), "store", sig, sig, lambda index: index.apply(record))
+            job_columns_cache.invalidate(os.path.abspath(path))
+            job_key_indexes.patch(os.path.abspath(path), "store", sig, sig, lambda index: index.apply(record))
+            return
+
+        with write_lock(path):
+            if not self.journal_mode:
+                data = JsonJournal.apply(journal.load(), record)
+                self._rewrite_journaled(path, data)
+                return
+
+            try:
+                before = read_cache.signature(path, (journal.journal_path,))
+            except OSError:
+                before = None
+            size_before = journal.journal_size()
+            written = journal.append(op, key, value, move_to_end)
+            if journal.journal_size() != size_before + written:
+                before = None  # Journal changed underneath us; let the next read replay
+            try:
+                after = read_cache.signature(path, (journal.journal_path,))
+            except OSError:
+                after = None
+            read_cache.apply(path, before, after, lambda view: apply_frozen(view, record))
+            store_key_indexes.patch(os.path.abspath(path), "store", before, after, lambda index: index.apply(record))
+            job_columns_cache.patch(os.path.abspath(path), "store", before, after, lambda columns: columns.apply(record))
+            job_key_indexes.patch(os.path.abspath(path), "store", before, after, lambda index: index.apply(record))
+
+            if journal.needs_compaction():
+                self._rewrite_journaled(path, journal.load())
+
+    def _rewrite_journaled(self, path, data):
+        """Writes a full snapshot of a journaled store and empties its journal."""
+        batch = current_batch()
+        if batch:
+            entry = self._batch_journal_entry(batch, path)
+            entry.update(view=freeze(data), records=[], rewrite=True)
+            batch.stats["staged_writes"] += 1
+            return
+        with write_lock(path):
+            JsonJournal(path).compact(data, write_snapshot=self._write_json)
+            read_cache.invalidate(path)
+
+    def read_cache_stats(self):
+        """Hit/miss counters of the shared read cache (see JsonReadCache.stats)."""
+        return read_cache.stats()
+
+    # --- BATCH (unit of work) ---
+    @contextmanager
+    def batch(self):
+        """
+        with db.batch() as b: ...
+        Coalesces all store writes of this thread into one write per touched store at exit
+        (see WriteBatch); b.stats holds the batch's I/O counters. Nested batches join the
+        outer one. If the block raises, staged changes are discarded.
+        """
+        batch = current_batch()
+        if batch is None:
+            batch = _batches.batch = WriteBatch()
+        batch.depth += 1
+        try:
+            yield batch
+        except BaseException:
+            if batch.depth == 1:
+                self._end_batch(batch)
+            raise
+        else:
+            if batch.depth == 1:
+                flushed = False
+                try:
+                    self._flush_batch(batch)
+                    flushed = True
+                finally:
+                    self._end_batch(batch, flushed)
+        finally:
+            batch.depth -= 1
+
+    def _batch_journal_entry(self, batch, path):
+        key = os.path.abspath(path)
+        entry = batch.journaled.get(key)
+        if entry is None:
+            entry = batch.journaled[key] = {"view": self._load_journaled(path), "records": [], "rewrite": False}
+        return entry
+
+    def _end_batch(self, batch, flushed=False):
+        _batches.batch = None
+        if not flushed:
+            # Indexes were patched with staged changes that never reached the disk
+            touched = batch.touched()
+            for path in touched:
+                store_key_indexes.invalidate(path)
+                job_key_indexes.invalidate(path)
+            if touched & {os.path.abspath(APPLIED_FILE), os.path.abspath(PARKED_FILE)}:
+                identity_cache.invalidate(os.path.abspath(DATA_DIR))
+            if touched & {os.path.abspath(APPLIED_FILE), os.path.abspath(SCOUTED_FILE)} and os.path.exists(SEARCH_INDEX_FILE):
+                search_index_for(SEARCH_INDEX_FILE).invalidate()
+        elif batch.stats["files_written"] or batch.stats["journal_appends"]:
+            logger.debug(f"DataManager batch flushed: {batch.stats}")
+
+    def _flush_batch(self, batch):
+        _batches.batch = None  # flush writes go straight to disk
+        identity_parts = {os.path.abspath(APPLIED_FILE): "applied", os.path.abspath(PARKED_FILE): "parked"}
+        search_parts = {os.path.abspath(APPLIED_FILE): "applied", os.path.abspath(SCOUTED_FILE): "scouted"}
+        for path in list(batch.staged) + list(batch.journaled):
+            with write_lock(path):
+                identity_before = self._identity_signatures()
+                search_before = self._search_signatures()
+                keys_before = self._store_signature(path, (journal_path_for(path),))
+                if path in batch.staged:
+                    if self._store_signature(path) != batch.bases.get(path):
+                        logger.warning(f"Batch overwrites a concurrent change to {os.path.basename(path)}")
+                    self._write_json(path, batch.staged[path])
+                    batch.stats["files_written"] += 1
+                else:
+                    self._flush_journaled(path, batch.journaled[path], batch.stats)
+
+                # The indexes already hold the staged changes; re-stamp them for the new signatures
+                if path in identity_parts:
+                    part = identity_parts[path]
+                    self._patch_identity(part, identity_before[part], lambda index: None)
+                if path in search_parts:
+                    part = search_parts[path]
+                    self._patch_search(part, search_before[part], lambda index: None)
+                if path in batch.journaled:
+                    keys_after = self._store_signature(path, (journal_path_for(path),))
+                    store_key_indexes.patch(path, "store", keys_before, keys_after, lambda index: None)
+                    job_key_indexes.patch(path, "store", keys_before, keys_after, lambda index: None)
+        return batch.stats
+
+    def _flush_journaled(self, path, entry, stats):
+        if entry["rewrite"]:
+            self._rewrite_journaled(path, entry["view"])
+            stats["files_written"] += 1
+        elif entry["records"]:
+            journal = JsonJournal(path)
+            journal.append_records(entry["records"])
+            read_cache.invalidate(path)
+            stats["journal_appends"] += 1
+            if journal.needs_compaction():
+                self._rewrite_journaled(path, journal.load())
+
+    # --- NEAR-DUPLICATES (same posting on several platforms, see near_duplicates.py) ---
+    def near_duplicate_index(self):
+        """NearDuplicateIndex over the scouted jobs; patched by save_scouted_jobs, rebuilt after other writes."""
+        return near_duplicate_cache.get(os.path.abspath(SCOUTED_FILE),
+                                        {"scouted": self._store_signature(SCOUTED_FILE)},
+                                        lambda: NearDuplicateIndex.build(self.load_scouted(), self._canonical_id))
+
+    def _canonical_id(self, job):
+        return job.get('duplicate_of') or self.generate_job_id(job.get('title'), job.get('company'))
+
+    def _link_near_duplicate(self, job, *indexes):
+        """
+        Links job to the first matching posting in indexes: sets duplicate_of (unless it is
+        the same job id) and borrows the scraped description so it need not be fetched again.
+        """
+        if job.get('duplicate_of'):
+            return None
+        for index in indexes:
+            entry = index.find(job)
+            if entry:
+                break
+        else:
+            return None
+        if entry.job_id != self.generate_job_id(job.get('title'), job.get('company')):
+            job['duplicate_of'] = entry.job_id
+        if entry.description and not job.get('rich_description'):
+            job['rich_description'] = entry.description
+            if entry.language:
+                job['language'] = entry.language
+        return entry
+
+    def link_near_duplicates(self, jobs):
+        """
+        Links freshly scouted jobs (before deep scraping) to known postings, and to earlier
+        jobs of the same list. Returns the number of jobs that were linked.
+        """
+        known = self.near_duplicate_index()
+        new = NearDuplicateIndex()
+        linked = 0
+        for job in jobs:
+            if self._link_near_duplicate(job, known, new):
+                linked += 1
+            new.add(job, self._canonical_id(job))
+        return linked
+
+    # --- IDENTITY INDEX (applied/parked) ---
+    def _store_signature(self, path, extra_paths=()):
+        try:
+            return read_cache.signature(path, extra_paths)
+        except OSError:
+            return None
+
+    def _identity_signatures(self):
+        return {"applied": self._store_signature(APPLIED_FILE, (journal_path_for(APPLIED_FILE),)),
+                "parked": self._store_signature(PARKED_FILE)}
+
+    def identity_index(self):
+        """Which jobs are applied/parked (see IdentityIndex); rebuilt only when a store changed behind our back."""
+        return identity_cache.get(os.path.abspath(DATA_DIR), self._identity_signatures(),
+                                  lambda: IdentityIndex.build(self.load_applied(), self.load_parked()))
+
+    def _patch_identity(self, part, before_sig, fn):
+        """Called under the store's write lock right after our own write to `part`."""
+        identity_cache.patch(os.path.abspath(DATA_DIR), part, before_sig, self._identity_signatures()[part], fn)
+
+    # --- FULL-TEXT SEARCH (scouted/applied) ---
+    def _search_signatures(self):
+        return {"scouted": self._store_signature(SCOUTED_FILE),
+                "applied": self._store_signature(APPLIED_FILE, (journal_path_for(APPLIED_FILE),))}
+
+    def _search_docs(self):
+        for job in self.iter_scouted(SEARCH_FIELDS):
+            key = job_key_of(job)
+            if key:
+                yield SCOUTED, key, search_text(job)
+        for job_id, record in self.iter_applied(("job_details",)):
+            yield APPLIED, job_id, search_text(record.get("job_details") or {})
+
+    def _search_index(self):
+        """SearchIndex over the scouted and applied job texts; rebuilt only when a store changed behind our back."""
+        return search_index_for(SEARCH_INDEX_FILE).ensure(self._search_signatures(), self._search_docs)
+
+    def _patch_search(self, part, before_sig, fn):
+        """Called under the store's write lock right after our own write to `part`."""
+        if os.path.exists(SEARCH_INDEX_FILE):
+            search_index_for(SEARCH_INDEX_FILE).patch(part, before_sig, self._search_signatures()[part], fn)
+
+    def search_jobs(self, query, kinds=(SCOUTED, APPLIED), limit=50):
+        """
+        Ranked full-text search over titles, companies and descriptions (see SearchIndex):
+        'python "data platform" -java'. Returns (kind, id, score) best first; scouted jobs
+        are identified by job key, applied ones by job id. Empty without SQLite FTS5.
+        """
+        if not fts5_available():
+            logger.warning("Job search needs SQLite with FTS5")
+            return []
+        return self._search_index().search(query, kinds, limit)
+
+    def _store_keys(self, path):
+        """SortedKeyIndex over a journaled store's keys, patched by _journal_write."""
+        return store_key_indexes.get(os.path.abspath(path),
+                                     {"store": self._store_signature(path, (journal_path_for(path),))},
+                                     lambda: SortedKeyIndex(self._load_journaled(path).keys()))
+
+    # --- COLUMNAR SNAPSHOTS (dashboards) ---
+    def job_columns(self, kind="applied"):
+        """
+        Normalized columns of the scouted or applied jobs as numpy arrays (see job_columns.py):
+        platform, language, found_job, created_at, plus status and scores for applied jobs.
+        Patched by our own writes and kept in data/columns/, so a dashboard rerun does not
+        touch the records. Treat the arrays as read-only.
+        """
+        if kind == "scouted":
+            path, columns, extra = SCOUTED_FILE, SCOUTED_COLUMNS, ()
+
+            def rows():
+                seen = set()
+                for i, job in enumerate(self.iter_scouted(SCOUTED_FIELDS)):
+                    key = scouted_key(job, i)
+                    key = key if key not in seen else f"{key}#{i}"
+                    seen.add(key)
+                    yield key, scouted_row(job)
+        else:
+            path, columns, extra = APPLIED_FILE, APPLIED_COLUMNS, (journal_path_for(APPLIED_FILE),)
+
+            def rows():
+                for job_id, record in self.iter_applied(APPLIED_FIELDS):
+                    yield job_id, applied_row(record)
+
+        if current_batch():
+            # Staged changes are not on disk yet: neither cache nor save them under the disk signature
+            return JobColumns.build(columns, rows()).arrays()
+        signature = self._store_signature(path, extra)
+        snapshot_path = columns_path_for(path, COLUMNS_DIR)
+        snapshot = job_columns_cache.get(
+            os.path.abspath(path), {"store": signature},
+            lambda: JobColumns.load(snapshot_path, columns, signature) or JobColumns.build(columns, rows()))
+        if signature is not None and snapshot.saved_signature != signature:
+            try:
+                snapshot.save(snapshot_path, signature)
+            except Exception as e:
+                logger.error(f"Could not save {snapshot_path}: {e}")
+        return snapshot.arrays()
+
     def _ensure_files(self):
         if not os.path.exists(DATA_DIR):
             os.makedirs(DATA_DIR)
         
         # Scouted: LIST of job dicts
         if not os.path.exists(SCOUTED_FILE):
-            with open(SCOUTED_FILE, "w", encoding="utf-8") as f: json.dump([], f)
+            self._write_json(SCOUTED_FILE, [])
             
         # Applied: DICT keyed by job_id
         if not os.path.exists(APPLIED_FILE):
-            with open(APPLIED_FILE, "w", encoding="utf-8") as f: json.dump({}, f)
+            self._write_json(APPLIED_FILE, {})
             
         if not os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, "w", encoding="utf-8") as f: json.dump({}, f)
+            self._write_json(CACHE_FILE, {})
 
         # Parked: LIST of parked job IDs/Metadata
         if not os.path.exists(PARKED_FILE):
-            with open(PARKED_FILE, "w", encoding="utf-8") as f: json.dump([], f)
+            self._write_json(PARKED_FILE, [])
 
         # Blacklist: DICT
         if not os.path.exists(BLACKLIST_FILE):
-             with open(BLACKLIST_FILE, "w", encoding="utf-8") as f: 
-                 json.dump({"companies": [], "titles": []}, f)
+            self._write_json(BLACKLIST_FILE, {"companies": [], "titles": []})
 
         # Messaged Contacts: LIST
         if not os.path.exists(MESSAGED_CONTACTS_FILE):
-            with open(MESSAGED_CONTACTS_FILE, "w", encoding="utf-8") as f:
-                json.dump([], f)
+            self._write_json(MESSAGED_CONTACTS_FILE, [])
 
     # --- SCOUTED JOBS ---
-    def load_scouted(self):
-        try:
-            with open(SCOUTED_FILE, "r", encoding="utf-8") as f: return json.load(f)
-        except: return []
+    def load_scouted(self, fresh=False):
+        return self._load_json(SCOUTED_FILE, list, fresh)
+
+    def iter_scouted(self, fields=None):
+        """
+        Yields scouted jobs one at a time, reduced to `fields` if given (e.g. ("link",)).
+        Memory stays bounded by one record when the store is not already cached, so use
+        this instead of load_scouted for counts and lookups. Treat records as read-only.
+        """
+        for job in self._iter_store(SCOUTED_FILE):
+            yield project(job, fields)
 
     def save_scouted_jobs(self, jobs_list, append=False):
         """
@@ -58,187 +721,145 @@ class DataManager:
         If append is True, adds to existing.
         If append is False, OVERWRITES (fresh search).
         """
-        # --- FILTER: Remove Already Applied Jobs ---
-        applied = self.load_applied()
-        applied_ids = set(applied.keys())
-        applied_links = set()
-        for k, v in applied.items():
-             details = v.get('job_details', {})
-             # Collect various link keys just in case
-             lnk = details.get('Web Address') or details.get('link') or details.get('url')
-             if lnk: applied_links.add(lnk)
-             # Also build title-company base IDs (without resume suffix)
-             # so scouted jobs match even when applied key has resume name
-             a_title = details.get('title') or details.get('Job Title', '')
-             a_company = details.get('company') or details.get('Company', '')
-             if a_title and a_company:
-                 # Strip newline-duplicated titles (e.g. "Title\nTitle")
-                 a_title_clean = a_title.split('\n')[0].strip()
-                 base_id = f"{a_title_clean}-{a_company.strip()}"
-                 applied_ids.add(base_id)
-
-        filtered_list = []
-
-        # --- LOAD PARKED JOBS TO IGNORE ---
-        parked = self.load_parked()
-        parked_ids = set()
-        parked_links = set()
-
-        for p in parked:
-            # Reconstruct IDs or use saved ones
-            p_id = p.get('id')
-            if p_id: parked_ids.add(p_id)
-            if p.get('link'): parked_links.add(p.get('link'))
-            # Also support Title-Company matching from parked entries
-            if p.get('title') and p.get('company'):
-                parked_ids.add(f"{p['title']}-{p['company']}")
-
-        # --- LOAD BLACKLIST & SAFE WORDS ---
-        blacklist = self.load_blacklist()
-        bl_companies = [c.lower() for c in blacklist.get("companies", []) if c]
-        bl_titles = [t.lower() for t in blacklist.get("titles", []) if t]
-        safe_phrases = [s.lower() for s in blacklist.get("safe_phrases", []) if s]
-        # ----------------------
-
-        # STEP 1: SEGREGATE (Potential Survivors vs Blacklisted Candidates)
-        potential_survivors = []
-        blacklisted_candidates = [] # Temp cache as requested
+        with write_lock(SCOUTED_FILE):
+            jobs_list = self._filter_new_jobs(jobs_list)
+            for job in jobs_list:
+                self._stamp_job_key(job)
 
-        for job in jobs_list:
-             j_title = job.get('title', 'Unknown').lower()
-             j_company = job.get('company', 'Unknown').lower()
-             
-             # Check Company Blacklist first (always drops? User didn't specify safe for company, but implied safe for title)
-             # Let's assume Safe applies to Title primarily.
-             is_bad_company = False
-             for bl_c in bl_companies:
-                  if bl_c in j_company: 
-                      is_bad_company = True
-                      break
-             
-             if is_bad_company:
-                 # Company ban is usually absolute? User said "scraping should drop jobs from those companies".
-                 # So we drop them entirely, usually no rescue for bad company.
-                 continue
-
-             # Check Title Blacklist
-             is_bad_title = False
-             for bl_t in bl_titles:
-                 if bl_t in j_title:
-                     is_bad_title = True
-                     break
-             
-             if is_bad_title:
-                 blacklisted_candidates.append(job)
-             else:
-                 potential_survivors.append(job)
-
-        # STEP 2: RESCUE MISSION (Safe Phrases)
-        rescued_jobs = []
-        if safe_phrases:
-            for job in blacklisted_candidates:
-                j_title = job.get('title', '').lower()
-                is_safe = False
-                for safe in safe_phrases:
-                    # Check if safe word exists in title
-                    if safe in j_title:
-                        is_safe = True
-                        break
-                
-                if is_safe:
-                    rescued_jobs.append(job)
-        
-        # Merge Survivors and Rescued
-        final_candidates = potential_survivors + rescued_jobs
+            if append:
+                before = self._store_signature(SCOUTED_FILE)
+                added, updated = [], []
+                final_data = self._merge_scouted(self.load_scouted(fresh=True), jobs_list, added, updated)
+            else:
+                final_data = jobs_list
+
+            self._write_json(SCOUTED_FILE, final_data)
+            if append:
+                def index_added(index):
+                    for job in added:
+                        index.add(job, self._canonical_id(job))
+                after = self._store_signature(SCOUTED_FILE)
+                near_duplicate_cache.patch(os.path.abspath(SCOUTED_FILE), "scouted", before, after, index_added)
+                first = len(final_data) - len(added)
+                changed = [(scouted_key(job, first + i), scouted_row(job)) for i, job in enumerate(added)]
+                changed += [(scouted_key(job, None), scouted_row(job)) for job in updated]
+                job_columns_cache.patch(os.path.abspath(SCOUTED_FILE), "store", before, after,
+                                        lambda columns: columns.upsert(changed))
+
+                def index_texts(index):
+                    for job in added + updated:
+                        key = job_key_of(job)
+                        if key:
+                            index.set(SCOUTED, key, search_text(job))
+                self._patch_search("scouted", before, index_texts)
+            return final_data
+
+    def _filter_new_jobs(self, jobs_list):
+        """Drops blacklisted (unless rescued by a safe phrase), applied and parked jobs."""
+        index = self.identity_index()
+
+        # --- BLACKLIST & SAFE WORDS (compiled once per blacklist version) ---
+        decisions = matcher_for(self.load_blacklist()).classify(jobs_list)
+
+        # Survivors first, then jobs rescued from the title blacklist by a safe phrase
+        final_candidates = [job for job, d in zip(jobs_list, decisions) if d == KEEP]
+        final_candidates += [job for job, d in zip(jobs_list, decisions) if d == RESCUE]
 
         # STEP 3: FINAL APPLIED/PARKED CHECK
-        filtered_list = []
-        for job in final_candidates:
-             j_title = job.get('title', 'Unknown')
-             j_company = job.get('company', 'Unknown')
-             jid = f"{j_title}-{j_company}" # Normalization happens in app logic mostly, but here we construct ID
-             j_link = job.get('link')
-
-             if jid in applied_ids: continue
-             if j_link and j_link in applied_links: continue
-             
-             if jid in parked_ids: continue
-             if j_link and j_link in parked_links: continue
-             
-             filtered_list.append(job)
-             
-        jobs_list = filtered_list  
-        # -------------------------------------------
-
-        if append:
-            current = self.load_scouted()
-            
-            # --- DEDUPLICATION & UPDATE STRATEGY ---
-            link_to_job = {j.get('link'): j for j in current if j.get('link')}
-            comp_to_job = {(j.get('title', '').strip().lower(), j.get('company', '').strip().lower()): j
-                           for j in current if j.get('title') and j.get('company')}
-            
-            for job in jobs_list:
-                link = job.get('link')
-                t_new = job.get('title', '').strip().lower()
-                c_new = job.get('company', '').strip().lower()
-                composite = (t_new, c_new) if (t_new and c_new) else None
-
-                existing_job = None
-                if link and link in link_to_job:
-                    existing_job = link_to_job[link]
-                elif composite and composite in comp_to_job:
-                    existing_job = comp_to_job[composite]
-
-                if existing_job:
-                    # Update existing record with new non-empty data
-                    for key, value in job.items():
-                        if value and value not in ["Unknown", "None", None]:
-                            if key in ["rich_description", "language", "is_easy_apply"]:
-                                if key == "rich_description":
-                                    if len(str(value)) > len(str(existing_job.get(key, ""))):
-                                        existing_job[key] = value
-                                else:
-                                    existing_job[key] = value
-                            elif not existing_job.get(key) or existing_job.get(key) == "Unknown":
-                                existing_job[key] = value
-                    continue
-                
-                # If unique, add it
-                current.append(job)
-                if link: link_to_job[link] = job
-                if composite: comp_to_job[composite] = job
+        return [job for job in final_candidates if not index.is_known(job)]
 
-            final_data = current
-        else:
-            final_data = jobs_list
+    def _merge_scouted(self, current, jobs_list, added=None, updated=None):
+        """
+        Merges new jobs into the current scouted list, updating duplicates in place.
+        Unique jobs that are near-duplicates of a known posting get linked to it (duplicate_of).
+        added/updated, if given, collect the appended and the updated records.
+        """
+        # --- DEDUPLICATION & UPDATE STRATEGY ---
+        link_to_job = {j.get('link'): j for j in current if j.get('link')}
+        comp_to_job = {(j.get('title', '').strip().lower(), j.get('company', '').strip().lower()): j
+                       for j in current if j.get('title') and j.get('company')}
+        known = self.near_duplicate_index()
+        new = NearDuplicateIndex()
+
+        for job in jobs_list:
+            existing_job = self._find_scouted_duplicate(job, link_to_job, comp_to_job)
+            if existing_job:
+                self._update_scouted_record(existing_job, job)
+                if not existing_job.get('job_key'):
+                    self._stamp_job_key(existing_job)
+                if updated is not None:
+                    updated.append(existing_job)
+                continue
+
+            # If unique, add it
+            self._link_near_duplicate(job, known, new)
+            new.add(job, self._canonical_id(job))
+            if added is not None:
+                added.append(job)
+            current.append(job)
+            link = job.get('link')
+            composite = self._composite_key(job)
+            if link: link_to_job[link] = job
+            if composite: comp_to_job[composite] = job
 
-        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
-            json.dump(final_data, f, indent=2, ensure_ascii=False)
-        return final_data
+        return current
+
+    @staticmethod
+    def _composite_key(job):
+        """Lowercased (title, company) pair used for scouted deduplication."""
+        t = job.get('title', '').strip().lower()
+        c = job.get('company', '').strip().lower()
+        return (t, c) if (t and c) else None
+
+    def _find_scouted_duplicate(self, job, link_to_job, comp_to_job):
+        link = job.get('link')
+        composite = self._composite_key(job)
+        if link and link in link_to_job:
+            return link_to_job[link]
+        if composite and composite in comp_to_job:
+            return comp_to_job[composite]
+        return None
+
+    @staticmethod
+    def _update_scouted_record(existing_job, job):
+        """Update existing record with new non-empty data."""
+        for key, value in job.items():
+            if key == "_role_names" and value:
+                # Scouted for another resume as well: the posting keeps the tags of both
+                names = existing_job.get("_role_names") or [existing_job.get("_role_name")]
+                existing_job[key] = [name for name in dict.fromkeys(list(names) + list(value)) if name]
+                continue
+            if value and value not in ["Unknown", "None", None]:
+                if key in ["rich_description", "language", "is_easy_apply"]:
+                    if key == "rich_description":
+                        if text_length(value) > text_length(existing_job.get(key, "")):
+                            existing_job[key] = value
+                    else:
+                        existing_job[key] = value
+                elif not existing_job.get(key) or existing_job.get(key) == "Unknown":
+                    existing_job[key] = value
 
     def delete_scouted_job(self, title, company):
         """
         CASCADE DELETES a job from ALL records (Scouted, Applied, Cache) based on Title and Company.
         """
         # 1. SCOUTED
-        curr = self.load_scouted()
-        target_id = self.generate_job_id(title, company)
+        with write_lock(SCOUTED_FILE):
+            curr = self.load_scouted()
+            target_id = self.generate_job_id(title, company)
         
-        new_list = [
-            x for x in curr 
-            if self.generate_job_id(x.get('title'), x.get('company')) != target_id
-        ]
+            new_list = [
+                x for x in curr 
+                if self.generate_job_id(x.get('title'), x.get('company')) != target_id
+            ]
         
-        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
-            json.dump(new_list, f, indent=2, ensure_ascii=False)
+            self._write_json(SCOUTED_FILE, new_list)
             
-        return new_list
+            return new_list
 
     def clear_scouted_jobs(self):
         """Clears all jobs from scouted_jobs.json."""
-        with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        self._write_json(SCOUTED_FILE, [])
         return []
 
     def archive_applied_jobs(self):
@@ -246,92 +867,87 @@ class DataManager:
         Removes jobs from 'scouted_jobs.json' that are present in 'applied_jobs.json'.
         Returns the number of jobs removed (archived).
         """
-        scouted = self.load_scouted()
-        applied = self.load_applied()
-        
-        # Build a comprehensive set of title-company base IDs from applied jobs
-        applied_base_ids = set()
-        for k, v in applied.items():
-            applied_base_ids.add(k)  # Full key (may include resume suffix)
-            details = v.get('job_details', {})
-            a_title = details.get('title') or details.get('Job Title', '')
-            a_company = details.get('company') or details.get('Company', '')
-            if a_title and a_company:
-                a_title_clean = a_title.split('\n')[0].strip()
-                applied_base_ids.add(f"{a_title_clean}-{a_company.strip()}")
-        
-        original_count = len(scouted)
-        new_scouted = []
-        
-        for job in scouted:
-            j_title = job.get('title', 'Unknown')
-            j_company = job.get('company', 'Unknown')
-            job_id = self.generate_job_id(j_title, j_company)
-            
-            if job_id not in applied_base_ids:
-                new_scouted.append(job)
-                
-        removed_count = original_count - len(new_scouted)
+        with write_lock(SCOUTED_FILE):
+            index = self.identity_index()
+            # Usually nothing is applied yet: find out without loading the whole store
+            identity_fields = ('title', 'company', 'link')
+            if not any(index.is_applied(job) for job in self.iter_scouted(identity_fields)):
+                return 0
+
+            scouted = self.load_scouted()
+            original_count = len(scouted)
+            new_scouted = [job for job in scouted if not index.is_applied(job)]
+
+            removed_count = original_count - len(new_scouted)
         
-        if removed_count > 0:
-            with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
-                json.dump(new_scouted, f, indent=2, ensure_ascii=False)
+            if removed_count > 0:
+                self._write_json(SCOUTED_FILE, new_scouted)
                 
-        return removed_count
+            return removed_count
 
     # --- APPLIED JOBS ---
-    def load_applied(self):
-        try:
-            with open(APPLIED_FILE, "r", encoding="utf-8") as f: return json.load(f)
-        except: return {}
+    def load_applied(self, fresh=False):
+        return self._load_journaled(APPLIED_FILE, fresh)
+
+    def iter_applied(self, fields=None):
+        """(job_id, record) pairs of the applied store, streamed like iter_scouted."""
+        for job_id, record in self._iter_store(APPLIED_FILE, journaled=True):
+            yield job_id, project(record, fields)
 
     def save_applied(self, job_id, job_data=None, analysis_data=None, status="applied"):
-        data = self.load_applied()
-        
         # Merge if exists
-        record = data.get(job_id, {
-            "created_at": datetime.now().isoformat(),
-            "job_details": {},
-            "ai_analysis": {}
-        })
+        with write_lock(APPLIED_FILE):
+            existing = self.load_applied().get(job_id)
+            record = thaw(existing) if existing else {
+                "created_at": datetime.now().isoformat(),
+                "job_details": {},
+                "ai_analysis": {}
+            }
         
-        record["status"] = status
-        record["last_updated"] = datetime.now().isoformat()
+            record["status"] = status
+            record["last_updated"] = datetime.now().isoformat()
         
-        if job_data: record["job_details"] = job_data
-        if analysis_data: record["ai_analysis"] = analysis_data
+            if job_data: record["job_details"] = job_data
+            if analysis_data: record["ai_analysis"] = analysis_data
+            self._stamp_job_key(record, record["job_details"])
         
-        data[job_id] = record
-        with open(APPLIED_FILE, "w", encoding="utf-8") as f: json.dump(data, f, indent=2, ensure_ascii=False)
+            before = self._identity_signatures()["applied"]
+            self._journal_write(APPLIED_FILE, "set", job_id, record)
+            self._patch_identity("applied", before, lambda index: index.set_applied(job_id, record))
+            self._patch_search("applied", before,
+                               lambda index: index.set(APPLIED, job_id, search_text(record["job_details"])))
+            data = self.load_applied()
         
-        import streamlit as st
-        try:
-            if 'applied_jobs' in st.session_state:
-                st.session_state['applied_jobs'] = data
-        except Exception:
-            pass
-            
-        return data
-
-    def delete_applied(self, job_id):
-        data = self.load_applied()
-        if job_id in data:
-            del data[job_id]
-            with open(APPLIED_FILE, "w", encoding="utf-8") as f: json.dump(data, f, indent=2, ensure_ascii=False)
-            
             import streamlit as st
             try:
                 if 'applied_jobs' in st.session_state:
                     st.session_state['applied_jobs'] = data
             except Exception:
                 pass
-        return data
+            
+            return data
+
+    def delete_applied(self, job_id):
+        with write_lock(APPLIED_FILE):
+            data = self.load_applied()
+            if job_id in data:
+                before = self._identity_signatures()["applied"]
+                self._journal_write(APPLIED_FILE, "del", job_id)
+                self._patch_identity("applied", before, lambda index: index.remove_applied(job_id))
+                self._patch_search("applied", before, lambda index: index.discard(APPLIED, job_id))
+                data = self.load_applied()
+            
+                import streamlit as st
+                try:
+                    if 'applied_jobs' in st.session_state:
+                        st.session_state['applied_jobs'] = data
+                except Exception:
+                    pass
+            return data
 
     # --- CACHE (AI Results) ---
-    def load_cache(self):
-        try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f: return json.load(f)
-        except: return {}
+    def load_cache(self, fresh=False):
+        return self._load_journaled(CACHE_FILE, fresh)
 
     def generate_job_id(self, title, company, resume_name=None):
         """Generates a consistent ID for job records and cache keys."""
@@ -344,28 +960,128 @@ class DataManager:
             return f"{base}-{r_name}"
         return base
 
-    def save_cache(self, job_id, results):
-        data = self.load_cache()
+    @staticmethod
+    def _stamp_job_key(record, source=None, field='job_key'):
+        """Sets record[field] to the JobKey of source (default: the record itself). Returns the key."""
+        key = JobKey.of(record if source is None else source)
+        if key:
+            record[field] = str(key)
+        return key
+
+    def save_cache(self, job_id, results, job=None, resume_name=None):
+        """Saves analysis results under job_id; with job (and resume_name) the entry also gets its job key."""
+        if isinstance(results, FrozenDict):
+            results = thaw(results)
         results['_analyzed_at'] = datetime.now().isoformat()
+        if job is not None:
+            self._stamp_job_key(results, job, '_job_key')
+        if resume_name:
+            results['_resume'] = resume_stem(resume_name)
         # Move this key to the END of the dict so it's the most recent
         # (Python 3.7+ dicts maintain insertion order)
-        if job_id in data:
-            del data[job_id]
-        data[job_id] = results
-        with open(CACHE_FILE, "w", encoding="utf-8") as f: json.dump(data, f, indent=2, ensure_ascii=False)
-        return data
+        self._journal_write(CACHE_FILE, "set", job_id, results, move_to_end=True)
+        cache_policy_engine.schedule(self)
+        return self.load_cache()
+
+    def cache_keys_with_prefix(self, prefix):
+        """Analysis cache keys starting with prefix (e.g. a base job id), in cache order."""
+        return self._store_keys(CACHE_FILE).with_prefix(prefix)
+
+    def _cache_key_index(self):
+        """JobKeyIndex over the analysis cache (_job_key of each entry), patched by _journal_write."""
+        return job_key_indexes.get(os.path.abspath(CACHE_FILE),
+                                   {"store": self._store_signature(CACHE_FILE, (journal_path_for(CACHE_FILE),))},
+                                   lambda: JobKeyIndex.build("_job_key", self._iter_store(CACHE_FILE, journaled=True)))
+
+    def cache_keys_for_job(self, job, resume_name=None):
+        """
+        Analysis cache keys of a job (only those for resume_name, if given), in cache order.
+        An exact job key lookup; entries from before job keys (see migrate_job_keys) are
+        still found by their "title-company" prefix.
+        """
+        index = self._cache_key_index()
+        key = job_key_of(job)
+        keys = index.get(key) if key else []
+        if index.unkeyed:
+            base = self.generate_job_id(job.get('title'), job.get('company'))
+            keys += [k for k in self.cache_keys_with_prefix(base) if index.key_of(k) is None]
+        if resume_name:
+            stem = resume_stem(resume_name)
+            cache = self.load_cache()
+            keys = [k for k in keys if k in cache and (cache[k].get('_resume') == stem or k.endswith(f"-{stem}"))]
+        return self._store_keys(CACHE_FILE).in_store_order(set(keys))
+
+    def reuse_duplicate_analysis(self, job, job_id, resume_name=None):
+        """
+        Copies the cached analysis of the posting a near-duplicate job is linked to (same
+        resume) to job_id. Returns the copied results, or None if there is nothing to reuse.
+        """
+        canonical = job.get('duplicate_of')
+        if not canonical:
+            return None
+        canonical_key = f"{canonical}-{os.path.splitext(resume_name)[0]}" if resume_name else canonical
+        results = self.load_cache().get(canonical_key)
+        if not results or "error" in results:
+            return None
+        results = thaw(results)
+        results["duplicate_of"] = canonical
+        self.save_cache(job_id, results, job, resume_name)
+        return results
+
+    # --- CACHE POLICY (TTL for failures, LRU eviction over budget, see cache_policy.py) ---
+    def _referenced_cache_prefixes(self, scouted=True):
+        """Cache key prefixes of jobs still on record: applied ids and parked (and scouted) base ids."""
+        prefixes = {job_id for job_id, _ in self.iter_applied(fields=())}
+        for job in itertools.chain(self.load_parked(), self.iter_scouted(('title', 'company')) if scouted else ()):
+            if job.get('title') and job.get('company'):
+                prefixes.add(self.generate_job_id(job['title'], job['company']))
+        return prefixes
+
+    def _referenced_job_keys(self, scouted=True):
+        """Job keys of jobs still on record (applied, parked and scouted)."""
+        keys = {record.get('job_key') for _, record in self.iter_applied(fields=('job_key',))}
+        for job in itertools.chain(self.load_parked(), self.iter_scouted(('job_key',)) if scouted else ()):
+            keys.add(job.get('job_key'))
+        keys.discard(None)
+        return keys
+
+    def evict_cache_entries(self, stamps):
+        """
+        Deletes cache entries chosen by the cache policy. stamps maps key -> the _analyzed_at
+        seen when the entry was chosen; entries saved again since then are kept.
+        """
+        removed = 0
+        with write_lock(CACHE_FILE):
+            cache = self.load_cache()
+            for key, stamp in stamps.items():
+                if key in cache and cache[key].get('_analyzed_at') == stamp:
+                    self._journal_write(CACHE_FILE, "del", key)
+                    removed += 1
+        return removed
+
+    def enforce_cache_policy(self):
+        """Runs the cache policy now (normally it runs in the background after save_cache)."""
+        return cache_policy_engine.run(self)
+
+    def cache_policy_report(self):
+        """Cumulative evictions of the cache policy in this process (plus the last run)."""
+        return cache_policy_engine.report()
+
+    def note_cache_access(self, *keys):
+        """Marks analyses as just used, for the LRU order of the cache policy."""
+        cache_policy_engine.touch(*keys)
 
-    def delete_cache_for_job(self, title, company):
+    def delete_cache_for_job(self, title, company, job=None):
         """Deletes ALL cache entries for a job (across all resume variations)."""
         base_id = self.generate_job_id(title, company)
-        cache = self.load_cache()
-        keys_to_delete = [k for k in cache if k.startswith(base_id)]
-        if keys_to_delete:
+        with write_lock(CACHE_FILE):
+            if job is not None:
+                keys_to_delete = self.cache_keys_for_job(job)
+            else:
+                keys_to_delete = self.cache_keys_with_prefix(base_id)
             for k in keys_to_delete:
-                del cache[k]
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
-        return len(keys_to_delete)
+                self._journal_write(CACHE_FILE, "del", k)
+            return len(keys_to_delete)
 
     def clean_database(self):
         """Wipes scouted jobs and orphaned cache entries. Keeps only Applied + Parked job data."""
@@ -373,175 +1089,249 @@ class DataManager:
         self.clear_scouted_jobs()
 
         # 2. Build protected cache key prefixes from Applied + Parked
-        protected_prefixes = set()
-        
-        # From Applied
-        applied = self.load_applied()
-        for job_id in applied.keys():
-            protected_prefixes.add(job_id)
-        
-        # From Parked
-        parked = self.load_parked()
-        for p in parked:
-            p_title = p.get('title')
-            p_company = p.get('company')
-            if p_title and p_company:
-                base = self.generate_job_id(p_title, p_company)
-                protected_prefixes.add(base)
+        protected_prefixes = self._referenced_cache_prefixes(scouted=False)
 
         # 3. Filter cache: keep only entries whose key starts with a protected prefix
         cache = self.load_cache()
         original_count = len(cache)
-        cleaned_cache = {}
-        for key, value in cache.items():
-            is_protected = any(key.startswith(prefix) for prefix in protected_prefixes)
-            if is_protected:
-                cleaned_cache[key] = value
-        
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cleaned_cache, f, indent=2, ensure_ascii=False)
+        protected_keys = self._store_keys(CACHE_FILE).with_any_prefix(protected_prefixes)
+        protected_job_keys = self._referenced_job_keys(scouted=False)
+        protected_keys.update(key for key, value in cache.items() if value.get('_job_key') in protected_job_keys)
+        cleaned_cache = {key: value for key, value in cache.items() if key in protected_keys}
+
+        self._rewrite_journaled(CACHE_FILE, cleaned_cache)
 
         # 4. Clean active_resumes.json
         try:
             active = self.load_active_resumes()
-            cleaned_active = {k: v for k, v in active.items() if any(k.startswith(p) for p in protected_prefixes)}
-            with open(os.path.join(DATA_DIR, "active_resumes.json"), "w", encoding="utf-8") as f:
-                json.dump(cleaned_active, f, indent=2, ensure_ascii=False)
+            protected_active = SortedKeyIndex(active.keys()).with_any_prefix(protected_prefixes)
+            cleaned_active = {k: v for k, v in active.items() if k in protected_active}
+            self._write_json(ACTIVE_RESUMES_FILE, cleaned_active)
         except:
             pass
 
         removed_count = original_count - len(cleaned_cache)
-        return {"scouted_cleared": True, "cache_entries_removed": removed_count, "cache_entries_kept": len(cleaned_cache)}
+        blobs_removed = self.gc_blobs()
+        return {"scouted_cleared": True, "cache_entries_removed": removed_count, "cache_entries_kept": len(cleaned_cache),
+                "blobs_removed": blobs_removed}
+
+    # --- BLOBS (long texts stored by content hash, see blob_store.py) ---
+    def _live_blob_refs(self):
+        refs = set()
+        for data in (self.load_scouted(), self.load_applied(), self.load_cache(), self.load_parked()):
+            collect_refs(data, refs)
+        try:
+            collect_refs(load_mission_state(), refs)  # checkpoint plus event journal
+        except:
+            pass
+        collect_refs(load_search_cache(), refs)
+        return refs
+
+    def gc_blobs(self):
+        """Deletes blobs no store references any more. Returns the number removed."""
+        return blob_store.gc(self._live_blob_refs())
+
+    def migrate_blobs(self):
+        """
+        Moves long inline texts of existing stores into the blob store (new writes do this
+        automatically). Returns the store sizes before and after, in bytes.
+        """
+        def sizes():
+            paths = (SCOUTED_FILE, APPLIED_FILE, CACHE_FILE, MISSION_STATE_FILE)
+            return {os.path.basename(p): os.path.getsize(p) for p in paths if os.path.exists(p)}
+
+        before = sizes()
+        with write_lock(SCOUTED_FILE):
+            self._write_json(SCOUTED_FILE, self.load_scouted(fresh=True))
+        for path in (APPLIED_FILE, CACHE_FILE):
+            with write_lock(path):
+                self._rewrite_journaled(path, self._load_journaled(path, fresh=True))
+        if os.path.exists(MISSION_STATE_FILE):
+            with write_lock(MISSION_STATE_FILE):
+                atomic_write_json(MISSION_STATE_FILE, blob_store.externalize(read_json(MISSION_STATE_FILE)),
+                                  pretty=False)
+        return {"before": before, "after": sizes()}
+
+    # --- JOB KEYS (canonical job identity, see job_key.py) ---
+    def migrate_job_keys(self):
+        """
+        Stamps job keys on records written before them (new writes do this automatically):
+        job_key on scouted, applied and parked records, _job_key (and _resume) on analysis
+        cache entries, matched once to their job by the legacy "title-company-resume" key.
+        Returns the number of records keyed per store.
+        """
+        counts = {}
+        legacy = {}  # "title-company" -> job key
+        with write_lock(SCOUTED_FILE):
+            scouted = thaw(self.load_scouted(fresh=True))
+            counts["scouted"] = self._key_records(scouted, legacy)
+            if counts["scouted"]:
+                self._write_json(SCOUTED_FILE, scouted)
+        with write_lock(PARKED_FILE):
+            parked = thaw(self.load_parked(fresh=True))
+            counts["parked"] = self._key_records(parked, legacy)
+            if counts["parked"]:
+                self._write_json(PARKED_FILE, parked)
+        with write_lock(APPLIED_FILE):
+            applied = thaw(self._load_journaled(APPLIED_FILE, fresh=True))
+            counts["applied"] = self._key_records(applied.values(), legacy, details=True)
+            if counts["applied"]:
+                self._rewrite_journaled(APPLIED_FILE, applied)
+        with write_lock(CACHE_FILE):
+            cache = thaw(self._load_journaled(CACHE_FILE, fresh=True))
+            counts["cache"] = self._key_cache_entries(cache, legacy)
+            if counts["cache"]:
+                self._rewrite_journaled(CACHE_FILE, cache)
+        return counts
+
+    def _key_records(self, records, legacy, details=False):
+        """Stamps missing job keys; collects legacy "title-company" ids -> job key for the cache."""
+        keyed = 0
+        for record in records:
+            job = (record.get('job_details') or {}) if details else record
+            if not record.get('job_key') and self._stamp_job_key(record, job):
+                keyed += 1
+            title = job.get('title') or job.get('Job Title')
+            company = job.get('company') or job.get('Company')
+            if record.get('job_key') and title and company:
+                legacy.setdefault(self.generate_job_id(title, company), record['job_key'])
+                legacy.setdefault(self.generate_job_id(str(title).split('\n')[0], company), record['job_key'])
+        return keyed
+
+    @staticmethod
+    def _key_cache_entries(cache, legacy):
+        """Stamps _job_key/_resume on unkeyed cache entries whose key is a legacy id (+ "-resume")."""
+        index = SortedKeyIndex(cache.keys())
+        matches = {}  # cache key -> (length of the matched id, job key); the longest id wins
+        for base, key in legacy.items():
+            for cache_key in index.with_prefix(base):
+                rest = cache_key[len(base):]
+                if (not rest or rest.startswith("-")) and len(base) > matches.get(cache_key, (-1, None))[0]:
+                    matches[cache_key] = (len(base), key)
+        keyed = 0
+        for cache_key, (length, key) in matches.items():
+            entry = cache[cache_key]
+            if isinstance(entry, dict) and not entry.get('_job_key'):
+                entry['_job_key'] = key
+                if len(cache_key) > length:
+                    entry.setdefault('_resume', cache_key[length + 1:])
+                keyed += 1
+        return keyed
 
     def save_active_resume(self, title, company, resume_name):
         """Saves which resume is currently active for a given job (title-company)."""
         base_id = self.generate_job_id(title, company)  # No resume suffix
-        try:
-            with open(os.path.join(DATA_DIR, "active_resumes.json"), "r", encoding="utf-8") as f:
-                mapping = json.load(f)
-        except:
-            mapping = {}
-        mapping[base_id] = resume_name
-        with open(os.path.join(DATA_DIR, "active_resumes.json"), "w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2, ensure_ascii=False)
+        with write_lock(ACTIVE_RESUMES_FILE):
+            mapping = self.load_active_resumes(fresh=True)
+            if mapping.get(base_id) == resume_name:
+                return
+            mapping[base_id] = resume_name
+            self._write_json(ACTIVE_RESUMES_FILE, mapping)
 
-    def load_active_resumes(self):
+    def load_active_resumes(self, fresh=False):
         """Loads the mapping of job base_id -> active resume name."""
-        try:
-            with open(os.path.join(DATA_DIR, "active_resumes.json"), "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return {}
+        return self._load_json(ACTIVE_RESUMES_FILE, dict, fresh)
 
     # --- PARKED JOBS ---
-    def load_parked(self):
-        try:
-            with open(PARKED_FILE, "r", encoding="utf-8") as f: return json.load(f)
-        except: return []
+    def load_parked(self, fresh=False):
+        return self._load_json(PARKED_FILE, list, fresh)
 
     def park_job(self, title, company, job_data=None):
         """
         Moves a job from SCOUTED to PARKED.
         """
         # 1. Add to Parked
-        parked = self.load_parked()
-        target_id = self.generate_job_id(title, company)
-        
-        # Check if already parked
-        exists = any(self.generate_job_id(p.get('title'), p.get('company')) == target_id for p in parked)
-        
-        if not exists:
-            # Construct minimal or full record
-            record = {
-                "id": target_id,
-                "title": title,
-                "company": company,
-                "parked_at": datetime.now().isoformat()
-            }
-            if job_data:
-                record['link'] = job_data.get('link') or job_data.get('Web Address')
-                record['platform'] = job_data.get('platform') or job_data.get('Platform')
-                
-            parked.append(record)
-            with open(PARKED_FILE, "w", encoding="utf-8") as f:
-                json.dump(parked, f, indent=2, ensure_ascii=False)
-        
-        # 2. Remove from Scouted
+        with write_lock(PARKED_FILE):
+            parked = self.load_parked(fresh=True)
+            target_id = self.generate_job_id(title, company)
+    
+            # Check if already parked
+            exists = any(self.generate_job_id(p.get('title'), p.get('company')) == target_id for p in parked)
+    
+            if not exists:
+                # Construct minimal or full record
+                record = {
+                    "id": target_id,
+                    "title": title,
+                    "company": company,
+                    "parked_at": datetime.now().isoformat()
+                }
+                if job_data:
+                    record['link'] = job_data.get('link') or job_data.get('Web Address')
+                    record['platform'] = job_data.get('platform') or job_data.get('Platform')
+                self._stamp_job_key(record)
+            
+                parked.append(record)
+                before = self._identity_signatures()["parked"]
+                self._write_json(PARKED_FILE, parked)
+                self._patch_identity("parked", before, lambda index: index.add_parked(record))
+
+        # 2. Remove from Scouted (outside the parked lock: save_scouted_jobs reads parked under the scouted lock)
         self.delete_scouted_job(title, company)
         return True
 
     # --- BLACKLIST ---
-    def load_blacklist(self):
-        try:
-            with open(BLACKLIST_FILE, "r", encoding="utf-8") as f: 
-                data = json.load(f)
-                if "safe_phrases" not in data: data["safe_phrases"] = []
-                return data
-        except: return {"companies": [], "titles": [], "safe_phrases": []}
+    def load_blacklist(self, fresh=False):
+        def with_safe_phrases(data):
+            if "safe_phrases" not in data: data["safe_phrases"] = []
+            return data
+        return self._load_json(BLACKLIST_FILE, lambda: {"companies": [], "titles": [], "safe_phrases": []},
+                               fresh, postprocess=with_safe_phrases)
 
     def save_blacklist(self, companies, titles, safe_phrases=[]):
         data = {"companies": companies, "titles": titles, "safe_phrases": safe_phrases}
-        with open(BLACKLIST_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._write_json(BLACKLIST_FILE, data)
         return data
 
     # --- RESUME CONFIG ---
     def load_resume_config(self):
+        """
+        Resume entries, each with a lazy "pdf" handle (see ResumeFile) instead of the PDF
+        bytes: nothing is read from disk until a preview or hash actually needs it.
+        """
         config_file = os.path.join(DATA_DIR, "resume_config.json")
         if not os.path.exists(config_file):
             return {}
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
-            # Load PDF bytes for each resume if file exists
+            config = read_json(config_file)
             for name, data in config.items():
                 path = data.get('file_path')
                 if path and os.path.exists(path):
-                    try:
-                        with open(path, "rb") as f:
-                            data['pdf_bytes'] = f.read()
-                    except:
-                        pass
+                    data['pdf'] = resume_file(path)
             return config
         except:
             return {}
 
     def save_resume_config(self, config):
-        # Create a deep copy to avoid modifying the original config in session state
+        # Copy without the in-memory parts (file handles, legacy PDF bytes) so session state is untouched
         import copy
-        clean_config = copy.deepcopy(config)
-        for name, data in clean_config.items():
-            if 'pdf_bytes' in data:
-                del data['pdf_bytes']
+        clean_config = copy.deepcopy({
+            name: {k: v for k, v in data.items() if k not in RESUME_RUNTIME_KEYS}
+            for name, data in config.items()
+        })
 
         config_file = os.path.join(DATA_DIR, "resume_config.json")
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(clean_config, f, indent=2, ensure_ascii=False)
+        self._write_json(config_file, clean_config)
 
     # --- CAREER AUDIT PERSISTENCE ---
+    def audit_logbook(self):
+        return AuditLogbook(AUDIT_DIR, legacy_path=AUDIT_FILE)
+
     def save_audit_report(self, markdown_text):
-        # "Logbook" Mode: Prepend new report to existing history
-        existing = ""
-        if os.path.exists(AUDIT_FILE):
-             try:
-                 with open(AUDIT_FILE, "r", encoding="utf-8") as f:
-                     existing = f.read()
-             except: pass
-        
-        # Add a separator if there's existing content
-        if existing:
-            new_content = markdown_text + "\n\n<br>\n\n---\n\n<br>\n\n" + existing
-        else:
-            new_content = markdown_text
+        # "Logbook" Mode: appended as a new segment entry; readers show it first
+        return self.audit_logbook().append(markdown_text)
 
-        with open(AUDIT_FILE, "w", encoding="utf-8") as f:
-            f.write(new_content)
+    def load_audit_reports(self, limit=5):
+        """The newest audit reports as (timestamp, markdown) pairs, newest first."""
+        try:
+            return self.audit_logbook().latest(limit)
+        except:
+            return []
 
     # --- BOT CONFIG (Question-Answer Mappings) ---
-    def load_bot_config(self):
+    def load_bot_config(self, fresh=False):
         """Load bot configuration including answer mappings and unknown questions."""
-        config_file = os.path.join(DATA_DIR, "bot_config.json")
+        config_file = BOT_CONFIG_FILE
         default_config = {
             "answers": {
                 "years of experience": "3",
@@ -576,109 +1366,73 @@ class DataManager:
         }
         
         if not os.path.exists(config_file):
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(default_config, f, indent=2)
+            self._write_json(config_file, default_config)
             return default_config
         
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return default_config
+        return self._load_json(config_file, default_config, fresh)
     
     def save_bot_config(self, config):
         """Save bot configuration."""
-        config_file = os.path.join(DATA_DIR, "bot_config.json")
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        self._write_json(BOT_CONFIG_FILE, config)
     
     def add_answer(self, question_pattern, answer):
         """Add or update an answer for a question pattern."""
-        config = self.load_bot_config()
-        config["answers"][question_pattern.lower().strip()] = answer
-        # Remove from unknown if it was there
-        q_lower = question_pattern.lower().strip()
-        config["unknown_questions"] = [q for q in config["unknown_questions"] if q.get("question", "").lower() != q_lower]
-        self.save_bot_config(config)
-        return config
+        with write_lock(BOT_CONFIG_FILE):
+            config = self.load_bot_config(fresh=True)
+            config["answers"][question_pattern.lower().strip()] = answer
+            # Remove from unknown if it was there
+            q_lower = question_pattern.lower().strip()
+            config["unknown_questions"] = [q for q in config["unknown_questions"] if q.get("question", "").lower() != q_lower]
+            self.save_bot_config(config)
+            return config
     
     def delete_answer(self, question_pattern):
         """Delete an answer mapping."""
-        config = self.load_bot_config()
-        q_lower = question_pattern.lower().strip()
-        if q_lower in config["answers"]:
-            del config["answers"][q_lower]
-            self.save_bot_config(config)
-        return config
+        with write_lock(BOT_CONFIG_FILE):
+            config = self.load_bot_config(fresh=True)
+            q_lower = question_pattern.lower().strip()
+            if q_lower in config["answers"]:
+                del config["answers"][q_lower]
+                self.save_bot_config(config)
+            return config
     
     def log_unknown_question(self, question_text, job_title="", company=""):
         """Log an unknown question encountered during auto-apply."""
-        config = self.load_bot_config()
+        with write_lock(BOT_CONFIG_FILE):
+            config = self.load_bot_config(fresh=True)
         
-        # Check if already logged
-        q_lower = question_text.lower().strip()
-        for q in config["unknown_questions"]:
-            if q.get("question", "").lower() == q_lower:
-                return config  # Already logged
+            # Check if already logged
+            q_lower = question_text.lower().strip()
+            for q in config["unknown_questions"]:
+                if q.get("question", "").lower() == q_lower:
+                    return config  # Already logged
         
-        # Add new unknown question
-        config["unknown_questions"].append({
-            "question": question_text.strip(),
-            "job_title": job_title,
-            "company": company,
-            "timestamp": datetime.now().isoformat()
-        })
+            # Add new unknown question
+            config["unknown_questions"].append({
+                "question": question_text.strip(),
+                "job_title": job_title,
+                "company": company,
+                "timestamp": datetime.now().isoformat()
+            })
         
-        self.save_bot_config(config)
-        return config
+            self.save_bot_config(config)
+            return config
     
     def clear_unknown_questions(self):
         """Clear all unknown questions."""
-        config = self.load_bot_config()
-        config["unknown_questions"] = []
-        self.save_bot_config(config)
-        return config
+        with write_lock(BOT_CONFIG_FILE):
+            config = self.load_bot_config(fresh=True)
+            config["unknown_questions"] = []
+            self.save_bot_config(config)
+            return config
     
     def get_answer_for_question(self, question_text):
-        """Find the best matching answer for a question with improved matching logic."""
+        """
+        Find the best matching answer for a question: exact match, then substring match,
+        then keyword overlap (see AnswerIndex). The index is rebuilt only when the answers change.
+        """
         config = self.load_bot_config()
-        
-        def normalize(text):
-            # Remove non-alphanumeric chars and extra spaces
-            return re.sub(r'[^\w\s]', '', text.lower()).strip()
-
-        q_norm = normalize(question_text)
-        if not q_norm: return None
-        
-        # 1. Exact match on normalized text
-        for pattern, answer in config["answers"].items():
-            if normalize(pattern) == q_norm:
-                return answer
-
-        # 2. Pattern match (if pattern is a subset of question or vice versa)
-        for pattern, answer in config["answers"].items():
-            p_norm = normalize(pattern)
-            if not p_norm: continue
-            if p_norm in q_norm or q_norm in p_norm:
-                return answer
-
-        # 3. Keyword-based matching (significant overlap)
-        q_words = set(q_norm.split())
-        best_match = None
-        max_overlap = 0
-
-        for pattern, answer in config["answers"].items():
-            p_words = set(normalize(pattern).split())
-            if not p_words: continue
-
-            overlap = len(q_words.intersection(p_words))
-            # Require at least 2 words overlap or 100% of pattern words if pattern is short
-            if overlap > max_overlap:
-                if overlap >= 2 or overlap == len(p_words):
-                    max_overlap = overlap
-                    best_match = answer
-        
-        return best_match
+        return answer_index_for(config.get("answers") or {}).match(question_text)
     
     # ==========================================
     # RESUME TITLE HISTORY
@@ -719,31 +1473,31 @@ class DataManager:
         """
         filepath = self._get_resume_history_file()
         
-        # Load existing
-        if os.path.exists(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
-                history = json.load(f)
-        else:
-            history = {}
+        with write_lock(filepath):
+            # Load existing
+            if os.path.exists(filepath):
+                with open(filepath, "r", encoding="utf-8") as f:
+                    history = json.load(f)
+            else:
+                history = {}
         
-        # Get existing titles for this resume
-        existing = history.get(resume_filename, [])
+            # Get existing titles for this resume
+            existing = history.get(resume_filename, [])
         
-        # Merge: new titles first, then existing, remove duplicates
-        combined = []
-        for t in titles:
-            t_clean = t.strip()
-            if t_clean and t_clean not in combined:
-                combined.append(t_clean)
-        for t in existing:
-            if t not in combined:
-                combined.append(t)
+            # Merge: new titles first, then existing, remove duplicates
+            combined = []
+            for t in titles:
+                t_clean = t.strip()
+                if t_clean and t_clean not in combined:
+                    combined.append(t_clean)
+            for t in existing:
+                if t not in combined:
+                    combined.append(t)
         
-        # Limit to last 50 titles
-        history[resume_filename] = combined[:50]
+            # Limit to last 50 titles
+            history[resume_filename] = combined[:50]
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+            self._write_json(filepath, history)
 
     # --- BROWSER CONFIG ---
     def load_selectors(self):
@@ -760,29 +1514,25 @@ class DataManager:
     def save_selectors(self, config_dict):
         """Saves CSS/XPath selectors to selectors.yaml."""
         filepath = os.path.join(DATA_DIR, "selectors.yaml")
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+        with write_lock(filepath):
+            atomic_write_text(filepath, yaml.dump(config_dict, default_flow_style=False))
 
     # --- MESSAGED CONTACTS ---
-    def load_messaged_contacts(self):
-        try:
-            with open(MESSAGED_CONTACTS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return []
+    def load_messaged_contacts(self, fresh=False):
+        return self._load_json(MESSAGED_CONTACTS_FILE, list, fresh)
 
     def save_messaged_contact(self, name, profile_url=None):
-        contacts = self.load_messaged_contacts()
-        # Avoid duplicates
-        if any(c.get('name') == name for c in contacts):
-            return contacts
+        with write_lock(MESSAGED_CONTACTS_FILE):
+            contacts = self.load_messaged_contacts(fresh=True)
+            # Avoid duplicates
+            if any(c.get('name') == name for c in contacts):
+                return contacts
 
-        contacts.append({
-            "name": name,
-            "profile_url": profile_url,
-            "messaged_at": datetime.now().isoformat()
-        })
+            contacts.append({
+                "name": name,
+                "profile_url": profile_url,
+                "messaged_at": datetime.now().isoformat()
+            })
 
-        with open(MESSAGED_CONTACTS_FILE, "w", encoding="utf-8") as f:
-            json.dump(contacts, f, indent=2, ensure_ascii=False)
-        return contacts
+            self._write_json(MESSAGED_CONTACTS_FILE, contacts)
+            return contacts
@@ -0,0 +1,113 @@
+from collections import Counter
+
+from job_hunter.job_key import JobKey, canonical_link, job_key_of, norm_key  # canonical_link/norm_key used to live here
+from job_hunter.key_index import IndexCache
+
+
+def _with_job_key(keys, key):
+    if key:
+        keys.add(("key", key))
+    return keys
+
+
+def _applied_keys(job_id, record):
+    keys = {("id", job_id)}
+    details = record.get('job_details') or {}
+    _with_job_key(keys, record.get('job_key') or JobKey.of(details))
+    # Collect various link keys just in case
+    link = canonical_link(details.get('Web Address') or details.get('link') or details.get('url'))
+    if link:
+        keys.add(("link", link))
+    a_title = details.get('title') or details.get('Job Title', '')
+    a_company = details.get('company') or details.get('Company', '')
+    if a_title and a_company:
+        # Strip newline-duplicated titles (e.g. "Title\nTitle") so scouted jobs match
+        # even when the applied key has a resume suffix
+        a_title_clean = a_title.split('\n')[0].strip()
+        keys.add(("id", f"{a_title_clean}-{a_company.strip()}"))
+        keys.add(("norm", norm_key(a_title, a_company)))
+    return keys
+
+
+def _parked_keys(record):
+    keys = _with_job_key(set(), job_key_of(record))
+    if record.get('id'):
+        keys.add(("id", record['id']))
+    if record.get('link'):
+        keys.add(("link", canonical_link(record['link'])))
+    if record.get('title') and record.get('company'):
+        keys.add(("id", f"{record['title']}-{record['company']}"))
+        keys.add(("norm", norm_key(record['title'], record['company'])))
+    return keys
+
+
+def job_keys(job):
+    """Identity keys of a scouted job: job key, raw and stripped title-company ids, normalized key, canonical link."""
+    title = job.get('title', 'Unknown')
+    company = job.get('company', 'Unknown')
+    keys = {("id", f"{title}-{company}"),
+            ("id", f"{str(title or 'Unknown').strip()}-{str(company or 'Unknown').strip()}")}
+    _with_job_key(keys, job_key_of(job))
+    nk = norm_key(title, company)
+    if nk:
+        keys.add(("norm", nk))
+    link = canonical_link(job.get('link'))
+    if link:
+        keys.add(("link", link))
+    return keys
+
+
+class IdentityIndex:
+    """
+    Which jobs are already applied to or parked, as sets of identity keys
+    (job keys, job ids, canonical links, normalized title-company keys).
+
+    Built once from the applied/parked stores and then kept current by save_applied,
+    delete_applied and park_job, so filtering scouted jobs costs a few set lookups per
+    job instead of re-deriving everything from the full applied history.
+    """
+    def __init__(self):
+        self._applied = {}  # job_id -> keys it contributed
+        self._applied_keys = Counter()
+        self._parked_keys = Counter()
+
+    @classmethod
+    def build(cls, applied, parked):
+        index = cls()
+        for job_id, record in applied.items():
+            index.set_applied(job_id, record)
+        for record in parked:
+            index.add_parked(record)
+        return index
+
+    def set_applied(self, job_id, record):
+        self.remove_applied(job_id)
+        keys = _applied_keys(job_id, record)
+        self._applied[job_id] = keys
+        self._applied_keys.update(keys)
+        return self
+
+    def remove_applied(self, job_id):
+        keys = self._applied.pop(job_id, ())
+        self._applied_keys.subtract(keys)
+        for key in keys:
+            if self._applied_keys[key] <= 0:
+                del self._applied_keys[key]
+        return self
+
+    def add_parked(self, record):
+        self._parked_keys.update(_parked_keys(record))
+        return self
+
+    def is_applied(self, job):
+        return any(key in self._applied_keys for key in job_keys(job))
+
+    def is_parked(self, job):
+        return any(key in self._parked_keys for key in job_keys(job))
+
+    def is_known(self, job):
+        keys = job_keys(job)
+        return any(key in self._applied_keys or key in self._parked_keys for key in keys)
+
+
+identity_cache = IndexCache()
@@ -0,0 +1,145 @@
+import io
+import json
+import os
+
+import numpy as np
+
+from job_hunter.key_index import IndexCache
+from job_hunter.storage import atomic_write_bytes
+
+# Normalized dashboard columns (besides "key"); scores are float64 with NaN when missing
+SCOUTED_COLUMNS = ("platform", "language", "found_job", "created_at")
+APPLIED_COLUMNS = SCOUTED_COLUMNS + ("status", "fit_score", "ats_score")
+SCORE_COLUMNS = ("fit_score", "ats_score")
+# What the rows are built from (iter_scouted / iter_applied field projection)
+SCOUTED_FIELDS = ("link", "title", "company", "platform", "Platform", "language", "Language",
+                  "Found_job", "found_job", "scraped_at")
+APPLIED_FIELDS = ("job_details", "created_at", "status", "ai_analysis")
+
+
+def _first(record, *names, default="Unknown"):
+    for name in names:
+        value = record.get(name)
+        if value:
+            return str(value)
+    return default
+
+
+def _score(report):
+    try:
+        return float(report.get("score"))
+    except:
+        return float("nan")
+
+
+def scouted_key(job, position):
+    link = job.get("link")
+    if link:
+        return link
+    if job.get("title") and job.get("company"):
+        return f"{job['title'].strip().lower()}|{job['company'].strip().lower()}"
+    return f"#{position}"
+
+
+def scouted_row(job):
+    return (_first(job, "platform", "Platform"), _first(job, "language", "Language"),
+            _first(job, "Found_job", "found_job"), _first(job, "scraped_at", default=""))
+
+
+def applied_row(record):
+    details = record.get("job_details") or {}
+    analysis = record.get("ai_analysis") or {}
+    return (_first(details, "Platform", "platform"), _first(details, "Language", "language"),
+            _first(details, "Found_job", "found_job"), _first(record, "created_at", default=""),
+            _first(record, "status", default=""),
+            _score(analysis.get("fit_report") or {}), _score(analysis.get("ats_report") or {}))
+
+
+class JobColumns:
+    """
+    Columnar snapshot of one job store for dashboards: one numpy array per normalized
+    column, so a rerun reads a few arrays instead of rebuilding frames from raw records.
+
+    Kept per store in job_columns_cache and patched by our own writes (apply for journal
+    records, upsert for scouted appends). save() writes it to data/columns/<store>.npz with
+    the store signature it reflects; load() only accepts a file whose signature matches.
+    """
+    def __init__(self, columns, rows=None, arrays=None):
+        self.columns = columns
+        self._rows = rows          # key -> row tuple, in store order (built on first patch)
+        self._arrays = arrays      # column -> numpy array (built on first read)
+        self.saved_signature = None
+
+    @classmethod
+    def build(cls, columns, keyed_rows):
+        return cls(columns, rows=dict(keyed_rows))
+
+    # --- patches ---
+    def _mutable_rows(self):
+        if self._rows is None:
+            arrays = self._arrays
+            values = [arrays[c].tolist() for c in self.columns]
+            self._rows = dict(zip(arrays["key"].tolist(), zip(*values)))
+        self._arrays = None
+        return self._rows
+
+    def apply(self, record):
+        """Applies one applied-store journal record (see JsonJournal.apply)."""
+        rows = self._mutable_rows()
+        key = record.get("key")
+        if record.get("op") == "set":
+            if record.get("last"):
+                rows.pop(key, None)
+            rows[key] = applied_row(record.get("value") or {})
+        elif record.get("op") == "del":
+            rows.pop(key, None)
+        return self
+
+    def upsert(self, keyed_rows):
+        self._mutable_rows().update(keyed_rows)
+        return self
+
+    # --- reads ---
+    def arrays(self):
+        """column -> numpy array (plus "key"). Treat as read-only: shared until the next patch."""
+        if self._arrays is None:
+            rows = self._rows or {}
+            arrays = {"key": np.array(list(rows), dtype=str)}
+            for i, column in enumerate(self.columns):
+                values = [row[i] for row in rows.values()]
+                arrays[column] = np.array(values, dtype=float if column in SCORE_COLUMNS else str)
+            self._arrays = arrays
+        return self._arrays
+
+    def __len__(self):
+        return len(self._rows) if self._rows is not None else len(self.arrays()["key"])
+
+    # --- persistence ---
+    def save(self, path, signature):
+        buf = io.BytesIO()
+        np.savez(buf, signature=np.array(json.dumps(signature)), **self.arrays())
+        atomic_write_bytes(path, buf.getvalue())
+        self.saved_signature = signature
+
+    @classmethod
+    def load(cls, path, columns, signature):
+        """The snapshot at path if it was saved for exactly this store signature, else None."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["signature"]) != json.dumps(signature):
+                    return None
+                arrays = {name: data[name] for name in ("key",) + columns}
+        except:
+            return None
+        snapshot = cls(columns, arrays=arrays)
+        snapshot.saved_signature = signature
+        return snapshot
+
+
+def columns_path_for(store_path, root):
+    """data/applied_jobs.json -> <root>/applied_jobs.npz"""
+    return os.path.join(root, os.path.splitext(os.path.basename(store_path))[0] + ".npz")
+
+
+# abspath of a job store -> JobColumns
+job_columns_cache = IndexCache()
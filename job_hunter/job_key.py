@@ -0,0 +1,196 @@
+import hashlib
+import os
+import re
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from job_hunter.key_index import IndexCache
+
+# Where platforms keep a posting's id: a path segment or a query parameter
+_PATH_IDS = [
+    re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)"),      # LinkedIn
+    re.compile(r"/stellenangebote--.*?--(\d+)-"),     # StepStone
+    re.compile(r"/jobs/[^/]*?-(\d{5,})(?:$|[/?])"),   # XING and most job boards
+]
+_QUERY_IDS = ("currentJobId", "jk", "vjk", "jobId", "job_id", "jobid")
+
+
+def norm_key(title, company):
+    """Normalized title|company key. Matches the newline/whitespace cleanup used for applied jobs."""
+    t = str(title or "").split('\n')[0].strip().lower()
+    c = str(company or "").strip().lower()
+    if not t or not c:
+        return None
+    return f"{t}|{c}"
+
+
+def canonical_link(link):
+    """Lowercased scheme/host, no fragment or trailing slash. Query strings are kept (job ids live there)."""
+    if not link:
+        return None
+    link = str(link).strip()
+    parts = urlsplit(link)
+    if not parts.scheme or not parts.netloc:
+        return link
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+
+
+def _text(value):
+    # DataFrame rows carry NaN for missing cells
+    return value if isinstance(value, str) else ""
+
+
+def _clean(value):
+    return " ".join(_text(value).split()).lower()
+
+
+def normalize_title(title):
+    return _clean(_text(title).split("\n")[0])
+
+
+def normalize_platform(platform, link=""):
+    """The link's site name ("linkedin" for de.linkedin.com) when there is one, so records
+    without a platform field still agree; else the lowercased platform field."""
+    host = urlsplit(link).netloc
+    if host:
+        labels = host.split(".")
+        return labels[-2] if len(labels) > 1 else host
+    platform = _clean(platform)
+    return "" if platform == "unknown" else platform
+
+
+def link_id(link):
+    """The posting id inside a platform link ("linkedin:4012345678"), else the canonical link, else ""."""
+    link = canonical_link(_text(link)) or ""
+    parts = urlsplit(link)
+    if not parts.netloc:
+        return link
+    site = normalize_platform("", link)
+    query = parse_qs(parts.query)
+    for name in _QUERY_IDS:
+        if query.get(name):
+            return f"{site}:{query[name][0]}"
+    for pattern in _PATH_IDS:
+        match = pattern.search(parts.path)
+        if match:
+            return f"{site}:{match.group(1)}"
+    return link
+
+
+class JobKey(str):
+    """
+    Canonical job identity: 16 hex digits of a 64-bit BLAKE2b hash over the normalized
+    platform, link id, title and company. The normalized fields stay on the instance.
+
+    A JobKey is a str, so it is stored as is in JSON records (job_key on scouted, applied
+    and parked records, _job_key on analysis cache entries) and used as a dict key. Two
+    records of the same posting get the same key whatever their field casing
+    ("Job Title"/"title", "Web Address"/"link") or whitespace, so the stores are joined
+    with exact lookups instead of "title-company" prefix scans.
+    """
+    def __new__(cls, platform="", link="", title="", company=""):
+        fields = (platform, link, title, company)
+        digest = hashlib.blake2b("\x1f".join(fields).encode("utf-8"), digest_size=8).hexdigest()
+        key = super().__new__(cls, digest)
+        key.platform, key.link_id, key.title, key.company = fields
+        return key
+
+    @classmethod
+    def of(cls, job):
+        """Key of a job record (scouted job, applied job_details, parked record). None without title/company or link."""
+        if not job:
+            return None
+        title = normalize_title(job.get("title") or job.get("Job Title"))
+        company = _clean(job.get("company") or job.get("Company"))
+        raw_link = canonical_link(_text(job.get("link") or job.get("Web Address") or job.get("url"))) or ""
+        link = link_id(raw_link)
+        if not (title and company) and not link:
+            return None
+        return cls(normalize_platform(job.get("platform") or job.get("Platform"), raw_link), link, title, company)
+
+    def __reduce__(self):
+        return JobKey, (self.platform, self.link_id, self.title, self.company)
+
+    def fields(self):
+        return {"platform": self.platform, "link_id": self.link_id, "title": self.title, "company": self.company}
+
+
+def job_key_of(record, field="job_key"):
+    """The job key stamped on a record, else computed from its fields (None if it has neither)."""
+    key = record.get(field)
+    return key if isinstance(key, str) and key else JobKey.of(record)
+
+
+def resume_stem(resume_name):
+    """Resume file name without extension, as in job ids and cache keys."""
+    return os.path.splitext(resume_name)[0] if resume_name else None
+
+
+class JobKeyIndex:
+    """
+    job key -> ids of the records carrying it in one store (applied job ids, cache
+    keys, ...), from the key stamped in each record's `field`. Records without a key
+    (written before job keys) are counted in `unkeyed`, so callers know whether a
+    legacy prefix scan is still needed.
+    """
+    def __init__(self, field):
+        self.field = field
+        self._ids = {}    # job key -> {store id: None} (insertion ordered)
+        self._keys = {}   # store id -> job key (None for unkeyed records)
+        self.unkeyed = 0
+
+    @classmethod
+    def build(cls, field, items):
+        index = cls(field)
+        for store_id, record in items:
+            index.set(store_id, record)
+        return index
+
+    def set(self, store_id, record):
+        self.discard(store_id)
+        key = record.get(self.field) if isinstance(record, dict) else None
+        self._keys[store_id] = key
+        if key:
+            self._ids.setdefault(key, {})[store_id] = None
+        else:
+            self.unkeyed += 1
+        return self
+
+    def discard(self, store_id):
+        if store_id not in self._keys:
+            return self
+        key = self._keys.pop(store_id)
+        if key:
+            ids = self._ids.get(key, {})
+            ids.pop(store_id, None)
+            if not ids:
+                self._ids.pop(key, None)
+        else:
+            self.unkeyed -= 1
+        return self
+
+    def apply(self, record):
+        """Applies one journal record (see JsonJournal.apply)."""
+        if record.get("op") == "set":
+            self.set(record.get("key"), record.get("value"))
+        elif record.get("op") == "del":
+            self.discard(record.get("key"))
+        return self
+
+    def get(self, key):
+        return list(self._ids.get(key, ()))
+
+    def key_of(self, store_id):
+        return self._keys.get(store_id)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+
+# abspath of a journaled store -> JobKeyIndex over its records
+job_key_indexes = IndexCache()
+
+
+if __name__ == "__main__":
+    from job_hunter.data_manager import DataManager
+    for store, count in DataManager().migrate_job_keys().items():
+        print(f"{store}: {count} records keyed")
@@ -0,0 +1,191 @@
+import os
+
+from job_hunter import codec
+from job_hunter.storage import atomic_write_bytes, fsync_directory
+
+# Compact once the journal passes either limit (the ratio is relative to the snapshot size)
+JOURNAL_MAX_BYTES = 4 * 1024 * 1024
+JOURNAL_MAX_RATIO = 0.5
+JOURNAL_MIN_BYTES = 256 * 1024
+
+
+def journal_path_for(snapshot_path):
+    """data/analysis_cache.json -> data/analysis_cache.journal.jsonl"""
+    root, _ = os.path.splitext(snapshot_path)
+    return f"{root}.journal.jsonl"
+
+
+class JsonJournal:
+    """
+    Append-only JSONL journal layered over a JSON dict snapshot.
+
+    Each write appends one {"op": "set"|"del", "key": ..., "value": ...} line instead of
+    rewriting the whole snapshot. Reads replay the journal over the snapshot. Once the
+    journal grows past JOURNAL_MAX_BYTES, or past JOURNAL_MAX_RATIO of the snapshot
+    (and at least JOURNAL_MIN_BYTES), compact() folds it back into the snapshot.
+    """
+    def __init__(self, snapshot_path, journal_path=None, max_bytes=JOURNAL_MAX_BYTES,
+                 max_ratio=JOURNAL_MAX_RATIO, min_bytes=JOURNAL_MIN_BYTES):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or journal_path_for(snapshot_path)
+        self.max_bytes = max_bytes
+        self.max_ratio = max_ratio
+        self.min_bytes = min_bytes
+
+    # --- WRITE ---
+    @staticmethod
+    def _line(op, key, value=None, move_to_end=False):
+        record = {"op": op, "key": key}
+        if op == "set":
+            record["value"] = value
+            if move_to_end:
+                record["last"] = True
+        elif value is not None:
+            record["value"] = value  # other record kinds (mission state events) carry values too
+        return codec.dumps(record) + b"\n"
+
+    def _write(self, data):
+        """Appends data; a torn last line (crash mid-append) is ended first so it is not glued to data."""
+        with open(self.journal_path, "a+b") as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+        return len(data)
+
+    def append(self, op, key, value=None, move_to_end=False):
+        """Appends one record. Returns the number of bytes written."""
+        return self._write(self._line(op, key, value, move_to_end))
+
+    def append_records(self, records):
+        """Appends several apply()-style records with a single write. Returns the number of bytes written."""
+        data = b"".join(self._line(r.get("op"), r.get("key"), r.get("value"), r.get("last")) for r in records)
+        return self._write(data) if data else 0
+
+    def set(self, key, value, move_to_end=False):
+        return self.append("set", key, value, move_to_end)
+
+    def delete(self, key):
+        return self.append("del", key)
+
+    # --- READ ---
+    @staticmethod
+    def apply(data, record):
+        """Applies one journal record to a dict. 'set' with "last" moves the key to the end, like save_cache."""
+        key = record.get("key")
+        if record.get("op") == "set":
+            if record.get("last"):
+                data.pop(key, None)
+            data[key] = record.get("value")
+        elif record.get("op") == "del":
+            data.pop(key, None)
+        return data
+
+    def records(self):
+        """The journal's records, in order."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield codec.loads(line)
+                except ValueError:
+                    # Torn trailing write from a crash: everything before it is still valid
+                    continue
+
+    def replay(self, data):
+        for record in self.records():
+            self.apply(data, record)
+        return data
+
+    def iter_items(self, snapshot_items, records=None):
+        """
+        Yields the (key, value) pairs load() would produce, in the same order, from a stream
+        of snapshot items (e.g. json_stream.iter_object) without building the dict. Only the
+        journal (bounded by compaction) is held in memory, folded into an overlay.
+        """
+        seq = 0
+        pending = {}  # key -> [seq, value]: set in place, or appended if not in the snapshot
+        tail = {}     # key -> [seq, value]: (re)inserted at the end
+        removed = set()  # keys no longer at their snapshot position
+        for record in (self.records() if records is None else records):
+            key = record.get("key")
+            seq += 1
+            if record.get("op") == "set":
+                if record.get("last"):
+                    pending.pop(key, None)
+                    tail.pop(key, None)
+                    removed.add(key)
+                    tail[key] = [seq, record.get("value")]
+                elif key in tail:
+                    tail[key][1] = record.get("value")
+                elif key in removed:
+                    tail[key] = [seq, record.get("value")]
+                elif key in pending:
+                    pending[key][1] = record.get("value")
+                else:
+                    pending[key] = [seq, record.get("value")]
+            elif record.get("op") == "del":
+                pending.pop(key, None)
+                tail.pop(key, None)
+                removed.add(key)
+
+        for key, value in snapshot_items:
+            if key in removed:
+                continue
+            entry = pending.pop(key, None)
+            yield key, (value if entry is None else entry[1])
+
+        # Keys set without "last" that the snapshot did not have were appended on insertion
+        rest = [(entry[0], key, entry[1]) for key, entry in pending.items()]
+        rest += [(entry[0], key, entry[1]) for key, entry in tail.items()]
+        for _, key, value in sorted(rest, key=lambda item: item[0]):
+            yield key, value
+
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                return codec.loads(f.read())
+        except:
+            return {}
+
+    def load(self):
+        return self.replay(self.load_snapshot())
+
+    # --- COMPACTION ---
+    def journal_size(self):
+        try:
+            return os.path.getsize(self.journal_path)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        size = self.journal_size()
+        if size >= self.max_bytes:
+            return True
+        try:
+            snapshot_size = os.path.getsize(self.snapshot_path)
+        except OSError:
+            snapshot_size = 0
+        return size >= self.min_bytes and size > snapshot_size * self.max_ratio
+
+    def compact(self, data=None, write_snapshot=None):
+        """
+        Folds the journal into the snapshot. The snapshot is replaced atomically and made
+        durable before the journal is truncated, so a crash in between only means the
+        (idempotent) journal is replayed once more. write_snapshot(path, data), if given,
+        must write atomically too.
+        """
+        if data is None:
+            data = self.load()
+        if write_snapshot:
+            write_snapshot(self.snapshot_path, data)
+            fsync_directory(self.snapshot_path)  # the rename is on disk before the journal is emptied
+        else:
+            atomic_write_bytes(self.snapshot_path, codec.dumps(data, pretty=True), durable=True)
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        return data
@@ -0,0 +1,91 @@
+import json
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Chunked text buffer over a file: holds the unparsed tail plus at most one partial value."""
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ("" at end of file), without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        ch = self.peek()
+        if ch not in chars or not ch:
+            raise ValueError(f"Expected one of {chars!r} at offset {self.pos}, got {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number (or literal) running to the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(f, chunk_size=CHUNK_SIZE):
+    """Yields the elements of a top-level JSON array one at a time."""
+    reader = _Reader(f, chunk_size)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def iter_object(f, chunk_size=CHUNK_SIZE):
+    """Yields the (key, value) members of a top-level JSON object one at a time."""
+    reader = _Reader(f, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        yield key, reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def project(record, fields):
+    """record reduced to fields (those it has); the record itself when fields is None."""
+    if fields is None or not isinstance(record, dict):
+        return record
+    return {field: record[field] for field in fields if field in record}
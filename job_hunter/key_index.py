@@ -0,0 +1,114 @@
+import threading
+from bisect import bisect_left
+
+
+class SortedKeyIndex:
+    """
+    Sorted view of a dict store's keys for prefix queries ("title-company" -> every
+    "title-company-Resume" cache entry). A prefix lookup is a binary search plus the
+    matches, instead of startswith() over every key.
+
+    Also tracks each key's position in the store (save_cache moves re-saved keys to the
+    end), so matches can be returned in store order, oldest first.
+    """
+    def __init__(self, keys=()):
+        self._seq = {}
+        self._next = 0
+        for key in keys:
+            self._seq[key] = self._next
+            self._next += 1
+        self._keys = sorted(self._seq)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._seq
+
+    def add(self, key, move_to_end=False):
+        is_new = key not in self._seq
+        if is_new or move_to_end:
+            self._seq[key] = self._next
+            self._next += 1
+        if is_new:
+            self._keys.insert(bisect_left(self._keys, key), key)
+        return self
+
+    def discard(self, key):
+        if key in self._seq:
+            del self._keys[bisect_left(self._keys, key)]
+            del self._seq[key]
+        return self
+
+    def apply(self, record):
+        """Applies one journal record (see JsonJournal.apply)."""
+        if record.get("op") == "set":
+            self.add(record.get("key"), move_to_end=bool(record.get("last")))
+        elif record.get("op") == "del":
+            self.discard(record.get("key"))
+        return self
+
+    def _scan(self, prefix):
+        keys = self._keys
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield keys[i]
+            i += 1
+
+    def with_prefix(self, prefix):
+        """Keys starting with prefix, in store order."""
+        return sorted(self._scan(prefix), key=lambda k: self._seq.get(k, -1))
+
+    def in_store_order(self, keys):
+        """keys (of this store) sorted by store position, oldest first."""
+        return sorted(keys, key=lambda k: self._seq.get(k, -1))
+
+    def with_any_prefix(self, prefixes):
+        """Set of keys starting with at least one of the prefixes."""
+        matches = set()
+        for prefix in prefixes:
+            matches.update(self._scan(prefix))
+        return matches
+
+
+class IndexCache:
+    """
+    Process-wide cache of indexes derived from data stores, validated against the
+    stores' file signatures. Our own writes patch an index in place (patch); anything
+    else that changes a store (another process, a manual edit) triggers a rebuild on the
+    next get.
+    """
+    def __init__(self):
+        self._entries = {}  # key -> (signatures dict, index)
+        self._lock = threading.Lock()
+
+    def get(self, key, signatures, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and None not in signatures.values() and entry[0] == signatures:
+                return entry[1]
+        index = build()
+        with self._lock:
+            self._entries[key] = (dict(signatures), index)
+        return index
+
+    def patch(self, key, part, before_sig, after_sig, fn):
+        """Applies fn to the index if its `part` signature was current right before our write."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and before_sig is not None and entry[0].get(part) == before_sig:
+                fn(entry[1])
+                entry[0][part] = after_sig
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# abspath of a journaled store -> SortedKeyIndex of its keys
+store_key_indexes = IndexCache()
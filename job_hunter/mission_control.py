@@ -0,0 +1,163 @@
+import os
+import socket
+import threading
+import time
+import uuid
+
+CONTROL_DIR = "data/mission_control"
+# Waiters re-read the state this often even without an event (a writer that could not signal,
+# e.g. on Windows where there are no Unix datagram sockets)
+FALLBACK_INTERVAL = 30
+
+PAUSE, RESUME, STOP, QUESTION, RESOLVED = "pause", "resume", "stop", "question", "resolved"
+
+
+def control_events(events):
+    """Control events among mission state events ((op, key, value) triples, see mission_state.apply_event)."""
+    found = []
+    for op, key, value in events:
+        if op != "set":
+            continue
+        if key == "is_paused":
+            found.append(PAUSE if value else RESUME)
+        elif key == "is_active" and not value:
+            found.append(STOP)
+        elif key == "pending_question":
+            found.append(QUESTION if value else RESOLVED)
+    return found
+
+
+class MissionControl:
+    """
+    Control channel between the UI and the mission loops: pause, resume, stop and
+    question / resolved (human intervention) events, published by MissionProgress when it
+    writes them. Loops block in wait() / wait_until() and wake within milliseconds instead
+    of sleeping and re-reading the state files.
+
+    Within a process (Streamlit sessions are threads) a Condition does the waking. Other
+    processes are reached through a Unix datagram socket per listening process in
+    CONTROL_DIR; publish() sends the event names to all of them. Sockets of dead processes
+    refuse the datagram and are removed.
+    """
+    def __init__(self, directory=CONTROL_DIR):
+        self.directory = directory
+        self._cond = threading.Condition()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.last_event = None
+        self._listener = None  # (socket path, socket)
+
+    @property
+    def version(self):
+        """Bumped by every event: a loop compares it to the one it last saw to know whether to reload."""
+        return self._version
+
+    def publish(self, *events):
+        if not events:
+            return
+        self._bump(events)
+        self._broadcast(events)
+
+    def _bump(self, events):
+        with self._cond:
+            self._version += 1
+            self.last_event = events[-1]
+            self._cond.notify_all()
+
+    def wait(self, since, timeout=None):
+        """Blocks until an event newer than version `since` (or timeout). Returns the current version."""
+        self.listen()
+        with self._cond:
+            self._cond.wait_for(lambda: self._version != since, timeout)
+            return self._version
+
+    def wait_until(self, predicate, timeout=None, interval=FALLBACK_INTERVAL):
+        """
+        Calls predicate() now and after each event (at least every `interval` seconds) until
+        it returns something truthy or `timeout` seconds passed. Returns its last result.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            version = self._version  # before the check: an event arriving during it is not missed
+            result = predicate()
+            if result:
+                return result
+            remaining = interval if deadline is None else min(interval, deadline - time.monotonic())
+            if remaining <= 0:
+                return result
+            self.wait(version, remaining)
+
+    # --- other processes ---
+    def listen(self):
+        """Starts receiving the events of other processes (no-op without Unix sockets)."""
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        directory = os.path.abspath(self.directory)
+        with self._lock:
+            if self._listener and os.path.dirname(self._listener[0]) == directory:
+                return
+            self._close()
+            path = os.path.join(directory, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+            try:
+                os.makedirs(directory, exist_ok=True)
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                sock.bind(path)
+            except OSError:
+                return
+            self._listener = (path, sock)
+            threading.Thread(target=self._receive, args=(sock,), name="mission-control", daemon=True).start()
+
+    def _receive(self, sock):
+        while True:
+            try:
+                data = sock.recv(1024)
+            except OSError:
+                return
+            if not self._listener or self._listener[1] is not sock:
+                sock.close()  # woken by _close
+                return
+            self._bump(data.decode("utf-8", "replace").split() or [None])
+
+    def _close(self):
+        if self._listener:
+            path, sock = self._listener
+            self._listener = None
+            try:
+                # Wakes the receiving thread, which closes the socket
+                with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as waker:
+                    waker.sendto(b"", path)
+            except OSError:
+                sock.close()
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _broadcast(self, events):
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        directory = os.path.abspath(self.directory)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return
+        own = self._listener[0] if self._listener else None
+        message = " ".join(events).encode("utf-8")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)  # a full queue means that process has events to wake on already
+            for name in names:
+                path = os.path.join(directory, name)
+                if not name.endswith(".sock") or path == own:
+                    continue
+                try:
+                    sock.sendto(message, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    try:
+                        os.unlink(path)  # its process is gone
+                    except OSError:
+                        pass
+                except OSError:
+                    pass
+
+
+mission_control = MissionControl()
@@ -1,20 +1,30 @@
 import streamlit as st
 import time
-import random
 import os
+from contextlib import nullcontext
 from datetime import datetime
 from job_hunter.scout import Scout
 from job_hunter.applier import JobApplier
-from job_hunter.analysis_crew import JobAnalysisCrew
-from job_hunter.mission_state import MissionProgress
+from job_hunter.analysis_crew import JobAnalysisCrew, llm_provider
+from job_hunter.blob_store import resolve_text
+from job_hunter.mission_control import FALLBACK_INTERVAL, mission_control
+from job_hunter.mission_state import MissionProgress, load_state as load_mission_state
+from job_hunter.rate_limiter import rate_limiter
+from job_hunter.scout_pool import (DONE, EMITTED, FAILED, RETRY_DELAY, SCOUT_WORKERS, SCOUT_WORKERS_PER_PLATFORM, STAGE_DONE,
+                                   STAGE_FAILED, STAGE_SKIPPED, STARTED, STATUS, ScoutPool, Stage)
+from job_hunter.search_cache import query_key
 from tools.browser_manager import BrowserManager
 from tools.logger import logger
 from tools.internet import wait_for_internet, is_internet_available
 
+ANALYSIS_COMPONENTS = ["intel", "cover_letter", "ats", "resume"]
+
 class MissionManager:
     def __init__(self, db):
         self.db = db
         self.progress = MissionProgress.load()
+        self._control_version = mission_control.version
+        mission_control.listen()
 
     def _start_mission(self, mission_type, total_steps=0, config_context=None):
         self.progress.reset()
@@ -24,10 +34,6 @@ class MissionManager:
         self.progress.config_context = config_context
         self.progress.save()
 
-    def random_sleep(self, min_sec=1, max_sec=3):
-        """Helper for random sleep."""
-        time.sleep(random.uniform(min_sec, max_sec))
-
     def _finish_mission(self, final_status="Complete"):
         self.progress.update(is_active=False, status=final_status)
 
@@ -99,8 +105,8 @@ class MissionManager:
                                 logger.info(f"ℹ️ No matching Quick Apply jobs found for {kw} on {p_name}.")
                             
                             # Update task completion
-                            self.progress.tasks[task_idx]['completed'] = True
-                            self.progress.update(jobs_applied=self.progress.jobs_applied + applied_here)
+                            self.progress.update_task(task_idx, completed=True)
+                            self.progress.increment("jobs_applied", applied_here)
                             task_idx += 1
                             status_box.success(f"✅ Finished {p_name}. Moving on...")
                             logger.info(f"✅ Finished {p_name}. Moving on...")
@@ -112,7 +118,7 @@ class MissionManager:
                             task_idx += 1
                         finally:
                             applier.close()
-                            self.random_sleep(2, 4) # Brief pause before next platform
+                            rate_limiter.wait(p_name, 2, 4) # Brief pause before next platform
 
         self.db.archive_applied_jobs()
         self._finish_mission()
@@ -185,49 +191,52 @@ class MissionManager:
 
                 if success:
                     self.db.save_applied(f"{title}-{company}", job, {"auto_applied": True})
-                    self.progress.update(jobs_applied=self.progress.jobs_applied + 1)
+                    self.progress.increment("jobs_applied")
                 elif "expired" in message.lower() or "no longer accepting" in message.lower():
                     self.db.park_job(title, company, job)
 
                 # Mark task as completed
-                self.progress.tasks[i]['completed'] = True
-                self.progress.save()
+                self.progress.update_task(i, completed=True)
             except Exception as e:
                 logger.error(f"Batch apply error for {title}: {e}")
 
-            time.sleep(random.uniform(2, 5)) # Human jitter
+            rate_limiter.wait(platform or "Unknown", 2, 5) # Human jitter, paced per platform
 
         applier.close()
         
         # Persist Discoveries (if any is_easy_apply flags were changed)
         # archive_applied_jobs already loads and saves scouted_jobs, but it removes them.
         # We need to ensure the Standard (False) status is saved for non-applied jobs too.
-        current_scouted = self.db.load_scouted()
-        updated_count = 0
+        with self.db.batch():  # corrections + archive: one scouted write
+            current_scouted = self.db.load_scouted(fresh=True)
+            updated_count = 0
         
-        # Create a lookup for jobs in the batch that were corrected
-        corrected_links = {j.get('link'): j.get('is_easy_apply') for j in eligible_jobs if j.get('link') and j.get('is_easy_apply') is False}
+            # Create a lookup for jobs in the batch that were corrected
+            corrected_links = {j.get('link'): j.get('is_easy_apply') for j in eligible_jobs if j.get('link') and j.get('is_easy_apply') is False}
         
-        if corrected_links:
-            for s_job in current_scouted:
-                s_link = s_job.get('link')
-                if s_link in corrected_links:
-                    s_job['is_easy_apply'] = False
-                    updated_count += 1
+            if corrected_links:
+                for s_job in current_scouted:
+                    s_link = s_job.get('link')
+                    if s_link in corrected_links:
+                        s_job['is_easy_apply'] = False
+                        updated_count += 1
             
-            if updated_count > 0:
-                self.db.save_scouted_jobs(current_scouted, append=False)
-                logger.info(f"✅ Persisted {updated_count} Easy Apply corrections to database.")
+                if updated_count > 0:
+                    self.db.save_scouted_jobs(current_scouted, append=False)
+                    logger.info(f"✅ Persisted {updated_count} Easy Apply corrections to database.")
 
-        self.db.archive_applied_jobs()
+            self.db.archive_applied_jobs()
         self._finish_mission()
 
-    def run_standard_scrape_mission(self, resumes, locations, limit, platforms, deep_scrape, use_browser_analysis, status_box):
-        """3. Launch All Mission: Scout + Deep Scrape + AI Analysis (Resumable)"""
+    def run_standard_scrape_mission(self, resumes, locations, limit, platforms, deep_scrape, use_browser_analysis, status_box,
+                                    scout_workers=SCOUT_WORKERS, scout_workers_per_platform=SCOUT_WORKERS_PER_PLATFORM):
+        """3. Launch All Mission: Scout + Deep Scrape + AI Analysis (Resumable)
+        Scouting runs up to scout_workers searches at once (scout_workers_per_platform on the same platform)."""
         platforms_arg = platforms if platforms else ["LinkedIn"]
 
         # Build Backlog and calculate metrics for logging
-        backlog = []
+        # Resumes sharing a search (same title, location and platform) share one backlog item
+        backlog = {}
         tasks = []
         total_resumes = len(resumes)
         total_keywords = 0
@@ -246,14 +255,18 @@ class MissionManager:
             for kw in keywords:
                 for loc in locs_list:
                     for p in platforms_arg:
-                        backlog.append({
-                            "keyword": kw, "location": loc, "platform": p,
-                            "role_name": role_name, "resume_text": role_data.get('text', ''),
-                            "resume_filename": role_data.get("filename", role_name)
-                        })
+                        role = {"role_name": role_name, "resume_text": role_data.get('text', ''),
+                                "resume_filename": role_data.get("filename", role_name)}
+                        key = query_key(p, kw, loc)
+                        if key in backlog:
+                            backlog[key]["roles"].append(role)
+                            continue
+                        backlog[key] = {"keyword": kw, "location": loc, "platform": p, "roles": [role]}
                         tasks.append({"label": f"Scrape for {kw} in {loc} on {p}", "completed": False, "type": "scout"})
 
+        backlog = list(backlog.values())
         scout_task_count = len([t for t in tasks if t['type'] == 'scout'])
+        merged_searches = total_keywords * total_locs * total_platforms - scout_task_count
         potential_jobs = scout_task_count * limit
         
         if use_browser_analysis:
@@ -264,6 +277,8 @@ class MissionManager:
         # Log breakdown to status box and console
         breakdown_msg = f"📊 **Mission Breakdown**: {total_steps} Tasks total (Scouting for up to **{potential_jobs}** jobs)\n"
         breakdown_msg += f"- Scouting: {scout_task_count} searches ({total_resumes} Resume x {total_keywords} Titles x {total_locs} Locs x {total_platforms} Platforms)\n"
+        if merged_searches:
+            breakdown_msg += f"- Shared: {merged_searches} identical searches of several resumes run once\n"
         breakdown_msg += f"- Limit: Up to {limit} jobs per search combination\n"
         
         if use_browser_analysis:
@@ -275,7 +290,8 @@ class MissionManager:
         logger.info(breakdown_msg.replace("**", ""))
 
         self._start_mission("Scout & Analyze", total_steps=total_steps, config_context={
-            "limit": limit, "deep_scrape": deep_scrape, "use_browser_analysis": use_browser_analysis
+            "limit": limit, "deep_scrape": deep_scrape, "use_browser_analysis": use_browser_analysis,
+            "scout_workers": scout_workers, "scout_workers_per_platform": scout_workers_per_platform
         })
         self.progress.update(scouting_backlog=backlog, phase="Scouting", tasks=tasks, current_task_idx=0)
 
@@ -305,6 +321,13 @@ class MissionManager:
         self.db.clear_scouted_jobs()
         BrowserManager().close_all_drivers()
 
+    def _sync_progress(self):
+        """Re-reads the state after a control event (Pause/Stop from the UI) only. False once the mission was stopped."""
+        if mission_control.version != self._control_version:
+            self._control_version = mission_control.version
+            self.progress = MissionProgress.load()
+        return self.progress.is_active
+
     def _check_interrupts(self, status_box):
         """Checks for internet connection and pause state."""
         # 1. Internet check with 3 retries
@@ -321,9 +344,14 @@ class MissionManager:
                 self.progress.update(is_paused=True, status="Paused (No Internet)")
 
         # 2. Pause check
+        if not self._sync_progress():
+            return False # Stop requested
+
         while self.progress.is_paused:
             status_box.info("⏸️ Mission is paused. Waiting for resume...")
-            time.sleep(5)
+            # Resume/Stop wake us right away; an internet pause re-checks the connection every 5s
+            offline = self.progress.status == "Paused (No Internet)"
+            self._control_version = mission_control.wait(self._control_version, timeout=5 if offline else FALLBACK_INTERVAL)
             self.progress = MissionProgress.load() # Reload state
             if not self.progress.is_active:
                 return False # Stop requested
@@ -337,104 +365,147 @@ class MissionManager:
         return True
 
     def _execute_scouting_loop(self, status_box):
-        scout = Scout()
+        """
+        Scouting as a pipeline: the ScoutPool workers search and fetch job details, and each
+        job goes to the analysis stage as soon as its description is scraped, while the
+        other searches go on. analysis_backlog is the persisted queue between the two: jobs
+        are added when scraped and removed once analyzed, so a resumed mission picks up both
+        the remaining searches and the scraped but not yet analyzed jobs.
+        """
         # Find how many scouting tasks total to track relative progress correctly
         total_scout_tasks = len([t for t in self.progress.tasks if t['type'] == 'scout'])
         use_analysis = self.progress.config_context.get("use_browser_analysis", True)
         limit = self.progress.config_context.get("limit", 15)
         deep_scrape = self.progress.config_context.get("deep_scrape", True)
+        pool = ScoutPool(workers=self.progress.config_context.get("scout_workers", SCOUT_WORKERS),
+                         per_platform=self.progress.config_context.get("scout_workers_per_platform", SCOUT_WORKERS_PER_PLATFORM))
 
         p_bar = status_box.progress(0, text="🛰️ Mission Progress: Scouting...")
 
-        while self.progress.scouting_backlog:
-            if not self._check_interrupts(status_box): return
+        def scout_item(worker, item, report, emit):
+            # Runs on the worker's thread: only scraping and saving, the mission state is updated below
+            if "scout" not in worker.state:
+                worker.state["scout"] = Scout(profile_name=worker.profile_name)
+            return worker.state["scout"].launch_mission(
+                keyword=item['keyword'],
+                location=item['location'],
+                limit=limit,
+                platforms=[item['platform']],
+                easy_apply=False,
+                deep_scrape=deep_scrape,
+                status_callback=report,
+                # Role tags are saved with the jobs (no re-save of the whole store per search),
+                # one copy per resume sharing this search
+                extra_fields=[{'_resume_text': role.get('resume_text', ''),
+                               '_resume_filename': role.get('resume_filename', ''),
+                               '_role_name': role.get('role_name', '')}
+                              for role in item.get('roles') or [item]],
+                # Blocks while the analysis queue is full
+                on_job=emit if use_analysis else None
+            )
+
+        def browser_for(worker):
+            # Worker 1 drives the app's browser; the others get their own driver and profile
+            return nullcontext() if worker.index == 0 else BrowserManager().dedicated()
+
+        def may_analyze():
+            # On the analysis thread: waits out a pause (woken by Resume/Stop), False once stopped
+            def settled():
+                state = load_mission_state()
+                if state.get("is_active") and state.get("is_paused"):
+                    return None
+                return {"active": bool(state.get("is_active"))}
+            return mission_control.wait_until(settled)["active"]
+
+        # The LLM browser (its own profile) runs next to the scrapers. Jobs are analyzed as copies:
+        # the queued record must stay as persisted for remove_backlog to match it on replay.
+        analysis = Stage("analysis", lambda stage, job: self._analyze_job(dict(job)), gate=may_analyze,
+                         context=lambda stage: BrowserManager().dedicated()) if use_analysis else None
+        analysis_task_idx = next((i for i, t in enumerate(self.progress.tasks) if t['type'] == "analyze"), -1)
+        analyzed = 0
+
+        # Items stay in the backlog until their search is done, so a stopped mission resumes them
+        backlog = list(self.progress.scouting_backlog)
+        carried = list(self.progress.analysis_backlog) if use_analysis else []
+        for event, worker, item, payload in pool.run(backlog, scout_item, lambda: self._check_interrupts(status_box),
+                                                     browser_for, stage=analysis, carried=carried):
+            if not self._sync_progress():
+                continue # Stopped: let running searches finish without touching the reset state
+
+            if event in (STAGE_DONE, STAGE_FAILED, STAGE_SKIPPED):
+                job = item
+                if event == STAGE_FAILED:
+                    # Stays in the backlog: retried by the analysis loop after scouting
+                    logger.error(f"Analysis failed for {job.get('title')}: {payload}")
+                elif event == STAGE_DONE:
+                    analyzed += 1
+                    self.progress.remove_backlog("analysis_backlog", job)
+                    if analysis_task_idx != -1:
+                        self.progress.update_task(analysis_task_idx, label=f"Run AI Analysis ({analyzed} done, {len(self.progress.analysis_backlog)} queued)")
+                    status_box.info(f"🧠 Analyzed {job.get('title')} @ {job.get('company')}")
+                continue
 
-            item = self.progress.scouting_backlog[0]
             kw, loc, p_name = item['keyword'], item['location'], item['platform']
-
-            # Find the current task index in the full tasks list
             task_label = f"Scrape for {kw} in {loc} on {p_name}"
-            current_task_idx = -1
-            for idx, t in enumerate(self.progress.tasks):
-                if t['label'] == task_label and t['type'] == "scout" and not t['completed']:
-                    current_task_idx = idx
-                    break
 
-            # If we didn't find it by label/uncompleted, just find the first uncompleted scout task
-            if current_task_idx == -1:
-                for idx, t in enumerate(self.progress.tasks):
-                    if t['type'] == "scout" and not t['completed']:
-                        current_task_idx = idx
-                        break
+            if event == STARTED:
+                task_idx = self._scout_task_index(task_label)
+                self.progress.update(current_task_idx=task_idx, status=f"Scouting {kw} on {p_name}...")
+                self.progress.update_worker(worker.name, platform=p_name, task=task_label, status="Starting...")
+                status_box.info(f"🚀 [{worker.name}] {task_label}")
 
-            # Progress calculation based on completed tasks
-            completed_scout_count = len([t for t in self.progress.tasks if t['type'] == 'scout' and t['completed']])
-            current_step = completed_scout_count + 1
+            elif event == STATUS:
+                self.progress.update_worker(worker.name, status=payload)
+                status_box.info(f"🚀 [{worker.name}] {payload}")
 
-            self.progress.update(current_step=current_step, current_task_idx=current_task_idx, status=f"Scouting {kw} on {p_name}...")
+            elif event == EMITTED:
+                # Scraped: queued for analysis right away (persisted, so a resumed mission still analyzes it)
+                self.progress.extend_backlog("analysis_backlog", [payload])
 
-            perc = min(current_step / self.progress.total_steps, 1.0)
-            p_bar.progress(perc, text=f"🛰️ Scouting {kw} ({current_step}/{self.progress.total_steps})")
-
-            try:
-                # Add a small delay to ensure Streamlit can process previous updates
-                time.sleep(0.5)
-
-                results = scout.launch_mission(
-                     keyword=kw,
-                     location=loc,
-                     limit=limit,
-                     platforms=[p_name],
-                     easy_apply=False,
-                     deep_scrape=deep_scrape,
-                     status_callback=lambda m: status_box.info(f"🚀 {m}")
-                )
-                for r in results:
-                    r['_resume_text'] = item.get('resume_text', '')
-                    r['_resume_filename'] = item.get('resume_filename', '')
-                    r['_role_name'] = item.get('role_name', '')
-                
-                # RE-SAVE to DB with the new role tags
-                if results:
-                    all_scouted = self.db.load_scouted()
-                    # Results are already in all_scouted (saved by scout.py), we just need to update them
-                    # Find them by link or just overwrite everything (safer if append=True was used)
-                    # Actually, let's just update the list we just got back and save it.
-                    self.db.save_scouted_jobs(all_scouted, append=False)
-
-                # Add to analysis backlog
-                if use_analysis:
-                    self.progress.analysis_backlog.extend(results)
+            elif event == DONE:
+                results = payload
 
                 # Update task status
-                task_label = f"Scrape for {kw} in {loc} on {p_name}"
-                for task in self.progress.tasks:
-                    if task['label'] == task_label and task['type'] == "scout":
-                        task['completed'] = True
-                        break
+                task_idx = self._scout_task_index(task_label)
+                if task_idx != -1:
+                    self.progress.update_task(task_idx, completed=True)
 
-                # Update analysis task label
-                for task in self.progress.tasks:
-                    if task['type'] == "analyze":
-                        new_count = len(self.progress.analysis_backlog)
-                        task['label'] = f"Run AI Analysis for {new_count} Jobs"
-                        break
+                self.progress.increment("jobs_scouted", len(results))
+                self.progress.update_worker(worker.name, status="Idle", task=None,
+                                            jobs=self.progress.workers.get(worker.name, {}).get("jobs", 0) + len(results))
 
-                self.progress.update(jobs_scouted=self.progress.jobs_scouted + len(results))
+                # Remove from backlog (one journal line, not a rewrite of the whole state)
+                self.progress.remove_backlog("scouting_backlog", item)
 
-                # Pop from backlog and save
-                self.progress.scouting_backlog.pop(0)
-                self.progress.save()
+                # Progress calculation based on completed tasks
+                current_step = len([t for t in self.progress.tasks if t['type'] == 'scout' and t['completed']])
+                self.progress.update(current_step=current_step)
+                perc = min(current_step / max(self.progress.total_steps, 1), 1.0)
+                p_bar.progress(perc, text=f"🛰️ Scouted {current_step}/{total_scout_tasks} searches ({self.progress.total_steps} steps)")
 
-            except Exception as e:
-                logger.error(f"Scouting failed for {kw} on {p_name}: {e}")
-                # For platform errors, we could ask user via pending_decision but for now let's just log and skip or retry
-                self.progress.update(status=f"Error on {p_name}. Retrying in 30s...")
-                time.sleep(30)
+            elif event == FAILED:
+                logger.error(f"Scouting failed for {kw} on {p_name}: {payload}")
+                # For platform errors, we could ask user via pending_decision but for now let's just log and retry
+                self.progress.update(status=f"Error on {p_name}. Retrying in {RETRY_DELAY}s...")
+                self.progress.update_worker(worker.name, status=f"Error: {payload}", task=None)
 
-        self.progress.update(phase="Analysis")
+        if not self.progress.is_active:
+            return
+        if use_analysis and analysis_task_idx != -1 and not self.progress.analysis_backlog:
+            self.progress.update_task(analysis_task_idx, completed=True)
+        self.progress.update(phase="Analysis", workers={})
         p_bar.progress(0.5, text="🛰️ Scouting Complete!")
 
+    def _scout_task_index(self, task_label):
+        """Index of the uncompleted scouting task with this label, else of the first uncompleted one (-1 if none)."""
+        for idx, t in enumerate(self.progress.tasks):
+            if t['label'] == task_label and t['type'] == "scout" and not t['completed']:
+                return idx
+        for idx, t in enumerate(self.progress.tasks):
+            if t['type'] == "scout" and not t['completed']:
+                return idx
+        return -1
+
     def _execute_analysis_loop(self, status_box):
         # Deduplicate backlog (Resume-aware)
         unique_jobs = {}
@@ -453,9 +524,6 @@ class MissionManager:
         status_box.info(f"🧠 Starting Automated AI Analysis for {total_analyze} jobs...")
         p_bar = status_box.progress(0.5, text="🧠 AI Analysis Progress")
 
-        cache = self.db.load_cache()
-        analysis_components = ["intel", "cover_letter", "ats", "resume"]
-
         # Find the analysis task index
         analysis_task_idx = -1
         for idx, t in enumerate(self.progress.tasks):
@@ -468,7 +536,6 @@ class MissionManager:
 
             job = self.progress.analysis_backlog[0]
             r_name = job.get('_resume_filename')
-            jid = self.db.generate_job_id(job.get('title'), job.get('company'), r_name)
 
             # Progress calculation
             # Analysis is the last step usually
@@ -478,46 +545,55 @@ class MissionManager:
             # Small delay for UI stability
             time.sleep(0.5)
 
-            # Reload cache each time to stay fresh
-            cache = self.db.load_cache()
-
-            if jid not in cache:
-                scraped_jd = job.get('rich_description') or job.get('description') or ""
-                if scraped_jd and len(scraped_jd) > 50:
-                    context = f"Title: {job.get('title')}\nCompany: {job.get('company')}\nJD: {scraped_jd}"
-                    try:
-                        crew = JobAnalysisCrew(context, job.get('_resume_text', ''), profile_name="default")
-                        results = crew.run_analysis(components=analysis_components, use_browser=True)
-                        if results and "error" not in results:
-                            self.db.save_cache(jid, results)
-                            self.db.save_active_resume(job.get('title'), job.get('company'), r_name)
-                        else:
-                            err_msg = results.get('error', 'Unknown Error')
-                            logger.error(f"Analysis failed for {jid}: {err_msg}")
-                            # Save a temporary error record so we don't keep retrying this session
-                            self.db.save_cache(jid, {"error": err_msg, "status": "failed"})
-                    except Exception as ae:
-                        logger.error(f"Analysis failed for {jid}: {ae}")
-                        self.db.save_cache(jid, {"error": str(ae), "status": "failed"})
-                else:
-                    logger.warning(f"Skipping analysis for {jid}: No description found (length: {len(scraped_jd)})")
-                    self.db.save_cache(jid, {"error": "No description found", "status": "skipped"})
-
-                time.sleep(random.uniform(1, 2))
-
-            # Pop and save
-            self.progress.analysis_backlog.pop(0)
-            self.progress.save()
+            self._analyze_job(job)
+
+            # Pop (one journal line, not a rewrite of the whole state)
+            self.progress.pop_backlog("analysis_backlog")
 
         # Mark analysis task as completed
-        for task in self.progress.tasks:
+        for idx, task in enumerate(self.progress.tasks):
             if task['type'] == "analyze":
-                task['completed'] = True
+                self.progress.update_task(idx, completed=True)
                 break
-        self.progress.save()
 
         BrowserManager().close_all_drivers()
 
+    def _analyze_job(self, job):
+        """AI analysis of one scouted job into the cache, unless it is cached already (also runs on the pipeline's analysis thread)."""
+        r_name = job.get('_resume_filename')
+        jid = self.db.generate_job_id(job.get('title'), job.get('company'), r_name)
+
+        # Reload cache each time to stay fresh
+        cache = self.db.load_cache()
+
+        if jid not in cache and self.db.reuse_duplicate_analysis(job, jid, r_name):
+            # Same posting as an already analyzed job (e.g. seen on another platform)
+            logger.info(f"Reused analysis of {job.get('duplicate_of')} for {jid}")
+            self.db.save_active_resume(job.get('title'), job.get('company'), r_name)
+        elif jid not in cache:
+            scraped_jd = resolve_text(job.get('rich_description') or job.get('description') or "")
+            if scraped_jd and len(scraped_jd) > 50:
+                context = f"Title: {job.get('title')}\nCompany: {job.get('company')}\nJD: {scraped_jd}"
+                try:
+                    crew = JobAnalysisCrew(context, resolve_text(job.get('_resume_text', '')), profile_name="default")
+                    results = crew.run_analysis(components=ANALYSIS_COMPONENTS, use_browser=True)
+                    if results and "error" not in results:
+                        self.db.save_cache(jid, results, job, r_name)
+                        self.db.save_active_resume(job.get('title'), job.get('company'), r_name)
+                    else:
+                        err_msg = results.get('error', 'Unknown Error')
+                        logger.error(f"Analysis failed for {jid}: {err_msg}")
+                        # Save a temporary error record so we don't keep retrying this session
+                        self.db.save_cache(jid, {"error": err_msg, "status": "failed"}, job, r_name)
+                except Exception as ae:
+                    logger.error(f"Analysis failed for {jid}: {ae}")
+                    self.db.save_cache(jid, {"error": str(ae), "status": "failed"}, job, r_name)
+            else:
+                logger.warning(f"Skipping analysis for {jid}: No description found (length: {len(scraped_jd)})")
+                self.db.save_cache(jid, {"error": "No description found", "status": "skipped"}, job, r_name)
+
+            rate_limiter.wait(llm_provider(), 1, 2)
+
     def run_automated_analysis(self, jobs, status_box, p_bar=None):
         # Legacy method compatibility - just wrap the new loop
         self.progress.update(analysis_backlog=jobs, phase="Analysis")
@@ -1,10 +1,100 @@
-import json
 import os
-from dataclasses import dataclass, field, asdict
+import uuid
+from dataclasses import dataclass, field, asdict, fields
 from typing import List, Optional
 from datetime import datetime
+from job_hunter import codec
+from job_hunter.blob_store import blob_store
+from job_hunter.journal import JsonJournal
+from job_hunter.mission_control import STOP, control_events, mission_control
+from job_hunter.storage import atomic_write_bytes, atomic_write_json, read_json, read_lock, write_lock
 
 STATE_FILE = "data/mission_state.json"
+EVENTS_FILE = "data/mission_state.events.jsonl"
+# Checkpoint once the event journal passes this size, or half the checkpoint's size
+CHECKPOINT_MIN_BYTES = 64 * 1024
+CHECKPOINT_RATIO = 0.5
+
+
+def _events():
+    return JsonJournal(STATE_FILE, EVENTS_FILE, min_bytes=CHECKPOINT_MIN_BYTES, max_ratio=CHECKPOINT_RATIO)
+
+
+def apply_event(data, record):
+    """
+    Applies one mission event to a state dict:
+      set    key = value               update(key=value)
+      add    key += value              increment (counters)
+      pop    key.pop(0)                pop_backlog (first backlog item done)
+      extend key.extend(value)         extend_backlog
+      remove key.remove(value)         remove_backlog (an item finished out of order)
+      task   tasks[key].update(value)  update_task
+      worker workers[key].update(value) update_worker
+    """
+    op, key, value = record.get("op"), record.get("key"), record.get("value")
+    if op == "set":
+        data[key] = value
+    elif op == "add":
+        data[key] = (data.get(key) or 0) + value
+    elif op == "pop":
+        if data.get(key):
+            data[key].pop(0)
+    elif op == "extend":
+        data.setdefault(key, []).extend(value)
+    elif op == "remove":
+        if value in (data.get(key) or []):
+            data[key].remove(value)
+    elif op == "task":
+        tasks = data.get("tasks") or []
+        if 0 <= key < len(tasks):
+            tasks[key].update(value)
+    elif op == "worker":
+        data.setdefault("workers", {}).setdefault(key, {}).update(value)
+    return data
+
+
+def _read_events(epoch, start=0):
+    """
+    Events of the journal from byte offset start, and the offset read up to. None if the
+    journal does not extend the checkpoint of this epoch: it starts with the epoch line of
+    its checkpoint, so events of an older one (crash between writing a checkpoint and
+    resetting the journal) are never replayed twice.
+    """
+    try:
+        with open(EVENTS_FILE, "rb") as f:
+            first = f.readline()
+            try:
+                header = codec.loads(first)
+            except ValueError:
+                header = {}
+            if header.get("op") != "epoch" or header.get("key") != epoch:
+                return None, 0
+            f.seek(max(start, len(first)))
+            data = f.read()
+    except OSError:
+        return None, 0
+    records = []
+    for line in data.splitlines():
+        try:
+            records.append(codec.loads(line))
+        except ValueError:
+            pass  # empty or torn line (crash mid-append)
+    return records, max(start, len(first)) + len(data)
+
+
+def _read_state():
+    with read_lock(STATE_FILE):
+        data = read_json(STATE_FILE)
+        records, offset = _read_events(data.get("epoch"))
+    for record in records or ():
+        apply_event(data, record)
+    return data, offset
+
+
+def load_state():
+    """The persisted mission state as a dict: last checkpoint plus the events written since."""
+    return _read_state()[0]
+
 
 @dataclass
 class MissionProgress:
@@ -34,29 +124,95 @@ class MissionProgress:
     # Context for resumption
     config_context: dict = field(default_factory=dict) # Store scrape_limit, deep_scrape_toggle etc.
 
+    # Scouting workers running in parallel: {name: {"platform", "task", "status", "jobs"}}
+    workers: dict = field(default_factory=dict)
+
+    # Checkpoint the event journal extends (see save)
+    epoch: Optional[str] = None
+
+    def __post_init__(self):
+        self._offset = 0  # bytes of the event journal reflected in this instance
+
+    # --- STEPS (one journal line each, whatever the backlog size) ---
     def update(self, **kwargs):
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        self._record([("set", key, value) for key, value in kwargs.items() if hasattr(self, key)])
+
+    def increment(self, counter, k=1):
+        """jobs_applied / jobs_scouted += k"""
+        self._record([("add", counter, k)])
+
+    def update_task(self, index, **changes):
+        """Merges changes (completed=True, label=...) into tasks[index]."""
+        self._record([("task", index, changes)])
+
+    def pop_backlog(self, name):
+        """Removes and returns the first item of scouting_backlog / analysis_backlog."""
+        backlog = getattr(self, name)
+        item = backlog[0] if backlog else None
+        self._record([("pop", name, None)])
+        return item
+
+    def extend_backlog(self, name, items):
+        self._record([("extend", name, list(items))])
+
+    def remove_backlog(self, name, item):
+        """Removes item from a backlog wherever it is (parallel workers finish out of order)."""
+        self._record([("remove", name, item)])
+
+    def update_worker(self, name, **changes):
+        """Merges changes (platform, task, status, jobs) into workers[name]."""
+        self._record([("worker", name, changes)])
+
+    def _record(self, events):
         self.last_update = datetime.now().isoformat()
-        self.save()
+        events = events + [("set", "last_update", self.last_update)]
+        # Backlogs repeat the same resume text per entry: store it once, keep references
+        records = [{"op": op, "key": key, "value": blob_store.externalize(value)} for op, key, value in events]
+        os.makedirs("data", exist_ok=True)
+        with write_lock(STATE_FILE):
+            # Steps another instance recorded meanwhile (e.g. Pause from the UI) are merged in first
+            foreign, offset = _read_events(self.epoch, self._offset) if os.path.exists(STATE_FILE) else (None, 0)
+            for record in foreign or ():
+                apply_event(self.__dict__, record)
+            for op, key, value in events:
+                apply_event(self.__dict__, {"op": op, "key": key, "value": value})
+            journal = _events()
+            if foreign is None or journal.needs_compaction():
+                # Nothing to extend (first write, or another instance checkpointed since) or time to fold
+                self._checkpoint()
+            else:
+                self._offset = offset + journal.append_records(records)
+        # Wake the loops waiting on pause / resume / stop / a resolved question
+        mission_control.publish(*control_events(events))
 
+    # --- CHECKPOINTS ---
     def save(self):
+        """Writes a full checkpoint and starts a new event journal."""
         os.makedirs("data", exist_ok=True)
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=2)
+        with write_lock(STATE_FILE):
+            self._checkpoint()
+
+    def _checkpoint(self):
+        # The UI reads these files while the mission thread writes them: never expose a half-written state.
+        # Checkpoint first, then the journal of its new epoch: a crash in between leaves an old-epoch
+        # journal, which load ignores.
+        self.epoch = uuid.uuid4().hex
+        atomic_write_json(STATE_FILE, blob_store.externalize(asdict(self)), pretty=False)
+        header = codec.dumps({"op": "epoch", "key": self.epoch}) + b"\n"
+        atomic_write_bytes(EVENTS_FILE, header)
+        self._offset = len(header)
 
     @classmethod
     def load(cls):
         if os.path.exists(STATE_FILE):
             try:
-                with open(STATE_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Filter out keys that aren't in the dataclass
-                    from dataclasses import fields
-                    field_names = {f.name for f in fields(cls)}
-                    filtered_data = {k: v for k, v in data.items() if k in field_names}
-                    return cls(**filtered_data)
+                data, offset = _read_state()
+                # Filter out keys that aren't in the dataclass
+                field_names = {f.name for f in fields(cls)}
+                filtered_data = {k: v for k, v in data.items() if k in field_names}
+                progress = cls(**filtered_data)
+                progress._offset = offset
+                return progress
             except:
                 pass
         return cls(mission_type="None")
@@ -78,4 +234,6 @@ class MissionProgress:
         self.scouting_backlog = []
         self.analysis_backlog = []
         self.config_context = {}
+        self.workers = {}
         self.save()
+        mission_control.publish(STOP)
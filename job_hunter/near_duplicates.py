@@ -0,0 +1,166 @@
+import random
+import re
+
+from job_hunter.blob_store import resolve_text
+from job_hunter.key_index import IndexCache
+
+# Legal-form suffixes that differ between platforms for the same employer
+COMPANY_SUFFIXES = {"gmbh", "ag", "se", "kg", "kgaa", "mbh", "co", "ohg", "ug", "ev", "inc", "llc", "ltd",
+                    "limited", "plc", "corp", "corporation", "company", "sa", "sas", "srl", "bv", "nv",
+                    "ab", "as", "oy", "spa", "holding", "group", "gruppe", "germany", "deutschland"}
+# "(m/w/d)", "(f/m/x)", "(all genders)", "m/w/d" ... appended to German job titles
+GENDER_TAG = re.compile(r"\(\s*(?:[mwfdx]\s*[/|,]\s*)+[mwfdx]\s*\)|\b(?:[mwfdx]/)+[mwfdx]\b|\(\s*all genders?\s*\)|\(\s*gn\s*\)")
+# Title words that make two otherwise identical titles different positions
+LEVEL_WORDS = {"junior", "senior", "lead", "principal", "staff", "head", "chief", "intern", "internship",
+               "werkstudent", "praktikant", "praktikum", "trainee", "working", "student", "i", "ii", "iii", "iv"}
+
+NUM_PERM = 32
+BANDS = 16                      # 2 rows per band: pairs from ~0.3 Jaccard up become candidates
+TITLE_THRESHOLD = 0.7           # title trigram Jaccard for a duplicate
+TITLE_THRESHOLD_SAME_JD = 0.5   # ... when the descriptions are near-identical
+COMPANY_THRESHOLD = 0.5
+DESCRIPTION_THRESHOLD = 0.9     # estimated Jaccard of description word shingles
+
+_MASK64 = (1 << 64) - 1
+_rng = random.Random(20240611)
+_PERMUTATIONS = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+_ROWS = NUM_PERM // BANDS
+
+
+def _words(text):
+    return re.sub(r"[^\w\s]", " ", str(text or "").lower()).split()
+
+
+def normalize_company(company):
+    words = [w for w in _words(company) if w not in COMPANY_SUFFIXES]
+    return " ".join(words)
+
+
+def normalize_title(title):
+    title = str(title or "").split("\n")[0].lower()
+    return " ".join(_words(GENDER_TAG.sub(" ", title)))
+
+
+def normalize_location(location):
+    return " ".join(_words(str(location or "").split(",")[0]))
+
+
+def trigrams(text):
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2)) if text else frozenset()
+
+
+_UNKNOWN = trigrams("unknown")
+
+
+def minhash(features):
+    """MinHash signature (one XOR-masked 64-bit hash per permutation). Process-local: uses hash()."""
+    hashes = [hash(f) & _MASK64 for f in features]
+    if not hashes:
+        return None
+    return tuple(min(h ^ mask for h in hashes) for mask in _PERMUTATIONS)
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class _Entry:
+    """Features of one indexed job; the description signature is computed on first need."""
+    __slots__ = ("job_id", "title", "title_grams", "company_grams", "location", "description", "language",
+                 "_description_sig")
+
+    def __init__(self, job, job_id):
+        self.job_id = job_id
+        self.title = normalize_title(job.get("title"))
+        self.title_grams = trigrams(self.title)
+        self.company_grams = trigrams(normalize_company(job.get("company")))
+        self.location = normalize_location(job.get("location"))
+        self.description = job.get("rich_description") or ""
+        self.language = job.get("language")
+        self._description_sig = False
+
+    def signature(self):
+        if not self.title_grams or not self.company_grams or self.company_grams == _UNKNOWN:
+            return None
+        return minhash([f"t{g}" for g in self.title_grams] + [f"c{g}" for g in self.company_grams])
+
+    def description_sig(self):
+        if self._description_sig is False:
+            words = _words(resolve_text(self.description))[:300]
+            self._description_sig = minhash([" ".join(words[i:i + 4]) for i in range(max(len(words) - 3, 0))])
+        return self._description_sig
+
+
+def _same_job(a, b):
+    if a.location and b.location and a.location != b.location:
+        return False
+    if jaccard(a.company_grams, b.company_grams) < COMPANY_THRESHOLD:
+        return False
+    if (set(a.title.split()) ^ set(b.title.split())) & LEVEL_WORDS:
+        return False
+    title_sim = jaccard(a.title_grams, b.title_grams)
+    if title_sim >= TITLE_THRESHOLD:
+        return True
+    if title_sim >= TITLE_THRESHOLD_SAME_JD and a.description and b.description:
+        sig_a, sig_b = a.description_sig(), b.description_sig()
+        if sig_a and sig_b:
+            return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM >= DESCRIPTION_THRESHOLD
+    return False
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH over normalized title and company trigrams of scouted jobs, for spotting
+    the same posting on several platforms ("Data Engineer (m/w/d)" at "Acme GmbH" vs
+    "Data Engineer" at "ACME"). Banded signature buckets give the candidates; each is then
+    verified on company/title similarity, location, seniority words and, for borderline
+    titles, description shingles. Earlier jobs are canonical: find() returns the first match.
+    """
+    def __init__(self):
+        self.entries = []
+        self.buckets = {}  # (band, rows) -> entry positions
+
+    @classmethod
+    def build(cls, jobs, job_id):
+        index = cls()
+        for job in jobs:
+            index.add(job, job_id(job))
+        return index
+
+    def _bands(self, signature):
+        return [(band, signature[band * _ROWS:(band + 1) * _ROWS]) for band in range(BANDS)]
+
+    def add(self, job, job_id):
+        """Indexes job under job_id (pass the canonical id for jobs that are duplicates themselves)."""
+        entry = _Entry(job, job_id)
+        signature = entry.signature()
+        if signature is None:
+            return
+        pos = len(self.entries)
+        self.entries.append(entry)
+        for key in self._bands(signature):
+            self.buckets.setdefault(key, []).append(pos)
+
+    def find(self, job):
+        """The earliest indexed entry that is the same posting as job, or None."""
+        probe = _Entry(job, None)
+        signature = probe.signature()
+        if signature is None:
+            return None
+        candidates = set()
+        for key in self._bands(signature):
+            candidates.update(self.buckets.get(key, ()))
+        for pos in sorted(candidates):
+            if _same_job(probe, self.entries[pos]):
+                return self.entries[pos]
+        return None
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# abspath of the scouted store -> NearDuplicateIndex over its jobs
+near_duplicate_cache = IndexCache()
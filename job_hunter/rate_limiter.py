@@ -0,0 +1,145 @@
+import os
+import random
+import threading
+import time
+
+from tools.logger import logger
+
+# Paced actions (page loads, clicks, prompts) per minute and burst, per platform or LLM provider.
+# Override with RATE_LIMIT_<KEY>="per_minute/burst", e.g. RATE_LIMIT_LINKEDIN="10/2".
+RATE_LIMITS = {
+    "LinkedIn": (15, 3),
+    "Indeed": (20, 4),
+    "Stepstone": (20, 4),
+    "Xing": (20, 4),
+    "ZipRecruiter": (20, 4),
+    "ChatGPT": (8, 2),
+    "Gemini": (8, 2),
+    "Copilot": (8, 2),
+}
+DEFAULT_RATE_LIMIT = (20, 3)
+
+# Pace factor: 1 keeps the configured pauses and rate. A block or CAPTCHA doubles it (slower),
+# each clean response takes LOOSEN_STEP off it, down to MIN_FACTOR (pauses at half length) or
+# to just above the fastest pace that was blocked before, whichever is slower.
+MIN_FACTOR = float(os.getenv("RATE_LIMIT_MIN_FACTOR", "0.5"))
+MAX_FACTOR = 8.0
+TIGHTEN_STEP = 2.0
+LOOSEN_STEP = 0.9
+
+# Where pauses fall within their range: "uniform", "triangular" (mostly short) or "gauss" (mostly mid-range)
+JITTER_DISTRIBUTION = os.getenv("RATE_LIMIT_JITTER", "uniform")
+
+# Page URL / title fragments of CAPTCHA, login-wall and block pages
+BLOCK_MARKERS = ("captcha", "checkpoint/challenge", "authwall", "are you a robot", "unusual traffic",
+                 "just a moment", "access denied", "security check", "verify you are human",
+                 "sicherheitsüberprüfung", "too many requests")
+
+
+def looks_blocked(text):
+    text = str(text or "").lower()
+    return any(marker in text for marker in BLOCK_MARKERS)
+
+
+def jitter(low, high, distribution=JITTER_DISTRIBUTION):
+    """A random pause length in [low, high]."""
+    if high <= low:
+        return low
+    if distribution == "triangular":
+        return random.triangular(low, high, low)
+    if distribution == "gauss":
+        return min(high, max(low, random.gauss((low + high) / 2, (high - low) / 6)))
+    return random.uniform(low, high)
+
+
+def _configured_limit(key):
+    try:
+        per_minute, burst = os.environ[f"RATE_LIMIT_{key.upper()}"].split("/")
+        return float(per_minute), max(1, int(burst))
+    except:
+        return RATE_LIMITS.get(key, DEFAULT_RATE_LIMIT)
+
+
+class Pace:
+    """
+    Token bucket plus adaptive pace factor of one platform or LLM provider, shared by
+    every thread working on it (e.g. two scouting workers on LinkedIn).
+    """
+    def __init__(self, key, per_minute, burst, min_factor=MIN_FACTOR, max_factor=MAX_FACTOR, clock=time.monotonic):
+        self.key = key
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.factor = 1.0
+        self.floor = min_factor  # loosening stops here: faster paces were blocked
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+        self.blocks = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns the seconds until it is due (0 if one was available)."""
+        with self._lock:
+            now = self.clock()
+            rate = self.rate / self.factor
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            self.tokens -= 1  # below zero: a reservation the caller waits out
+            return 0.0 if self.tokens >= 0 else -self.tokens / rate
+
+    def tighten(self):
+        with self._lock:
+            self.floor = min(self.max_factor, max(self.floor, self.factor / LOOSEN_STEP))
+            self.factor = min(self.max_factor, self.factor * TIGHTEN_STEP)
+            self.tokens = min(self.tokens, 0.0)  # no burst right after a block
+            self.blocks += 1
+
+    def loosen(self):
+        with self._lock:
+            self.factor = max(self.floor, self.factor * LOOSEN_STEP)
+
+
+class RateLimiter:
+    """
+    Central pacing of browser work per platform and per LLM provider, instead of fixed
+    random sleeps: wait(key, low, high) takes a token of the key's bucket and pauses a
+    jittered time in [low, high], both scaled by the key's pace factor. blocked(key) on a
+    CAPTCHA / block / rate-limit signal slows the key down; clean(key) speeds it up again.
+    """
+    def __init__(self, sleep=time.sleep, clock=time.monotonic):
+        self.sleep = sleep
+        self.clock = clock
+        self._paces = {}
+        self._lock = threading.Lock()
+
+    def pace(self, key):
+        with self._lock:
+            if key not in self._paces:
+                self._paces[key] = Pace(key, *_configured_limit(key), clock=self.clock)
+            return self._paces[key]
+
+    def delay(self, key, low, high):
+        """Seconds to wait before the next action on key (reserves its token)."""
+        pace = self.pace(key)
+        return max(pace.reserve(), jitter(low, high) * pace.factor)
+
+    def wait(self, key, low, high):
+        self.sleep(self.delay(key, low, high))
+
+    def blocked(self, key, reason=""):
+        pace = self.pace(key)
+        pace.tighten()
+        logger.warning(f"🐢 {key} pushed back{f' ({reason})' if reason else ''}: slowing down to x{pace.factor:g} pauses")
+
+    def clean(self, key):
+        self.pace(key).loosen()
+
+    def snapshot(self):
+        """{key: {"factor": ..., "blocks": ...}} for the UI and logs."""
+        with self._lock:
+            return {key: {"factor": round(p.factor, 2), "blocks": p.blocks} for key, p in self._paces.items()}
+
+
+rate_limiter = RateLimiter()
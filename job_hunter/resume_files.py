@@ -0,0 +1,111 @@
+import hashlib
+import mmap
+import os
+import threading
+
+# Windows cannot replace or delete a file while it is mapped, so read it there instead
+USE_MMAP = os.name != "nt"
+
+
+class ResumeFile:
+    """
+    Lazy handle on an uploaded resume PDF, stored in resume entries under "pdf" instead of
+    the raw bytes. Nothing is read until something asks for the bytes, the hash or the
+    text; the result is then kept (memory-mapped where possible) and shared by every
+    session holding the handle. Any change of the file's mtime/size/inode drops it.
+    """
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._data = None     # mmap or bytes
+        self._sha256 = None
+        self._text = None
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _check(self):
+        """Drops everything cached from an older version of the file. Call under _lock."""
+        signature = self._stat()
+        if signature != self._signature:
+            if isinstance(self._data, mmap.mmap):
+                try:
+                    self._data.close()
+                except BufferError:
+                    pass  # a caller still holds a view; the map goes away with it
+            self._signature = signature
+            self._data = self._sha256 = self._text = None
+        return signature
+
+    def exists(self):
+        return self._stat() is not None
+
+    @property
+    def size(self):
+        signature = self._stat()
+        return signature[1] if signature else 0
+
+    def read(self):
+        """The PDF content as a bytes-like object (b"" if the file is gone)."""
+        with self._lock:
+            if self._check() is None:
+                return b""
+            if self._data is None:
+                with open(self.path, "rb") as f:
+                    if USE_MMAP and self._signature[1] > 0:
+                        self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    else:
+                        self._data = f.read()
+            return self._data
+
+    @property
+    def sha256(self):
+        data = self.read()
+        with self._lock:
+            if self._sha256 is None and data:
+                self._sha256 = hashlib.sha256(data).hexdigest()
+            return self._sha256 or ""
+
+    @property
+    def text(self):
+        """Parsed resume text, parsed once per file version."""
+        with self._lock:
+            if self._check() is None:
+                return ""
+            if self._text is not None:
+                return self._text
+        from job_hunter.resume_parser import parse_resume
+        text = parse_resume(self.path)
+        with self._lock:
+            self._text = text
+        return text
+
+    def __repr__(self):
+        return f"ResumeFile({self.path!r})"
+
+
+_handles = {}
+_handles_guard = threading.Lock()
+
+
+def resume_file(path):
+    """The shared handle for a resume path (one per file for the whole process)."""
+    path = os.path.abspath(path)
+    with _handles_guard:
+        handle = _handles.get(path)
+        if handle is None:
+            handle = _handles[path] = ResumeFile(path)
+        return handle
+
+
+def resume_pdf_bytes(resume_data):
+    """PDF content of a resume entry: its lazy handle, or inline bytes from older sessions."""
+    handle = resume_data.get("pdf")
+    if handle is not None:
+        return handle.read()
+    return resume_data.get("pdf_bytes") or b""
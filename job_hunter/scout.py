@@ -1,43 +1,63 @@
 from tools.logger import logger
-import time
-import random
+from job_hunter.rate_limiter import rate_limiter
 from job_hunter.scrapers.linkedin import LinkedInScraper
 from job_hunter.scrapers.indeed import IndeedScraper
 from job_hunter.scrapers.stepstone import StepstoneScraper
 from job_hunter.scrapers.xing import XingScraper
 from job_hunter.scrapers.ziprecruiter import ZipRecruiterScraper
 from job_hunter.data_manager import DataManager
+from job_hunter.search_cache import SearchCache
 from tools.browser_manager import BrowserManager
 
 class Scout:
-    def __init__(self):
+    def __init__(self, profile_name="default", search_cache=None):
         self.db = DataManager()
+        self.search_cache = search_cache or SearchCache()
         self.scrapers = {
-            "LinkedIn": LinkedInScraper(profile_name="default"),
-            "Indeed": IndeedScraper(profile_name="default"),
-            "Stepstone": StepstoneScraper(profile_name="default"),
-            "Xing": XingScraper(profile_name="default"),
-            "ZipRecruiter": ZipRecruiterScraper(profile_name="default")
+            "LinkedIn": LinkedInScraper(profile_name=profile_name),
+            "Indeed": IndeedScraper(profile_name=profile_name),
+            "Stepstone": StepstoneScraper(profile_name=profile_name),
+            "Xing": XingScraper(profile_name=profile_name),
+            "ZipRecruiter": ZipRecruiterScraper(profile_name=profile_name)
         }
 
-    def launch_mission(self, keyword, location, limit, platforms, easy_apply=False, deep_scrape=True, status_callback=None):
+    def launch_mission(self, keyword, location, limit, platforms, easy_apply=False, deep_scrape=True, status_callback=None, extra_fields=None, on_job=None):
         """
         Launches a job scouting mission.
         - easy_apply: If True, filters for Easy Apply jobs.
         - deep_scrape: If True, fetches full JD and language subsequently (Integrated).
         - status_callback: Optional function(msg) for UI progress updates.
+        - extra_fields: Optional dict added to every job (e.g. the resume it was scouted for), or a
+          list of them: one copy of every job per dict (one search serving several resumes).
+        - on_job: Optional function(job) called for each job as soon as its details are scraped
+          (streams jobs into analysis while the rest is still fetched; it may block for back-pressure).
+        Searches that ran within the search cache TTL are served from it, details included.
         """
         all_results = []
+        searched = []  # (platform, jobs) of searches that actually ran, cached once their details are in
+        variants = extra_fields if isinstance(extra_fields, list) else [extra_fields or {}]
+
+        def tagged(job):
+            return [dict(job, **fields) for fields in variants]
         
         def log(msg):
             logger.info(msg)
             if status_callback:
                 status_callback(msg)
 
+        def emit(job):
+            if on_job:
+                for copy in tagged(job):  # snapshots: saving stamps the jobs afterwards
+                    on_job(copy)
+
         try:
             # Sequential Scouting (Normal Mode - to avoid login issues)
             for p_name in platforms:
-                if p_name in self.scrapers:
+                cached = self.search_cache.get(p_name, keyword, location, easy_apply, limit)
+                if cached is not None:
+                    all_results.extend(cached)
+                    log(f"♻️ Reusing {len(cached)} recent {p_name} results for '{keyword}'")
+                elif p_name in self.scrapers:
                     log(f"🔍 Scouting {p_name} for '{keyword}'...")
                     try:
                         # Scrapers now return JobRecord objects
@@ -51,6 +71,8 @@ class Scout:
                             res.append(job_dict)
 
                         all_results.extend(res)
+                        if res:
+                            searched.append((p_name, res))
                         log(f"✅ Found {len(res)} jobs on {p_name}")
                     except Exception as e:
                         log(f"⚠️ Error checking {p_name}: {e}")
@@ -59,6 +81,10 @@ class Scout:
 
             # Integrated Deep Scrape phase (Sequential)
             if deep_scrape and all_results:
+                # Postings already known (e.g. from another platform) reuse the scraped description
+                linked = self.db.link_near_duplicates(all_results)
+                if linked:
+                    log(f"🔗 Linked {linked} jobs to already scouted postings")
                 log(f"🕵️ Deep Scraping {len(all_results)} jobs...")
 
                 # Integrated Deep Scrape phase (using unified scraper methods)
@@ -67,9 +93,13 @@ class Scout:
                     p_name = job.get("platform")
                     title = job.get("title")
 
+                    if job.get("rich_description"):
+                        emit(job)
+                        continue
+
                     if url and p_name in self.scrapers:
                         log(f"  [{i+1}/{len(all_results)}] Fetching {p_name}: {title}")
-                        time.sleep(random.uniform(2, 4)) # Jitter
+                        rate_limiter.wait(p_name, 2, 4)
 
                         try:
                             details = self.scrapers[p_name].fetch_details(url)
@@ -82,15 +112,35 @@ class Scout:
                                         job["company"] = details.get("company")
                         except Exception as e:
                             log(f"  ⚠️ Error fetching details for {title}: {e}")
+                    emit(job)
+
+            elif not deep_scrape:
+                for job in all_results:
+                    emit(job)
+
+            for p_name, res in searched:
+                self.search_cache.put(p_name, keyword, location, easy_apply, res, limit)
 
             # Save to DB (Single call ensures deep details are saved)
             log("💾 Saving mission results...")
+            # One record per posting, tagged with every resume it was scouted for
+            all_results = [self._merge_tags(job, variants) for job in all_results]
             self.db.save_scouted_jobs(all_results, append=True)
-            log(f"✅ Mission Complete! {len(all_results)} jobs recorded.")
+            log(f"✅ Mission Complete! {len(all_results)} jobs recorded"
+                + (f" for {len(variants)} resumes." if len(variants) > 1 else "."))
 
             return all_results
             
         finally:
-            # Cleanup - Close ALL Browsers (Ferrari: ensures no leaks)
-            logger.info("Mission Complete. Force closing all browsers...")
-            BrowserManager().close_all_drivers()
+            # Cleanup - Close this thread's browser (Ferrari: ensures no leaks; scouting workers close only their own)
+            logger.info("Mission Complete. Force closing browser...")
+            BrowserManager().close_driver()
+
+    @staticmethod
+    def _merge_tags(job, variants):
+        """The job with the first resume's tags and the role names of all of them (_role_names)."""
+        record = dict(job, **variants[0])
+        names = [fields["_role_name"] for fields in variants if fields.get("_role_name")]
+        if names:
+            record["_role_names"] = names
+        return record
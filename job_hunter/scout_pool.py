@@ -0,0 +1,212 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# Concurrent scouting searches in total and per platform (a resumed mission keeps its own)
+SCOUT_WORKERS = int(os.getenv("SCOUT_WORKERS", "3"))
+SCOUT_WORKERS_PER_PLATFORM = int(os.getenv("SCOUT_WORKERS_PER_PLATFORM", "1"))
+# A failed search is retried; its platform gets no new work meanwhile
+RETRY_DELAY = 30
+# Scraped jobs waiting for (or in) analysis before the scrapers are held back
+PIPELINE_QUEUE_SIZE = 20
+
+# Worker events (item = backlog item), then downstream stage events (item = emitted job)
+STARTED, STATUS, EMITTED, DONE, FAILED = "started", "status", "emitted", "done", "failed"
+STAGE_DONE, STAGE_FAILED, STAGE_SKIPPED = "stage_done", "stage_failed", "stage_skipped"
+
+
+class ScoutWorker:
+    """One worker thread with its own Chrome profile: worker 1 keeps the app's default profile."""
+    def __init__(self, index):
+        self.index = index
+        self.name = f"worker-{index + 1}"
+        self.profile_name = "default" if index == 0 else f"scout_{self.name}"
+        self.state = {}  # per-thread objects of the work function (e.g. its Scout)
+        self._inbox = queue.Queue()
+        self._thread = None
+
+    def start(self, work, events, context, stage=None):
+        self._thread = threading.Thread(target=self._run, args=(work, events, context, stage),
+                                        name=f"scout-{self.name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        self._inbox.put(item)
+
+    def stop(self):
+        """The thread exits (closing its browser) once its current item is done."""
+        self._inbox.put(None)
+
+    def _run(self, work, events, context, stage):
+        with context(self):
+            while True:
+                item = self._inbox.get()
+                if item is None:
+                    return
+                report = lambda message: events.put((STATUS, self, item, message))
+
+                def emit(result):
+                    # Announced before it is queued, so the caller records it before the stage's result
+                    events.put((EMITTED, self, item, result))
+                    if stage:
+                        stage.put(result)
+                try:
+                    events.put((DONE, self, item, work(self, item, report, emit)))
+                except Exception as e:
+                    events.put((FAILED, self, item, e))
+
+
+class Stage:
+    """
+    Downstream stage of a ScoutPool: one thread working through what the workers emit
+    (e.g. AI analysis of each scraped job). At most `size` emitted items wait or are in
+    progress; emit() blocks beyond that, holding the scrapers back (back-pressure).
+    gate() runs before each item on the stage thread (it may block, e.g. while the mission
+    is paused); False skips the item.
+    """
+    def __init__(self, name, work, size=PIPELINE_QUEUE_SIZE, gate=lambda: True, context=lambda stage: nullcontext()):
+        self.name = name
+        self.work = work
+        self.gate = gate
+        self.context = context
+        self.state = {}
+        self._queue = queue.Queue()
+        self._slots = threading.Semaphore(size)
+        self._thread = None
+
+    def put(self, item, bounded=True):
+        """Queues an item; bounded=False for items carried over from an interrupted run (no waiting)."""
+        if bounded:
+            self._slots.acquire()
+        self._queue.put((item, bounded))
+
+    def start(self, events):
+        self._thread = threading.Thread(target=self._run, args=(events,), name=f"stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._queue.put(None)
+
+    def _run(self, events):
+        with self.context(self):
+            while True:
+                entry = self._queue.get()
+                if entry is None:
+                    return
+                item, bounded = entry
+                try:
+                    if self.gate():
+                        events.put((STAGE_DONE, self, item, self.work(self, item)))
+                    else:
+                        events.put((STAGE_SKIPPED, self, item, None))
+                except Exception as e:
+                    events.put((STAGE_FAILED, self, item, e))
+                finally:
+                    if bounded:
+                        self._slots.release()
+
+
+class ScoutPool:
+    """
+    Runs scouting backlog items ({"platform": ..., ...}) on up to `workers` threads at a
+    time, at most `per_platform` of them on the same platform, so searches on different
+    platforms run side by side in their own browsers.
+
+    With a Stage, the pool is a pipeline: each worker streams its results (scraped jobs)
+    into the stage as it goes, so the stage works alongside the scrapers instead of after
+    them.
+
+    run() is a generator driven by the mission thread: it dispatches items and yields
+    (event, worker, item, payload) tuples as workers start, report, emit, finish or fail
+    and as the stage finishes items, so all mission state and UI updates stay on the
+    calling thread. A failed item is retried after RETRY_DELAY. Nothing is removed from
+    the caller's backlogs here: the caller does that on DONE / STAGE_DONE, which keeps an
+    interrupted mission resumable.
+    """
+    def __init__(self, workers=SCOUT_WORKERS, per_platform=SCOUT_WORKERS_PER_PLATFORM, retry_delay=RETRY_DELAY):
+        self.workers = max(1, int(workers))
+        self.per_platform = max(1, int(per_platform))
+        self.retry_delay = retry_delay
+
+    def run(self, items, work, can_dispatch=lambda: True, context=lambda worker: nullcontext(), stage=None, carried=()):
+        """
+        work(worker, item, report, emit) runs on a worker thread (inside context(worker))
+        and returns the item's result; report(message) sends a STATUS event, emit(result)
+        an EMITTED event and passes result on to the stage. can_dispatch() is asked before
+        each dispatch (it may block, e.g. while the mission is paused); returning False
+        stops dispatching, and run() returns once running items are done. `carried` are
+        stage items left over from an interrupted run: they are queued first.
+        """
+        pending = deque(items)
+        events = queue.Queue()
+        idle = deque(ScoutWorker(i) for i in range(min(self.workers, len(pending))))
+        started = list(idle)
+        running = {}    # worker -> item
+        cooldown = {}   # platform -> monotonic time it may get work again
+        in_stage = 0    # emitted (or carried) items the stage has not finished
+        stopped = False
+        if stage:
+            stage.start(events)
+            for item in carried:
+                stage.put(item, bounded=False)
+                in_stage += 1
+        for worker in started:
+            worker.start(work, events, context, stage)
+        try:
+            while running or (pending and not stopped) or in_stage:
+                while pending and idle and not stopped:
+                    item = self._next(pending, running, cooldown)
+                    if item is None:
+                        break
+                    if not can_dispatch():
+                        stopped = True
+                        break
+                    pending.remove(item)
+                    worker = idle.popleft()
+                    running[worker] = item
+                    yield STARTED, worker, item, None
+                    worker.submit(item)
+                # Wake up for the next event, or when a platform cooling down after a failure has work again
+                ready_at = [cooldown[item.get("platform")] for item in pending
+                            if cooldown.get(item.get("platform"), 0) > time.monotonic()] if not stopped else []
+                timeout = max(0.0, min(ready_at) - time.monotonic()) if ready_at else None
+                if not running and not in_stage:
+                    if ready_at:
+                        time.sleep(timeout)
+                    continue
+                try:
+                    event = events.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                kind, worker, item, payload = event
+                if kind in (DONE, FAILED):
+                    running.pop(worker, None)
+                    idle.append(worker)
+                    if kind == FAILED:
+                        pending.append(item)
+                        cooldown[item.get("platform")] = time.monotonic() + self.retry_delay
+                elif kind == EMITTED and stage:
+                    in_stage += 1
+                elif kind in (STAGE_DONE, STAGE_FAILED, STAGE_SKIPPED):
+                    in_stage -= 1
+                yield event
+        finally:
+            for worker in started:
+                worker.stop()
+            if stage:
+                stage.stop()
+
+    def _next(self, pending, running, cooldown):
+        """First pending item whose platform has a free slot and is not cooling down after a failure."""
+        busy = {}
+        for item in running.values():
+            busy[item.get("platform")] = busy.get(item.get("platform"), 0) + 1
+        now = time.monotonic()
+        for item in pending:
+            platform = item.get("platform")
+            if busy.get(platform, 0) < self.per_platform and cooldown.get(platform, 0) <= now:
+                return item
+        return None
@@ -3,6 +3,7 @@ from typing import List, Optional
 from job_hunter.models import JobRecord
 from tools.logger import logger
 from job_hunter.data_manager import DataManager
+from job_hunter.rate_limiter import looks_blocked, rate_limiter
 
 class BaseScraper(ABC):
     """Abstract base class for all job scrapers."""
@@ -23,10 +24,20 @@ class BaseScraper(ABC):
         """Fetch the full description for a job URL."""
         pass
 
-    def random_sleep(self, min_sec=2, max_sec=5):
-        import time
-        import random
-        time.sleep(random.uniform(min_sec, max_sec))
+    def pace(self, min_sec=2, max_sec=5):
+        """
+        Pause after a page action, paced by the platform's rate limiter, then a look at the
+        page: a CAPTCHA or block page slows the platform down, a clean one speeds it up.
+        """
+        rate_limiter.wait(self.platform_name, min_sec, max_sec)
+        try:
+            page = f"{self.driver.current_url} {self.driver.title}"
+        except:
+            return  # no page to judge
+        if looks_blocked(page):
+            rate_limiter.blocked(self.platform_name, "CAPTCHA or block page")
+        else:
+            rate_limiter.clean(self.platform_name)
 
     def log(self, msg, level="info"):
         full_msg = f"[{self.platform_name}] {msg}"
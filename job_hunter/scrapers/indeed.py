@@ -31,14 +31,14 @@ class IndeedScraper(BaseScraper):
         
         self.log(f"Navigating to: {base_url}")
         self.driver.get(base_url)
-        self.random_sleep(4, 6)
+        self.pace(4, 6)
         
         start = 0
         while len(results) < limit:
             url = base_url + f"&start={start}"
             if start > 0:
                 self.driver.get(url)
-                self.random_sleep(3, 5)
+                self.pace(3, 5)
 
             cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon") or \
                     self.driver.find_elements(By.CSS_SELECTOR, "td.resultContent")
@@ -96,7 +96,7 @@ class IndeedScraper(BaseScraper):
 
         self.bm.load_cookies("https://de.indeed.com/")
         self.driver.get(job_url)
-        self.random_sleep(3, 5)
+        self.pace(3, 5)
 
         details = {
             "description": "",
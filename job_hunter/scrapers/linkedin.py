@@ -45,7 +45,7 @@ class LinkedInScraper(BaseScraper):
             url = base_url + urllib.parse.urlencode(current_params)
             self.log(f"Navigating to: {url}")
             self.driver.get(url)
-            self.random_sleep(3, 5)
+            self.pace(3, 5)
             
             if easy_apply:
                 self._ensure_easy_apply_filter()
@@ -131,7 +131,7 @@ class LinkedInScraper(BaseScraper):
                         self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", job_list_container)
                      except: pass
                 
-                self.random_sleep(2, 4)
+                self.pace(2, 4)
                 scrolled += 1
             
             if jobs_found_on_page == 0:
@@ -140,7 +140,7 @@ class LinkedInScraper(BaseScraper):
                 
             offset += 25
             self.log(f"Moving to next page (Offset {offset})...")
-            self.random_sleep(2, 4)
+            self.pace(2, 4)
 
         return results
 
@@ -173,7 +173,7 @@ class LinkedInScraper(BaseScraper):
                     expand_btn = self.driver.find_element(By.CSS_SELECTOR, sel)
                     if expand_btn.is_displayed():
                         self.driver.execute_script("arguments[0].click();", expand_btn)
-                        self.random_sleep(1, 1.5)
+                        self.pace(1, 1.5)
                         break
                 except:
                     pass
@@ -251,7 +251,7 @@ class LinkedInScraper(BaseScraper):
                         classes = btn.get_attribute("class") or ""
                         if "selected" not in classes.lower() and "active" not in classes.lower():
                             self.driver.execute_script("arguments[0].click();", btn)
-                            self.random_sleep(3, 5)
+                            self.pace(3, 5)
                             return True
                 except: continue
         except: pass
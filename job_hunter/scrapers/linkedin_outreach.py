@@ -7,7 +7,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tools.browser_manager import BrowserManager
 from job_hunter.data_manager import DataManager
-import random
+from job_hunter.rate_limiter import rate_limiter
 from tools.human_actions import type_human_like, random_wait
 
 class LinkedInOutreach:
@@ -17,7 +17,7 @@ class LinkedInOutreach:
         self.driver = None
 
     def random_sleep(self, min_s=2, max_s=5):
-        time.sleep(random.uniform(min_s, max_s))
+        rate_limiter.wait("LinkedIn", min_s, max_s)  # shares LinkedIn's pace with the job scraper
 
     def get_first_name(self, full_name):
         if not full_name:
@@ -41,7 +41,7 @@ class StepstoneScraper(BaseScraper):
         
         self.log(f"Navigating to: {url}")
         self.driver.get(url)
-        self.random_sleep(3, 5)
+        self.pace(3, 5)
         
         scrolled = 0
         while len(results) < limit and scrolled < 3:
@@ -122,7 +122,7 @@ class StepstoneScraper(BaseScraper):
                 except: continue
             
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.random_sleep(2, 3)
+            self.pace(2, 3)
             scrolled += 1
             
         return results
@@ -130,7 +130,7 @@ class StepstoneScraper(BaseScraper):
     def fetch_details(self, job_url: str) -> Optional[dict]:
         if not job_url: return None
         self.driver.get(job_url)
-        self.random_sleep(2, 4)
+        self.pace(2, 4)
 
         details = {"description": "", "is_easy_apply": False, "language": "de"}
         
@@ -154,7 +154,7 @@ class StepstoneScraper(BaseScraper):
         for i in range(3):
             self.driver.execute_script(f"window.scrollTo(0, {(i + 1) * 800});")
             time.sleep(0.5)
-        self.random_sleep(1, 2)
+        self.pace(1, 2)
 
         # --- EXTRACT JOB DESCRIPTION ---
         desc_selectors = [
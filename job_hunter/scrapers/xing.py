@@ -23,7 +23,7 @@ class XingScraper(BaseScraper):
         
         self.log(f"Navigating to: {search_url}")
         self.driver.get(search_url)
-        self.random_sleep(4, 6)
+        self.pace(4, 6)
 
         # Xing has no Easy Apply filter in the main search URL easily,
         # so we often have to check cards or filter subsequently.
@@ -33,7 +33,7 @@ class XingScraper(BaseScraper):
 
         while len(results) < limit and page < 5:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.random_sleep(2, 3)
+            self.pace(2, 3)
 
             cards = self.driver.find_elements(By.CSS_SELECTOR, "article[data-testid='job-posting-card']") or \
                     self.driver.find_elements(By.CSS_SELECTOR, ".job-posting-card")
@@ -86,7 +86,7 @@ class XingScraper(BaseScraper):
             try:
                 next_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next'], a[rel='next']")
                 self.driver.execute_script("arguments[0].click();", next_btn)
-                self.random_sleep(3, 5)
+                self.pace(3, 5)
                 page += 1
             except:
                 break
@@ -98,7 +98,7 @@ class XingScraper(BaseScraper):
         
         self.bm.load_cookies("https://www.xing.com/")
         self.driver.get(job_url)
-        self.random_sleep(3, 5)
+        self.pace(3, 5)
 
         details = {
             "description": "",
@@ -21,7 +21,7 @@ class ZipRecruiterScraper(BaseScraper):
         
         self.log(f"Navigating to: {base_url}")
         self.driver.get(base_url)
-        self.random_sleep(3, 5)
+        self.pace(3, 5)
         
         scrolled = 0
         while len(results) < limit and scrolled < 3:
@@ -54,7 +54,7 @@ class ZipRecruiterScraper(BaseScraper):
                 except: continue
 
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.random_sleep(2, 3)
+            self.pace(2, 3)
             scrolled += 1
             
         return results
@@ -62,7 +62,7 @@ class ZipRecruiterScraper(BaseScraper):
     def fetch_details(self, job_url: str) -> Optional[dict]:
         if not job_url: return None
         self.driver.get(job_url)
-        self.random_sleep(2, 4)
+        self.pace(2, 4)
 
         details = {"description": "", "is_easy_apply": False, "language": "en"}
         try:
@@ -0,0 +1,77 @@
+import os
+from datetime import datetime, timedelta
+
+from job_hunter.blob_store import BLOB_FIELDS, blob_store
+from job_hunter.storage import atomic_write_json, read_json, write_lock
+
+SEARCH_CACHE_FILE = "data/search_cache.json"
+# How long a platform search's results are reused (0 disables the cache)
+SEARCH_CACHE_TTL_HOURS = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "12"))
+
+
+def _norm(value):
+    return " ".join(str(value or "").lower().split())
+
+
+def query_key(platform, keyword, location, easy_apply=False):
+    """Identity of a platform search: 'linkedin|data engineer|berlin|0' (case and spacing don't matter)."""
+    return "|".join((_norm(platform), _norm(keyword), _norm(location), "1" if easy_apply else "0"))
+
+
+def load_search_cache(path=SEARCH_CACHE_FILE):
+    """The raw cache file: {query key: {"searched_at": iso time, "jobs": [...]}} (texts as blob references)."""
+    try:
+        return read_json(path)
+    except:
+        return {}  # missing (nothing cached yet) or unreadable: search again
+
+
+class SearchCache:
+    """
+    Results of recent platform searches (jobs after the deep scrape, without resume tags),
+    so the same search for another resume, or again within the TTL, neither hits the
+    platform nor re-fetches the job details. Long texts live in the blob store like in
+    the other stores.
+    """
+    def __init__(self, path=SEARCH_CACHE_FILE, ttl_hours=SEARCH_CACHE_TTL_HOURS):
+        self.path = path
+        self.ttl = timedelta(hours=ttl_hours)
+
+    def _fresh(self, entry, now):
+        try:
+            return now - datetime.fromisoformat(entry["searched_at"]) < self.ttl
+        except:
+            return False
+
+    def get(self, platform, keyword, location, easy_apply=False, limit=None):
+        """
+        Copies of the cached jobs of this search (long texts resolved) if it ran within the
+        TTL with at least `limit` results asked for, else None.
+        """
+        if self.ttl <= timedelta(0):
+            return None
+        entry = load_search_cache(self.path).get(query_key(platform, keyword, location, easy_apply))
+        if not entry or not self._fresh(entry, datetime.now()):
+            return None
+        if limit is not None and entry.get("limit") is not None and entry["limit"] < limit:
+            return None  # a smaller search: it may have stopped short of what is asked for now
+        jobs = entry.get("jobs", [])[:limit]
+        return [{key: blob_store.resolve(value) if key in BLOB_FIELDS else value for key, value in job.items()}
+                for job in jobs]
+
+    def put(self, platform, keyword, location, easy_apply, jobs, limit=None):
+        """Stores a search's jobs (and the limit it ran with); expired searches are dropped on the way."""
+        if self.ttl <= timedelta(0):
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with write_lock(self.path):
+            now = datetime.now()
+            cache = {key: entry for key, entry in load_search_cache(self.path).items() if self._fresh(entry, now)}
+            cache[query_key(platform, keyword, location, easy_apply)] = {"searched_at": now.isoformat(), "limit": limit,
+                                                                         "jobs": list(jobs)}
+            atomic_write_json(self.path, blob_store.externalize(cache), pretty=False)
+
+    def clear(self):
+        with write_lock(self.path):
+            if os.path.exists(self.path):
+                os.remove(self.path)
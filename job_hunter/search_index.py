@@ -0,0 +1,209 @@
+import functools
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from job_hunter.blob_store import resolve_text
+
+SCOUTED = "scouted"
+APPLIED = "applied"
+# What the scouted documents are built from (iter_scouted field projection)
+SEARCH_FIELDS = ("title", "company", "link", "platform", "Platform", "job_key", "rich_description", "description")
+# Same word boundaries as FTS5's unicode61 tokenizer (with diacritics kept)
+FTS_TOKENIZER = "unicode61 remove_diacritics 0"
+
+_TOKEN = re.compile(r"[^\W_]+")
+_QUERY_PART = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    UNIQUE (kind, doc_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS texts USING fts5(body, tokenize="{FTS_TOKENIZER}");
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def tokenize(text):
+    return _TOKEN.findall(str(text or "").lower())
+
+
+def search_text(job):
+    """Searchable text of a scouted job or an applied record's job_details: title, company, description."""
+    parts = (job.get("title") or job.get("Job Title"), job.get("company") or job.get("Company"),
+             resolve_text(job.get("rich_description") or job.get("Rich Description") or job.get("description")))
+    return "\n".join(part for part in parts if isinstance(part, str))
+
+
+def parse_query(query):
+    """
+    'python "data platform" -java -"on call"' -> (required, excluded), each a list of
+    phrases (token lists; a single keyword is a one-token phrase). NOT word / NOT "..."
+    work like the minus prefix.
+    """
+    required, excluded = [], []
+    negate = False
+    for match in _QUERY_PART.finditer(query or ""):
+        minus, quoted, word = match.groups()
+        if word is not None:
+            if word == "NOT":
+                negate = True
+                continue
+            minus, word = ("-", word[1:]) if word.startswith("-") else ("", word)
+            tokens = tokenize(word)
+        else:
+            tokens = tokenize(quoted)
+        if tokens:
+            (excluded if minus or negate else required).append(tokens)
+        negate = False
+    return required, excluded
+
+
+def fts_match(query):
+    """
+    Query text -> FTS5 MATCH expression: every required keyword/phrase AND-ed, excluded
+    ones behind NOT. None when nothing is required (a query of exclusions matches nothing).
+    Tokens are word characters only, so quoting them is safe.
+    """
+    required, excluded = parse_query(query)
+    if not required:
+        return None
+    phrase = lambda tokens: '"' + " ".join(tokens) + '"'
+    match = " AND ".join(phrase(tokens) for tokens in required)
+    if excluded:
+        match = f"({match}) NOT ({' OR '.join(phrase(tokens) for tokens in excluded)})"
+    return match
+
+
+@functools.lru_cache(maxsize=None)
+def fts5_available():
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE t USING fts5(body)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class SearchIndex:
+    """
+    Full-text index over the scouted and applied job texts (title, company, description)
+    in a sidecar SQLite FTS5 file, for the explorer search box: BM25-ranked keyword and
+    "phrase" queries, with -word / -"phrase" (or NOT) to drop jobs mentioning something.
+
+    Documents are (kind, id) pairs: scouted jobs by job key, applied records by job id.
+    The file records the store signatures it reflects. ensure() rebuilds it when a store
+    changed behind our back; our own writes patch it (set / discard) the way IndexCache
+    patches in-memory indexes, so it survives restarts without a rebuild.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self.connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    # --- signatures ---
+    def signatures(self):
+        row = self.connect().execute("SELECT value FROM meta WHERE key = 'signatures'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_signatures(self, conn, signatures):
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('signatures', ?)", (json.dumps(signatures),))
+
+    def ensure(self, signatures, docs):
+        """Rebuilds from docs() ((kind, id, text) triples) unless the index was written for exactly these signatures."""
+        if None not in signatures.values() and self.signatures() == json.loads(json.dumps(signatures)):
+            return self
+        with self.connect() as conn:
+            conn.execute("DELETE FROM docs")
+            conn.execute("DELETE FROM texts")
+            for kind, doc_id, text in docs():
+                self._set(conn, kind, doc_id, text)
+            self._set_signatures(conn, signatures)
+        return self
+
+    def patch(self, part, before_sig, after_sig, fn):
+        """Applies fn to the index if its `part` signature was current right before our write, else invalidates it."""
+        with self.connect() as conn:
+            signatures = self.signatures()
+            if signatures and before_sig is not None and signatures.get(part) == json.loads(json.dumps(before_sig)):
+                fn(self)
+                signatures[part] = after_sig
+                self._set_signatures(conn, signatures)
+            else:
+                conn.execute("DELETE FROM meta WHERE key = 'signatures'")
+
+    def invalidate(self):
+        with self.connect() as conn:
+            conn.execute("DELETE FROM meta WHERE key = 'signatures'")
+
+    # --- patches ---
+    def _set(self, conn, kind, doc_id, text):
+        row = conn.execute("SELECT id FROM docs WHERE kind = ? AND doc_id = ?", (kind, doc_id)).fetchone()
+        if row:
+            conn.execute("DELETE FROM texts WHERE rowid = ?", row)
+            rowid = row[0]
+        else:
+            rowid = conn.execute("INSERT INTO docs (kind, doc_id) VALUES (?, ?)", (kind, doc_id)).lastrowid
+        conn.execute("INSERT INTO texts (rowid, body) VALUES (?, ?)", (rowid, text))
+
+    def set(self, kind, doc_id, text):
+        with self.connect() as conn:
+            self._set(conn, kind, doc_id, text)
+        return self
+
+    def discard(self, kind, doc_id):
+        with self.connect() as conn:
+            row = conn.execute("SELECT id FROM docs WHERE kind = ? AND doc_id = ?", (kind, doc_id)).fetchone()
+            if row:
+                conn.execute("DELETE FROM texts WHERE rowid = ?", row)
+                conn.execute("DELETE FROM docs WHERE id = ?", row)
+        return self
+
+    # --- queries ---
+    def search(self, query, kinds=(SCOUTED, APPLIED), limit=50):
+        """
+        Best matches first as (kind, id, score). Every required keyword/phrase must occur;
+        jobs with an excluded one are dropped.
+        """
+        match = fts_match(query)
+        if match is None:
+            return []
+        marks = ", ".join("?" * len(kinds))
+        rows = self.connect().execute(
+            f"""SELECT d.kind, d.doc_id, t.rank FROM texts t JOIN docs d ON d.id = t.rowid
+                WHERE texts MATCH ? AND d.kind IN ({marks}) ORDER BY t.rank LIMIT ?""",
+            (match, *kinds, limit or -1))
+        return [(kind, doc_id, round(-rank, 4)) for kind, doc_id, rank in rows]
+
+
+_indexes = {}  # abspath -> SearchIndex (one per file, so each thread keeps its connection)
+_indexes_guard = threading.Lock()
+
+
+def search_index_for(path):
+    with _indexes_guard:
+        key = os.path.abspath(path)
+        if key not in _indexes:
+            _indexes[key] = SearchIndex(path)
+        return _indexes[key]
@@ -0,0 +1,685 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from job_hunter import codec
+from job_hunter.blob_store import blob_store
+from job_hunter.cache_policy import cache_policy_engine
+from job_hunter.identity_index import IdentityIndex, norm_key
+from job_hunter.job_key import job_key_of, resume_stem
+from job_hunter.journal import JsonJournal
+from job_hunter.json_stream import project
+from job_hunter.key_index import SortedKeyIndex
+from job_hunter.near_duplicates import NearDuplicateIndex
+from job_hunter.search_index import APPLIED, FTS_TOKENIZER, SCOUTED, fts_match, search_text
+from job_hunter.data_manager import (
+    DataManager, DATA_DIR, SCOUTED_FILE, APPLIED_FILE, PARKED_FILE,
+    BLACKLIST_FILE, CACHE_FILE, MESSAGED_CONTACTS_FILE
+)
+
+SQLITE_FILE = os.path.join(DATA_DIR, "career_commander.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scouted (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    link TEXT,
+    norm_key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scouted_job_id ON scouted(job_id);
+CREATE INDEX IF NOT EXISTS idx_scouted_link ON scouted(link);
+CREATE INDEX IF NOT EXISTS idx_scouted_norm_key ON scouted(norm_key);
+
+CREATE TABLE IF NOT EXISTS applied (
+    job_id TEXT PRIMARY KEY,
+    link TEXT,
+    norm_key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applied_link ON applied(link);
+CREATE INDEX IF NOT EXISTS idx_applied_norm_key ON applied(norm_key);
+
+CREATE TABLE IF NOT EXISTS parked (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    link TEXT,
+    norm_key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parked_job_id ON parked(job_id);
+CREATE INDEX IF NOT EXISTS idx_parked_link ON parked(link);
+CREATE INDEX IF NOT EXISTS idx_parked_norm_key ON parked(norm_key);
+
+CREATE TABLE IF NOT EXISTS cache (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry_key TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS blacklist (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, position)
+);
+
+CREATE TABLE IF NOT EXISTS messaged_contacts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messaged_contacts_name ON messaged_contacts(name);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Full-text search over job texts (see search_index.py). Rows are written by the
+# DataManager (descriptions live in the blob store); deletes cascade by trigger.
+SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS scouted_search USING fts5(body, tokenize="{FTS_TOKENIZER}");
+CREATE VIRTUAL TABLE IF NOT EXISTS applied_search USING fts5(body, job_id UNINDEXED, tokenize="{FTS_TOKENIZER}");
+CREATE TRIGGER IF NOT EXISTS scouted_search_delete AFTER DELETE ON scouted BEGIN
+    DELETE FROM scouted_search WHERE rowid = old.seq;
+END;
+CREATE TRIGGER IF NOT EXISTS applied_search_delete AFTER DELETE ON applied BEGIN
+    DELETE FROM applied_search WHERE job_id = old.job_id;
+END;
+"""
+
+BLACKLIST_KINDS = ("companies", "titles", "safe_phrases")
+
+
+def _job_link(job):
+    return job.get('link') or job.get('Web Address') or job.get('url')
+
+
+def _dumps(obj):
+    return codec.dumps(blob_store.externalize(obj)).decode("utf-8")
+
+
+_transactions = threading.local()  # database path -> _BatchConnection of this thread's open batch
+
+
+class _BatchConnection:
+    """
+    The thread's connection while a batch is open: `with conn:` blocks join the batch's
+    transaction instead of committing each on their own.
+    """
+    def __init__(self, conn, stats):
+        self._conn = conn
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def _count(self, sql):
+        if not sql.lstrip().upper().startswith(("SELECT", "PRAGMA")):
+            self._stats["staged_writes"] += 1
+
+    def execute(self, sql, *args):
+        self._count(sql)
+        return self._conn.execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        self._count(sql)
+        return self._conn.executemany(sql, *args)
+
+
+class SQLiteStore:
+    """
+    Thin wrapper around one embedded SQLite database holding every DataManager store.
+    One connection per thread; Streamlit reruns and mission threads can share a store.
+    """
+    def __init__(self, db_path=SQLITE_FILE):
+        self.db_path = os.path.abspath(db_path)
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self.connect() as conn:
+            conn.executescript(SCHEMA)
+            # Added with job keys: databases created before get the column on first open
+            if "job_key" not in {row[1] for row in conn.execute("PRAGMA table_info(cache)")}:
+                conn.execute("ALTER TABLE cache ADD COLUMN job_key TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_job_key ON cache(job_key)")
+            try:
+                conn.executescript(SEARCH_SCHEMA)
+                self.full_text = True
+            except sqlite3.OperationalError:
+                self.full_text = False  # SQLite built without FTS5: search_jobs finds nothing
+
+    def connect(self):
+        batch_conn = getattr(_transactions, "conns", {}).get(self.db_path)
+        if batch_conn is not None:
+            return batch_conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self, stats):
+        """
+        One transaction for all writes of this thread to the database (through any store
+        instance) until the block exits: committed at the end, rolled back if it raises.
+        Nested transactions join the outer one. Other writers wait while it is open.
+        """
+        conns = _transactions.__dict__.setdefault("conns", {})
+        if self.db_path in conns:
+            yield
+            return
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        conns[self.db_path] = _BatchConnection(conn, stats)
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+            stats["files_written"] += 1
+        finally:
+            del conns[self.db_path]
+
+    def get_meta(self, key, default=None):
+        row = self.connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self.connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+class SQLiteDataManager(DataManager):
+    """
+    DataManager backed by a single SQLite database instead of one JSON file per store.
+    Enabled with STORAGE_BACKEND=sqlite. Same public API; single-record changes
+    (save_applied, save_cache, park_job, ...) touch only the affected rows.
+    """
+    def __init__(self, db_path=SQLITE_FILE):
+        self.store = SQLiteStore(db_path)
+        super().__init__()
+        if not self.store.get_meta("migrated_at"):
+            migrate_json_to_sqlite(self.store)
+        if self.store.full_text and not self.store.get_meta("search_indexed_at"):
+            self.reindex_search()
+
+    def _ensure_files(self):
+        if not os.path.exists(DATA_DIR):
+            os.makedirs(DATA_DIR)
+
+    @property
+    def conn(self):
+        return self.store.connect()
+
+    @contextmanager
+    def batch(self):
+        """
+        with db.batch() as b: ...
+        Database writes of the block run in one transaction (see SQLiteStore.transaction):
+        committed once at exit, rolled back if the block raises. Stores still kept in files
+        (bot config, answers, ...) are batched as in DataManager.batch(). b.stats counts
+        the write statements (staged_writes) and the commit (files_written).
+        """
+        with super().batch() as batch, self.store.transaction(batch.stats):
+            yield batch
+
+    # --- SCOUTED JOBS ---
+    def load_scouted(self, fresh=False):
+        rows = self.conn.execute("SELECT data FROM scouted ORDER BY seq").fetchall()
+        return [codec.loads(r[0]) for r in rows]
+
+    def iter_scouted(self, fields=None):
+        for (data,) in self.conn.execute("SELECT data FROM scouted ORDER BY seq"):
+            yield project(codec.loads(data), fields)
+
+    def _insert_scouted(self, conn, job):
+        cur = conn.execute(
+            "INSERT INTO scouted (job_id, link, norm_key, data) VALUES (?, ?, ?, ?)",
+            (self.generate_job_id(job.get('title'), job.get('company')), job.get('link'),
+             norm_key(job.get('title'), job.get('company')), _dumps(job))
+        )
+        self._index_scouted_text(conn, cur.lastrowid, job)
+
+    def _index_scouted_text(self, conn, seq, job):
+        if self.store.full_text:
+            conn.execute("DELETE FROM scouted_search WHERE rowid = ?", (seq,))
+            conn.execute("INSERT INTO scouted_search (rowid, body) VALUES (?, ?)", (seq, search_text(job)))
+
+    def save_scouted_jobs(self, jobs_list, append=False):
+        jobs_list = self._filter_new_jobs(jobs_list)
+        for job in jobs_list:
+            self._stamp_job_key(job)
+
+        with self.conn as conn:
+            if not append:
+                conn.execute("DELETE FROM scouted")
+                for job in jobs_list:
+                    self._insert_scouted(conn, job)
+                return jobs_list
+
+            known = self.near_duplicate_index()
+            new = NearDuplicateIndex()
+            for job in jobs_list:
+                row = None
+                link = job.get('link')
+                if link:
+                    row = conn.execute("SELECT seq, data FROM scouted WHERE link = ? ORDER BY seq LIMIT 1", (link,)).fetchone()
+                if row is None and self._composite_key(job):
+                    row = conn.execute("SELECT seq, data FROM scouted WHERE norm_key = ? ORDER BY seq LIMIT 1",
+                                       (norm_key(job.get('title'), job.get('company')),)).fetchone()
+                if row:
+                    existing_job = codec.loads(row[1])
+                    self._update_scouted_record(existing_job, job)
+                    if not existing_job.get('job_key'):
+                        self._stamp_job_key(existing_job)
+                    conn.execute(
+                        "UPDATE scouted SET job_id = ?, link = ?, norm_key = ?, data = ? WHERE seq = ?",
+                        (self.generate_job_id(existing_job.get('title'), existing_job.get('company')),
+                         existing_job.get('link'), norm_key(existing_job.get('title'), existing_job.get('company')),
+                         _dumps(existing_job), row[0])
+                    )
+                    self._index_scouted_text(conn, row[0], existing_job)
+                else:
+                    self._link_near_duplicate(job, known, new)
+                    new.add(job, self._canonical_id(job))
+                    self._insert_scouted(conn, job)
+
+        return self.load_scouted()
+
+    def delete_scouted_job(self, title, company):
+        target_id = self.generate_job_id(title, company)
+        with self.conn as conn:
+            conn.execute("DELETE FROM scouted WHERE job_id = ?", (target_id,))
+        return self.load_scouted()
+
+    def clear_scouted_jobs(self):
+        with self.conn as conn:
+            conn.execute("DELETE FROM scouted")
+        return []
+
+    def archive_applied_jobs(self):
+        with self.conn as conn:
+            cur = conn.execute(
+                """DELETE FROM scouted WHERE job_id IN (SELECT job_id FROM applied)
+                   OR norm_key IN (SELECT norm_key FROM applied WHERE norm_key IS NOT NULL)"""
+            )
+            return cur.rowcount
+
+    def near_duplicate_index(self):
+        # Same as identity_index: nothing to validate a cached index against
+        return NearDuplicateIndex.build(self.load_scouted(), self._canonical_id)
+
+    def search_jobs(self, query, kinds=(SCOUTED, APPLIED), limit=50):
+        # FTS5 tables in the database itself, kept in step with the rows (no sidecar file)
+        match = fts_match(query)
+        if match is None or not self.store.full_text:
+            return []
+        hits = []
+        if SCOUTED in kinds:
+            rows = self.conn.execute(
+                """SELECT s.data, f.rank FROM (SELECT rowid, rank FROM scouted_search WHERE scouted_search MATCH ?
+                   ORDER BY rank LIMIT ?) f JOIN scouted s ON s.seq = f.rowid ORDER BY f.rank""", (match, limit or -1))
+            for data, rank in rows:
+                key = job_key_of(codec.loads(data))
+                if key:
+                    hits.append((SCOUTED, key, round(-rank, 4)))
+        if APPLIED in kinds:
+            rows = self.conn.execute(
+                """SELECT job_id, rank FROM applied_search WHERE applied_search MATCH ?
+                   ORDER BY rank LIMIT ?""", (match, limit or -1))
+            hits.extend((APPLIED, job_id, round(-rank, 4)) for job_id, rank in rows)
+        hits.sort(key=lambda hit: hit[2], reverse=True)
+        return hits[:limit] if limit else hits
+
+    def reindex_search(self):
+        """Rebuilds the FTS5 tables from the scouted and applied rows. Returns the number of indexed jobs."""
+        count = 0
+        with self.conn as conn:
+            conn.execute("DELETE FROM scouted_search")
+            conn.execute("DELETE FROM applied_search")
+            for seq, data in conn.execute("SELECT seq, data FROM scouted").fetchall():
+                self._index_scouted_text(conn, seq, codec.loads(data))
+                count += 1
+            for job_id, data in conn.execute("SELECT job_id, data FROM applied").fetchall():
+                self._index_applied_text(conn, job_id, codec.loads(data))
+                count += 1
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search_indexed_at', ?)",
+                         (datetime.now().isoformat(),))
+        return count
+
+    def identity_index(self):
+        # No file signatures to validate a cached index against: derive it per call
+        return IdentityIndex.build(self.load_applied(), self.load_parked())
+
+    # --- APPLIED JOBS ---
+    def load_applied(self, fresh=False):
+        rows = self.conn.execute("SELECT job_id, data FROM applied ORDER BY rowid").fetchall()
+        return {r[0]: codec.loads(r[1]) for r in rows}
+
+    def iter_applied(self, fields=None):
+        for job_id, data in self.conn.execute("SELECT job_id, data FROM applied ORDER BY rowid"):
+            yield job_id, project(codec.loads(data), fields)
+
+    def _get_applied(self, job_id):
+        row = self.conn.execute("SELECT data FROM applied WHERE job_id = ?", (job_id,)).fetchone()
+        return codec.loads(row[0]) if row else None
+
+    def _upsert_applied(self, conn, job_id, record):
+        details = record.get("job_details") or {}
+        conn.execute(
+            """INSERT INTO applied (job_id, link, norm_key, data) VALUES (?, ?, ?, ?)
+               ON CONFLICT(job_id) DO UPDATE SET link = excluded.link, norm_key = excluded.norm_key, data = excluded.data""",
+            (job_id, _job_link(details),
+             norm_key(details.get('title') or details.get('Job Title'), details.get('company') or details.get('Company')),
+             _dumps(record))
+        )
+        self._index_applied_text(conn, job_id, record)
+
+    def _index_applied_text(self, conn, job_id, record):
+        if self.store.full_text:
+            conn.execute("DELETE FROM applied_search WHERE job_id = ?", (job_id,))
+            conn.execute("INSERT INTO applied_search (body, job_id) VALUES (?, ?)",
+                         (search_text(record.get("job_details") or {}), job_id))
+
+    def save_applied(self, job_id, job_data=None, analysis_data=None, status="applied"):
+        record = self._get_applied(job_id) or {
+            "created_at": datetime.now().isoformat(),
+            "job_details": {},
+            "ai_analysis": {}
+        }
+
+        record["status"] = status
+        record["last_updated"] = datetime.now().isoformat()
+
+        if job_data: record["job_details"] = job_data
+        if analysis_data: record["ai_analysis"] = analysis_data
+        self._stamp_job_key(record, record["job_details"])
+
+        with self.conn as conn:
+            self._upsert_applied(conn, job_id, record)
+
+        data = self.load_applied()
+        self._sync_session_applied(data)
+        return data
+
+    def delete_applied(self, job_id):
+        with self.conn as conn:
+            cur = conn.execute("DELETE FROM applied WHERE job_id = ?", (job_id,))
+        data = self.load_applied()
+        if cur.rowcount:
+            self._sync_session_applied(data)
+        return data
+
+    @staticmethod
+    def _sync_session_applied(data):
+        import streamlit as st
+        try:
+            if 'applied_jobs' in st.session_state:
+                st.session_state['applied_jobs'] = data
+        except Exception:
+            pass
+
+    # --- CACHE (AI Results) ---
+    def load_cache(self, fresh=False):
+        rows = self.conn.execute("SELECT entry_key, data FROM cache ORDER BY seq").fetchall()
+        return {r[0]: codec.loads(r[1]) for r in rows}
+
+    def save_cache(self, job_id, results, job=None, resume_name=None):
+        results['_analyzed_at'] = datetime.now().isoformat()
+        if job is not None:
+            self._stamp_job_key(results, job, '_job_key')
+        if resume_name:
+            results['_resume'] = resume_stem(resume_name)
+        # REPLACE deletes and re-inserts, so the entry moves to the end (most recent)
+        with self.conn as conn:
+            conn.execute("INSERT OR REPLACE INTO cache (entry_key, job_key, data) VALUES (?, ?, ?)",
+                         (job_id, results.get('_job_key'), _dumps(results)))
+        cache_policy_engine.schedule(self)
+        return self.load_cache()
+
+    def cache_keys_with_prefix(self, prefix):
+        rows = self.conn.execute("SELECT entry_key FROM cache WHERE substr(entry_key, 1, ?) = ? ORDER BY seq",
+                                 (len(prefix), prefix)).fetchall()
+        return [r[0] for r in rows]
+
+    def cache_keys_for_job(self, job, resume_name=None):
+        key = job_key_of(job)
+        base = self.generate_job_id(job.get('title'), job.get('company'))
+        rows = self.conn.execute(
+            """SELECT entry_key, data FROM cache
+               WHERE job_key = ? OR (job_key IS NULL AND substr(entry_key, 1, ?) = ?) ORDER BY seq""",
+            (key and str(key), len(base), base)).fetchall()
+        if not resume_name:
+            return [r[0] for r in rows]
+        stem = resume_stem(resume_name)
+        return [k for k, data in rows if codec.loads(data).get('_resume') == stem or k.endswith(f"-{stem}")]
+
+    def migrate_job_keys(self):
+        counts = {}
+        legacy = {}
+        with self.conn as conn:
+            for table, details in (("scouted", False), ("parked", False)):
+                rows = conn.execute(f"SELECT seq, data FROM {table}").fetchall()
+                records = [codec.loads(data) for _, data in rows]
+                keyed = [r.get('job_key') for r in records]
+                counts[table] = self._key_records(records, legacy, details)
+                conn.executemany(f"UPDATE {table} SET data = ? WHERE seq = ?",
+                                 [(_dumps(r), seq) for (seq, _), r, k in zip(rows, records, keyed) if not k and r.get('job_key')])
+            rows = conn.execute("SELECT job_id, data FROM applied").fetchall()
+            records = [codec.loads(data) for _, data in rows]
+            keyed = [r.get('job_key') for r in records]
+            counts["applied"] = self._key_records(records, legacy, details=True)
+            conn.executemany("UPDATE applied SET data = ? WHERE job_id = ?",
+                             [(_dumps(r), job_id) for (job_id, _), r, k in zip(rows, records, keyed) if not k and r.get('job_key')])
+            cache = {k: codec.loads(data) for k, data in conn.execute("SELECT entry_key, data FROM cache WHERE job_key IS NULL")}
+            counts["cache"] = self._key_cache_entries(cache, legacy)
+            conn.executemany("UPDATE cache SET job_key = ?, data = ? WHERE entry_key = ?",
+                             [(v['_job_key'], _dumps(v), k) for k, v in cache.items() if v.get('_job_key')])
+        return counts
+
+    def evict_cache_entries(self, stamps):
+        removed = 0
+        with self.conn as conn:
+            for key, stamp in stamps.items():
+                row = conn.execute("SELECT data FROM cache WHERE entry_key = ?", (key,)).fetchone()
+                if row and codec.loads(row[0]).get('_analyzed_at') == stamp:
+                    conn.execute("DELETE FROM cache WHERE entry_key = ?", (key,))
+                    removed += 1
+        return removed
+
+    def delete_cache_for_job(self, title, company, job=None):
+        if job is not None:
+            keys = [(k,) for k in self.cache_keys_for_job(job)]
+            with self.conn as conn:
+                conn.executemany("DELETE FROM cache WHERE entry_key = ?", keys)
+            return len(keys)
+        base_id = self.generate_job_id(title, company)
+        with self.conn as conn:
+            cur = conn.execute("DELETE FROM cache WHERE substr(entry_key, 1, ?) = ?", (len(base_id), base_id))
+        return cur.rowcount
+
+    def clean_database(self):
+        """Wipes scouted jobs and orphaned cache entries. Keeps only Applied + Parked job data."""
+        self.clear_scouted_jobs()
+
+        protected_prefixes = self._referenced_cache_prefixes(scouted=False)
+
+        rows = self.conn.execute("SELECT entry_key, job_key FROM cache").fetchall()
+        cache_keys = [r[0] for r in rows]
+        original_count = len(cache_keys)
+        protected_keys = SortedKeyIndex(cache_keys).with_any_prefix(protected_prefixes)
+        protected_job_keys = self._referenced_job_keys(scouted=False)
+        protected_keys.update(key for key, job_key in rows if job_key in protected_job_keys)
+        orphaned = [(k,) for k in cache_keys if k not in protected_keys]
+        with self.conn as conn:
+            conn.executemany("DELETE FROM cache WHERE entry_key = ?", orphaned)
+
+        try:
+            active = self.load_active_resumes()
+            protected_active = SortedKeyIndex(active.keys()).with_any_prefix(protected_prefixes)
+            cleaned_active = {k: v for k, v in active.items() if k in protected_active}
+            with open(os.path.join(DATA_DIR, "active_resumes.json"), "w", encoding="utf-8") as f:
+                json.dump(cleaned_active, f, indent=2, ensure_ascii=False)
+        except:
+            pass
+
+        kept = original_count - len(orphaned)
+        return {"scouted_cleared": True, "cache_entries_removed": len(orphaned), "cache_entries_kept": kept,
+                "blobs_removed": self.gc_blobs()}
+
+    # --- PARKED JOBS ---
+    def load_parked(self, fresh=False):
+        rows = self.conn.execute("SELECT data FROM parked ORDER BY seq").fetchall()
+        return [codec.loads(r[0]) for r in rows]
+
+    def _insert_parked(self, conn, record):
+        conn.execute(
+            "INSERT INTO parked (job_id, link, norm_key, data) VALUES (?, ?, ?, ?)",
+            (self.generate_job_id(record.get('title'), record.get('company')), record.get('link'),
+             norm_key(record.get('title'), record.get('company')), _dumps(record))
+        )
+
+    def park_job(self, title, company, job_data=None):
+        target_id = self.generate_job_id(title, company)
+        with self.conn as conn:
+            exists = conn.execute("SELECT 1 FROM parked WHERE job_id = ? LIMIT 1", (target_id,)).fetchone()
+            if not exists:
+                record = {
+                    "id": target_id,
+                    "title": title,
+                    "company": company,
+                    "parked_at": datetime.now().isoformat()
+                }
+                if job_data:
+                    record['link'] = job_data.get('link') or job_data.get('Web Address')
+                    record['platform'] = job_data.get('platform') or job_data.get('Platform')
+                self._stamp_job_key(record)
+                self._insert_parked(conn, record)
+            conn.execute("DELETE FROM scouted WHERE job_id = ?", (target_id,))
+        return True
+
+    # --- BLACKLIST ---
+    def load_blacklist(self, fresh=False):
+        data = {kind: [] for kind in BLACKLIST_KINDS}
+        rows = self.conn.execute("SELECT kind, value FROM blacklist ORDER BY kind, position").fetchall()
+        for kind, value in rows:
+            data.setdefault(kind, []).append(value)
+        return data
+
+    def save_blacklist(self, companies, titles, safe_phrases=[]):
+        data = {"companies": companies, "titles": titles, "safe_phrases": safe_phrases}
+        with self.conn as conn:
+            conn.execute("DELETE FROM blacklist")
+            conn.executemany(
+                "INSERT INTO blacklist (kind, position, value) VALUES (?, ?, ?)",
+                [(kind, i, v) for kind, values in data.items() for i, v in enumerate(values or [])]
+            )
+        return data
+
+    # --- MESSAGED CONTACTS ---
+    def load_messaged_contacts(self, fresh=False):
+        rows = self.conn.execute("SELECT data FROM messaged_contacts ORDER BY seq").fetchall()
+        return [codec.loads(r[0]) for r in rows]
+
+    def save_messaged_contact(self, name, profile_url=None):
+        with self.conn as conn:
+            exists = conn.execute("SELECT 1 FROM messaged_contacts WHERE name = ? LIMIT 1", (name,)).fetchone()
+            if not exists:
+                record = {
+                    "name": name,
+                    "profile_url": profile_url,
+                    "messaged_at": datetime.now().isoformat()
+                }
+                conn.execute("INSERT INTO messaged_contacts (name, data) VALUES (?, ?)", (name, _dumps(record)))
+        return self.load_messaged_contacts()
+
+
+def _load_json_file(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except:
+        return default
+
+
+def migrate_json_to_sqlite(store=None, force=False):
+    """
+    One-shot import of the legacy data/*.json stores into SQLite.
+    Skipped when the database already records a migration unless force=True.
+    Returns a dict of imported row counts per store.
+    """
+    store = store or SQLiteStore()
+    if store.get_meta("migrated_at") and not force:
+        return {}
+
+    dm = SQLiteDataManager.__new__(SQLiteDataManager)
+    dm.store = store
+    counts = {}
+    with store.connect() as conn:
+        for table in ("scouted", "applied", "parked", "cache", "blacklist", "messaged_contacts"):
+            conn.execute(f"DELETE FROM {table}")
+
+        scouted = _load_json_file(SCOUTED_FILE, [])
+        for job in scouted:
+            dm._insert_scouted(conn, job)
+        counts["scouted"] = len(scouted)
+
+        applied = JsonJournal(APPLIED_FILE).load()
+        for job_id, record in applied.items():
+            dm._upsert_applied(conn, job_id, record)
+        counts["applied"] = len(applied)
+
+        parked = _load_json_file(PARKED_FILE, [])
+        for record in parked:
+            dm._insert_parked(conn, record)
+        counts["parked"] = len(parked)
+
+        cache = JsonJournal(CACHE_FILE).load()
+        conn.executemany("INSERT INTO cache (entry_key, job_key, data) VALUES (?, ?, ?)",
+                         [(k, v.get('_job_key') if isinstance(v, dict) else None, _dumps(v)) for k, v in cache.items()])
+        counts["cache"] = len(cache)
+
+        blacklist = _load_json_file(BLACKLIST_FILE, {})
+        rows = [(kind, i, v) for kind in BLACKLIST_KINDS for i, v in enumerate(blacklist.get(kind) or [])]
+        conn.executemany("INSERT INTO blacklist (kind, position, value) VALUES (?, ?, ?)", rows)
+        counts["blacklist"] = len(rows)
+
+        contacts = _load_json_file(MESSAGED_CONTACTS_FILE, [])
+        conn.executemany("INSERT INTO messaged_contacts (name, data) VALUES (?, ?)",
+                         [(c.get('name'), _dumps(c)) for c in contacts])
+        counts["messaged_contacts"] = len(contacts)
+
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_at', ?)", (datetime.now().isoformat(),))
+        if store.full_text:  # the rows above were indexed as they were inserted
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search_indexed_at', ?)",
+                         (datetime.now().isoformat(),))
+
+    return counts
+
+
+if __name__ == "__main__":
+    import sys
+    result = migrate_json_to_sqlite(force="--force" in sys.argv)
+    if result:
+        for name, count in result.items():
+            print(f"{name}: {count}")
+    else:
+        print(f"{SQLITE_FILE} already migrated. Use --force to re-import the JSON files.")
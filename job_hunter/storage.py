@@ -0,0 +1,223 @@
+import atexit
+import os
+import stat
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from job_hunter import codec
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+FSYNC_INTERVAL = 1.0  # seconds between batched fsyncs
+
+
+# --- FILE LOCKS ---
+class _LockState:
+    def __init__(self):
+        self.rlock = threading.RLock()
+        self.owner = None
+        self.depth = 0
+        self.fd = None
+
+
+_lock_states = {}
+_lock_states_guard = threading.Lock()
+
+
+def lock_path_for(path):
+    """data/scouted_jobs.json -> data/.locks/scouted_jobs.json.lock"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, ".locks", f"{name}.lock")
+
+
+def _state_for(path):
+    key = os.path.abspath(path)
+    with _lock_states_guard:
+        state = _lock_states.get(key)
+        if state is None:
+            state = _lock_states[key] = _LockState()
+        return state
+
+
+def _open_lock_file(path):
+    lock_file = lock_path_for(path)
+    os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+    return os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+
+
+@contextmanager
+def write_lock(path):
+    """
+    Exclusive advisory lock for a data file (fcntl.flock on a sidecar lock file, so it
+    survives os.replace of the data file). Reentrant within a thread, so DataManager
+    methods that call each other can nest it.
+    """
+    state = _state_for(path)
+    with state.rlock:
+        if state.depth == 0:
+            state.fd = _open_lock_file(path)
+            if fcntl:
+                fcntl.flock(state.fd, fcntl.LOCK_EX)
+            state.owner = threading.get_ident()
+        state.depth += 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0:
+                state.owner = None
+                if fcntl:
+                    fcntl.flock(state.fd, fcntl.LOCK_UN)
+                os.close(state.fd)
+                state.fd = None
+
+
+@contextmanager
+def read_lock(path):
+    """
+    Shared advisory lock for a data file. Readers only wait while a writer swaps the file
+    in; the directory fsync happens later in the background, outside the lock.
+    """
+    state = _state_for(path)
+    if state.owner == threading.get_ident() or not fcntl:
+        # Already holding the write lock in this thread (or no fcntl): nothing to wait for
+        yield
+        return
+    fd = _open_lock_file(path)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+# --- FSYNC BATCHING ---
+class FsyncBatcher:
+    """
+    Collects appended files (plus their directories) and the directories of renames done
+    by atomic_write_* and fsyncs them from one background thread every FSYNC_INTERVAL
+    seconds. atomic_write_* fsync the new file's data themselves before the rename, so
+    only the rename itself is deferred: a crash can lose at most the last interval of
+    writes (the old file is still there), never leave a torn file.
+    """
+    def __init__(self, interval=FSYNC_INTERVAL):
+        self.interval = interval
+        self._pending = set()
+        self._directories = set()
+        self._cond = threading.Condition()
+        self._thread = None
+        self.flushes = 0
+
+    def schedule(self, path, directory=False):
+        """path: a file to fsync (and its directory), or with directory=True a directory only."""
+        with self._cond:
+            (self._directories if directory else self._pending).add(os.path.abspath(path))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="fsync-batcher", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._pending and not self._directories:
+                    self._thread = None
+                    return
+            time.sleep(self.interval)
+            self.flush()
+
+    def flush(self):
+        with self._cond:
+            paths, self._pending = self._pending, set()
+            scheduled, self._directories = self._directories, set()
+        directories = set(scheduled)
+        for path in paths:
+            _fsync_path(path)
+            directories.add(os.path.dirname(path))
+        for directory in directories:
+            _fsync_path(directory, directory=True)
+        if paths or scheduled:
+            self.flushes += 1
+        return len(paths) + len(scheduled)
+
+
+def _fsync_path(path, directory=False):
+    try:
+        fd = os.open(path, os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # e.g. directories on Windows
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path):
+    """Makes renames into path's directory durable now (instead of with the next batched fsync)."""
+    _fsync_path(os.path.dirname(os.path.abspath(path)), directory=True)
+
+
+fsync_batcher = FsyncBatcher()
+atexit.register(fsync_batcher.flush)
+
+
+# --- ATOMIC WRITES ---
+def atomic_write_text(path, text, durable=False):
+    """
+    Writes text to a temp file in the same directory and os.replace()s it over path, so
+    readers see either the old or the new file, never a partial one. The temp file is
+    fsynced before the rename; the directory fsync that makes the rename itself durable
+    is batched unless durable=True.
+    """
+    atomic_write_bytes(path, text.encode("utf-8"), durable=durable)
+
+
+def atomic_write_bytes(path, data, durable=False):
+    """Binary counterpart of atomic_write_text."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())  # data on disk before the rename: never a torn file after a crash
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_path(directory, directory=True)
+    else:
+        fsync_batcher.schedule(directory, directory=True)
+
+
+def atomic_write_json(path, data, durable=False, pretty=True):
+    """
+    JSON via the fastest installed codec (see codec.py). pretty=False writes the compact
+    form used for hot, machine-only stores; `python -m job_hunter.data_export --pretty`
+    gives people a readable copy.
+    """
+    atomic_write_bytes(path, codec.dumps(data, pretty=pretty), durable=durable)
+
+
+def read_json(path):
+    """Parses a JSON file under a shared lock. Raises like json.load/open do."""
+    with read_lock(path):
+        with open(path, "rb") as f:
+            return codec.loads(f.read())
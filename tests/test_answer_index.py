@@ -0,0 +1,42 @@
+from job_hunter.answer_index import AnswerIndex, answer_index_for
+from job_hunter.data_manager import DataManager, read_cache
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_match_priority_is_unchanged():
+    index = AnswerIndex({
+        "python experience": "substring",
+        "years of python experience": "exact",
+        "salary": "short",
+        "remote work from home": "overlap",
+        "work from": "later",
+        "!!!": "never",
+    })
+    assert index.match("Years of Python experience?") == "exact"
+    assert index.match("How many years of python experience do you have") == "substring"
+    assert index.match("Salary") == "short"
+    assert index.match("sal") == "short"  # question inside a pattern
+    assert index.match("Remote from home, can you work?") == "overlap"
+    assert index.match("From work, please") == "overlap"  # ties go to the earlier pattern
+    assert index.match("I work from the office") == "later"
+    assert index.match("travel") is None
+    assert index.match("   ") is None
+
+
+def test_index_rebuilds_only_when_answers_change(db):
+    first = answer_index_for(db.load_bot_config()["answers"])
+    db.log_unknown_question("What is your favourite colour?")
+    assert answer_index_for(db.load_bot_config()["answers"]) is first
+
+    assert db.get_answer_for_question("Favourite colour") is None
+    db.add_answer("favourite colour", "Blue")
+    assert db.get_answer_for_question("What is your favourite colour?") == "Blue"
+    db.delete_answer("favourite colour")
+    assert db.get_answer_for_question("What is your favourite colour?") is None
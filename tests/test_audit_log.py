@@ -0,0 +1,44 @@
+from job_hunter.audit_log import AuditLogbook, SEPARATOR
+from job_hunter.data_manager import DataManager, read_cache, AUDIT_FILE
+import os
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_appends_roll_segments_and_latest_reads_tail(tmp_path):
+    log = AuditLogbook(str(tmp_path / "audit"), segment_max_bytes=110)
+    for i in range(10):
+        log.append(f"# Report {i}\n" + "x" * 40)
+
+    assert len(log) == 10
+    assert len([n for n in os.listdir(log.root) if n.startswith("segment-")]) == 5
+    assert [text.split("\n")[0] for _, text in log.latest(3)] == ["# Report 9", "# Report 8", "# Report 7"]
+    rendered = "".join(log.render())
+    assert rendered.startswith("# Report 9") and rendered.endswith("# Report 0\n" + "x" * 40)
+    assert rendered.count(SEPARATOR) == 9
+
+
+def test_torn_index_line_is_skipped(tmp_path):
+    log = AuditLogbook(str(tmp_path / "audit"))
+    log.append("first")
+    with open(log.index_path, "ab") as f:
+        f.write(b'{"seq": 2, "at"')  # crash mid-append
+    log.append("second")
+
+    assert [text for _, text in log.latest(5)] == ["second", "first"]
+
+
+def test_legacy_file_is_imported(db):
+    os.makedirs("data", exist_ok=True)
+    with open(AUDIT_FILE, "w", encoding="utf-8") as f:
+        f.write("newest" + SEPARATOR + "oldest")
+    db.save_audit_report("brand new")
+
+    assert [text for _, text in db.load_audit_reports()] == ["brand new", "newest", "oldest"]
+    assert not os.path.exists(AUDIT_FILE)
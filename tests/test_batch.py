@@ -0,0 +1,98 @@
+from job_hunter.data_manager import DataManager, read_cache, current_batch, SCOUTED_FILE, PARKED_FILE, CACHE_FILE
+from job_hunter.journal import JsonJournal
+from job_hunter.storage import read_json
+import os
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_batch_writes_each_store_once(db):
+    scouted_inode = os.stat(SCOUTED_FILE).st_ino
+    with db.batch() as batch:
+        db.save_scouted_jobs([{"title": "A", "company": "X"}], append=True)
+        db.save_scouted_jobs([{"title": "B", "company": "X"}], append=True)
+        # Another instance in the same thread sees the staged data
+        assert [j["title"] for j in DataManager().load_scouted()] == ["A", "B"]
+        assert os.stat(SCOUTED_FILE).st_ino == scouted_inode  # nothing written yet
+
+        db.save_cache("A-X-CV", {"score": 1})
+        db.save_cache("B-X-CV", {"score": 2})
+        assert list(db.load_cache()) == ["A-X-CV", "B-X-CV"]
+        assert db.cache_keys_with_prefix("A-X") == ["A-X-CV"]
+
+    assert current_batch() is None
+    assert batch.stats["files_written"] == 1
+    assert batch.stats["journal_appends"] == 1
+    assert batch.stats["journal_records"] == 2
+    assert [j["title"] for j in read_json(SCOUTED_FILE)] == ["A", "B"]
+    with open(JsonJournal(CACHE_FILE).journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert list(db.load_cache(fresh=True)) == ["A-X-CV", "B-X-CV"]
+
+
+def test_batched_park_keeps_indexes(db):
+    db.save_scouted_jobs([{"title": "A", "company": "X"}, {"title": "B", "company": "Y"}], append=False)
+    index = db.identity_index()
+    with db.batch() as batch:
+        db.park_job("A", "X", {"link": "https://x/1"})
+    assert batch.stats["files_written"] == 2
+
+    assert [j["title"] for j in read_json(SCOUTED_FILE)] == ["B"]
+    assert read_json(PARKED_FILE)[0]["id"] == "A-X"
+    assert db.identity_index() is index  # re-stamped after the flush, not rebuilt
+    assert index.is_parked({"title": "A", "company": "X"})
+
+
+def test_failed_batch_discards_staged_changes(db):
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.save_scouted_jobs([{"title": "A", "company": "X"}], append=True)
+            db.save_applied("A-X-CV", {"title": "A", "company": "X"})
+            raise RuntimeError("boom")
+
+    assert read_json(SCOUTED_FILE) == []
+    assert db.load_applied() == {}
+    assert not db.identity_index().is_applied({"title": "A", "company": "X"})
+
+
+def test_nested_batches_flush_at_outer_exit(db):
+    with db.batch() as outer:
+        with db.batch() as inner:
+            db.park_job("A", "X")
+        assert inner is outer
+        assert read_json(PARKED_FILE) == []
+    assert len(read_json(PARKED_FILE)) == 1
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def any_db(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("STORAGE_BACKEND", request.param)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_batch_is_one_unit_of_work_on_every_backend(any_db):
+    any_db.save_scouted_jobs([{"title": "A", "company": "X"}, {"title": "B", "company": "Y"}], append=False)
+    with pytest.raises(RuntimeError):
+        with any_db.batch():
+            any_db.park_job("A", "X")
+            any_db.save_cache("B-Y-CV", {"score": 1})
+            raise RuntimeError("boom")
+    read_cache.invalidate()
+    assert [j["title"] for j in any_db.load_scouted(fresh=True)] == ["A", "B"]
+    assert any_db.load_parked() == [] and any_db.load_cache() == {}
+
+    with any_db.batch() as batch:
+        any_db.park_job("A", "X")
+        any_db.save_cache("B-Y-CV", {"score": 1})
+        # Another instance in the same thread sees the batch's writes
+        assert [j["title"] for j in DataManager().load_scouted()] == ["B"]
+    assert batch.stats["files_written"] >= 1 and batch.stats["staged_writes"] + batch.stats["journal_records"] >= 2
+    assert len(DataManager().load_parked()) == 1 and list(DataManager().load_cache()) == ["B-Y-CV"]
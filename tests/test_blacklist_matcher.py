@@ -0,0 +1,48 @@
+from job_hunter.blacklist_matcher import BLOCK, KEEP, RESCUE, BlacklistMatcher, matcher_for, TITLE
+from job_hunter.data_manager import DataManager, read_cache
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_overlapping_patterns_found_through_fail_links():
+    matcher = BlacklistMatcher(titles=["he", "she", "hers", "sales manager"])
+    assert matcher.scan("uSHErs", TITLE) == TITLE
+    assert matcher.scan("Sales Managed", TITLE) == 0
+    assert matcher.scan("Head of Sales Management", TITLE) == TITLE
+    assert matcher.scan("Analyst", TITLE) == 0
+
+
+def test_classify_block_rescue_keep():
+    matcher = BlacklistMatcher(companies=["Evil"], titles=["Sales"], safe_phrases=["Analyst"])
+    jobs = [
+        {"title": "Data Analyst", "company": "Evil Corp"},   # company ban is absolute
+        {"title": "Sales Analyst", "company": "Good"},
+        {"title": "Sales Rep", "company": "Good"},
+        {"title": "Engineer", "company": "Good"},
+    ]
+    assert matcher.classify(jobs) == [BLOCK, RESCUE, BLOCK, KEEP]
+
+
+def test_matcher_is_rebuilt_only_when_lists_change():
+    bl = {"companies": ["a"], "titles": ["b"], "safe_phrases": []}
+    first = matcher_for(bl)
+    assert matcher_for(dict(bl)) is first
+    assert matcher_for({**bl, "titles": ["b", "c"]}) is not first
+
+
+def test_save_scouted_jobs_uses_blacklist(db):
+    db.save_blacklist(["Spam Inc"], ["Sales"], ["Analyst"])
+    saved = db.save_scouted_jobs([
+        {"title": "Sales Analyst", "company": "X"},
+        {"title": "Sales Rep", "company": "X"},
+        {"title": "Engineer", "company": "Spam Inc"},
+        {"title": "Engineer", "company": "X"},
+    ], append=False)
+    # Survivors first, rescued jobs after them
+    assert [j["title"] for j in saved] == ["Engineer", "Sales Analyst"]
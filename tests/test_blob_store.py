@@ -0,0 +1,77 @@
+from job_hunter.blob_store import BlobStore, blob_store, is_blob_ref, resolve_text, text_length
+from job_hunter.data_manager import DataManager, read_cache, SCOUTED_FILE
+from job_hunter.mission_state import MissionProgress, STATE_FILE
+from job_hunter.storage import read_json
+import json
+import os
+import pytest
+
+JD = "Build data pipelines. " * 200
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_put_is_content_addressed_and_compressed(tmp_path):
+    store = BlobStore(root=str(tmp_path / "blobs"))
+    ref = store.put(JD)
+    assert store.put(JD) == ref
+    files = [f for _, _, names in os.walk(tmp_path / "blobs") for f in names]
+    assert len(files) == 1
+    assert os.path.getsize(os.path.join(tmp_path, "blobs", files[0][:2], files[0])) < len(JD) / 10
+
+    store._cache.clear()
+    assert store.get(ref) == JD
+    assert text_length(ref) == len(JD)
+    assert store.resolve("short inline text") == "short inline text"
+
+
+def test_put_of_an_existing_blob_restarts_its_grace_period(tmp_path):
+    store = BlobStore(root=str(tmp_path / "blobs"))
+    store.put(JD)
+    path = [os.path.join(d, f) for d, _, names in os.walk(tmp_path / "blobs") for f in names][0]
+    os.utime(path, (0, 0))  # written long ago, unreferenced since
+    store.put(JD)           # referenced again by a record that is not written yet
+    assert store.gc(set(), grace_seconds=60) == 0
+
+
+def test_stores_keep_references_only(db):
+    db.save_scouted_jobs([{"title": "A", "company": "X", "rich_description": JD, "_resume_text": JD}], append=False)
+    db.save_cache("A-X-CV", {"cover_letter": JD, "fit_report": {"score": 80}})
+
+    raw_scouted = read_json(SCOUTED_FILE)[0]
+    assert is_blob_ref(raw_scouted["rich_description"])
+    assert raw_scouted["_resume_text"] == raw_scouted["rich_description"]  # stored once
+    assert os.path.getsize(SCOUTED_FILE) < len(JD) / 5
+
+    cached = db.load_cache()["A-X-CV"]
+    assert is_blob_ref(cached["cover_letter"])
+    assert resolve_text(cached["cover_letter"]) == JD
+    assert resolve_text(db.load_scouted()[0]["rich_description"]) == JD
+
+
+def test_longer_description_wins_on_merge(db):
+    db.save_scouted_jobs([{"title": "A", "company": "X", "link": "l", "rich_description": JD}], append=False)
+    db.save_scouted_jobs([{"title": "A", "company": "X", "link": "l", "rich_description": "short"}], append=True)
+    assert resolve_text(db.load_scouted()[0]["rich_description"]) == JD
+
+
+def test_migrate_and_gc(db):
+    with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+        json.dump([{"title": "A", "company": "X", "rich_description": JD}], f)
+    MissionProgress(mission_type="Scout", scouting_backlog=[{"resume_text": JD}] * 3).save()
+    assert is_blob_ref(read_json(STATE_FILE)["scouting_backlog"][0]["resume_text"])
+
+    result = db.migrate_blobs()
+    assert result["after"]["scouted_jobs.json"] * 10 < result["before"]["scouted_jobs.json"]
+
+    orphan = blob_store.put("orphaned text " * 100)
+    assert db.gc_blobs() == 0  # within the grace period
+    assert blob_store.gc(db._live_blob_refs(), grace_seconds=-1) == 1
+    assert resolve_text(db.load_scouted()[0]["rich_description"]) == JD
+    blob_store._cache.clear()
+    assert resolve_text(orphan) == ""
@@ -0,0 +1,52 @@
+from job_hunter.cache_policy import CachePolicy, CachePolicyEngine
+from job_hunter.data_manager import DataManager, read_cache
+from datetime import datetime, timedelta
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def aged(db, key, results, days):
+    """save_cache, then backdate the entry's _analyzed_at."""
+    db.save_cache(key, results)
+    entry = dict(db.load_cache()[key])
+    entry["_analyzed_at"] = (datetime.now() - timedelta(days=days)).isoformat()
+    db._journal_write("data/analysis_cache.json", "set", key, entry)
+
+
+def test_failed_entries_expire_after_ttl(db):
+    aged(db, "Old-Co-cv", {"error": "timeout", "status": "failed"}, days=5)
+    aged(db, "New-Co-cv", {"error": "No description found", "status": "skipped"}, days=0)
+    aged(db, "Good-Co-cv", {"fit_report": {"score": 80}}, days=30)
+
+    engine = CachePolicyEngine(CachePolicy(error_ttl=24 * 3600))
+    report = engine.run(db)
+    assert report["expired"] == 1 and report["evicted"] == 0
+    assert list(db.load_cache(fresh=True)) == ["New-Co-cv", "Good-Co-cv"]
+
+
+def test_lru_evicts_only_unreferenced_entries(db):
+    db.save_scouted_jobs([{"title": "Kept", "company": "Co"}], append=False)
+    aged(db, "Kept-Co-cv", {"fit_report": {"score": 1}}, days=9)
+    aged(db, "Gone-Co-cv", {"fit_report": {"score": 2}}, days=3)
+    aged(db, "Used-Co-cv", {"fit_report": {"score": 3}}, days=5)
+    aged(db, "Fresh-Co-cv", {"fit_report": {"score": 4}}, days=1)
+
+    engine = CachePolicyEngine(CachePolicy(max_entries=2))
+    engine.touch("Used-Co-cv")
+    assert engine.run(db)["evicted"] == 2
+    assert sorted(db.load_cache(fresh=True)) == ["Kept-Co-cv", "Used-Co-cv"]
+    assert engine.report()["evicted"] == 2 and engine.report()["bytes_freed"] > 0
+
+
+def test_entries_saved_again_are_not_evicted(db):
+    aged(db, "Retry-Co-cv", {"error": "boom"}, days=5)
+    stale = {"Retry-Co-cv": db.load_cache()["Retry-Co-cv"]["_analyzed_at"]}
+    db.save_cache("Retry-Co-cv", {"fit_report": {"score": 70}})
+    assert db.evict_cache_entries(stale) == 0
+    assert "Retry-Co-cv" in db.load_cache(fresh=True)
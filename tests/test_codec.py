@@ -0,0 +1,49 @@
+from job_hunter import codec
+from job_hunter.data_export import export_data
+from job_hunter.data_manager import DataManager, read_cache, SCOUTED_FILE, PARKED_FILE
+import json
+import os
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_round_trip_matches_stdlib():
+    data = {"title": "Entwickler (m/w/d) – München", "score": 87, "ok": True, "none": None,
+            "nested": [{"a": 1.5}, [], {}], "big": 2 ** 70}
+    compact = codec.dumps(data)
+    pretty = codec.dumps(data, pretty=True)
+
+    assert codec.loads(compact) == codec.loads(pretty) == json.loads(compact) == data
+    assert b"\n" not in compact
+    assert "München".encode("utf-8") in compact
+    assert pretty.decode("utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_hot_stores_compact_others_pretty(db):
+    db.save_scouted_jobs([{"title": "Data Engineer", "company": "Acme", "link": "https://x/1"}])
+    db.park_job("Analyst", "Beta", {"title": "Analyst", "company": "Beta", "link": "https://x/2"})
+
+    with open(SCOUTED_FILE, "rb") as f:
+        assert b"\n" not in f.read().strip()
+    with open(PARKED_FILE, "rb") as f:
+        assert b'\n  {' in f.read()
+    read_cache.invalidate()
+    assert db.load_scouted()[0]["title"] == "Data Engineer"
+
+
+def test_export_pretty(db):
+    db.save_scouted_jobs([{"title": "Data Engineer", "company": "Acme", "link": "https://x/1"}])
+    db.save_cache("Data Engineer-Acme-cv.pdf", {"score": 70})
+    written = export_data("export", pretty=True)
+
+    assert {"scouted_jobs.json", "analysis_cache.json"} <= set(written)
+    with open(os.path.join("export", "analysis_cache.json"), encoding="utf-8") as f:
+        text = f.read()
+    assert json.loads(text)["Data Engineer-Acme-cv.pdf"]["score"] == 70
+    assert "\n  " in text
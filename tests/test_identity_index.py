@@ -0,0 +1,61 @@
+from job_hunter.data_manager import DataManager, read_cache, PARKED_FILE
+from job_hunter.identity_index import IdentityIndex, canonical_link
+from job_hunter.job_key import JobKey
+import json
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_index_matches_ids_links_and_normalized_keys():
+    index = IdentityIndex.build(
+        {"Data Analyst-Acme-CV": {"job_details": {"title": "Data Analyst\nData Analyst", "company": "Acme ",
+                                                  "link": "HTTPS://Jobs.example.com/view/1/"}}},
+        [{"id": "Engineer-Initech", "title": "Engineer", "company": "Initech", "link": "https://x.io/2"}],
+    )
+    assert index.is_applied({"title": "Data Analyst", "company": "Acme"})
+    assert index.is_applied({"title": "data analyst", "company": "ACME", "link": "https://other/3"})
+    assert index.is_applied({"title": "Other", "company": "Other", "link": "https://jobs.example.com/view/1#top"})
+    assert index.is_parked({"title": "Engineer", "company": "Initech"})
+    assert not index.is_known({"title": "Engineer", "company": "Acme"})
+    assert canonical_link("https://x.io/a?currentJobId=1") != canonical_link("https://x.io/a?currentJobId=2")
+
+
+def test_index_kept_current_by_writes(db):
+    index = db.identity_index()
+    job = {"title": "Dev", "company": "Co", "link": "https://co/jobs/1"}
+    assert not index.is_known(job)
+
+    db.save_applied("Dev-Co-CV", {"title": "Dev", "company": "Co"})
+    assert db.identity_index() is index  # patched in place, not rebuilt
+    assert index.is_applied(job)
+
+    db.delete_applied("Dev-Co-CV")
+    assert db.identity_index() is index
+    assert not index.is_applied(job)
+
+    db.park_job("Dev", "Co", job)
+    assert db.identity_index() is index
+    assert index.is_parked(job)
+
+
+def test_external_edit_triggers_rebuild(db):
+    index = db.identity_index()
+    with open(PARKED_FILE, "w", encoding="utf-8") as f:
+        json.dump([{"title": "Ops", "company": "Edited"}], f)
+    rebuilt = db.identity_index()
+    assert rebuilt is not index
+    assert rebuilt.is_parked({"title": "Ops", "company": "Edited"})
+
+
+def test_filter_and_archive_use_index(db):
+    db.save_scouted_jobs([{"title": "A", "company": "B"}, {"title": "C", "company": "D"}], append=False)
+    db.save_applied("A-B-CV", {"title": "A", "company": "B"})
+    assert db.archive_applied_jobs() == 1
+    assert db.save_scouted_jobs([{"title": "a", "company": "b"}], append=True) == [
+        {"title": "C", "company": "D", "job_key": JobKey.of({"title": "C", "company": "D"})}]
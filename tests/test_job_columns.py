@@ -0,0 +1,71 @@
+from job_hunter.data_manager import DataManager, read_cache, COLUMNS_DIR, APPLIED_FILE
+from job_hunter.job_columns import job_columns_cache
+from job_hunter.journal import journal_path_for
+import math
+import os
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    job_columns_cache.invalidate()
+    return DataManager()
+
+
+def job(i, **extra):
+    return dict({"title": f"Engineer {i}", "company": f"Co {i}", "link": f"https://x/{i}"}, **extra)
+
+
+def rebuilt(db, kind):
+    job_columns_cache.invalidate()
+    for name in os.listdir(COLUMNS_DIR):
+        os.remove(os.path.join(COLUMNS_DIR, name))
+    return {k: v.tolist() for k, v in db.job_columns(kind).items()}
+
+
+def test_applied_columns_normalize_and_follow_writes(db):
+    db.save_applied("A", {"Platform": "LinkedIn", "found_job": "Data"},
+                    {"fit_report": {"score": 80}, "ats_report": {"score": 70}})
+    db.save_applied("B", {"platform": "Xing", "Language": "de"})
+    first = db.job_columns("applied")
+    assert first["platform"].tolist() == ["LinkedIn", "Xing"]
+    assert first["found_job"].tolist() == ["Data", "Unknown"]
+    assert first["fit_score"][0] == 80 and math.isnan(first["fit_score"][1])
+
+    db.save_applied("C", {"Platform": "Indeed"})
+    db.delete_applied("A")
+    patched = {k: v.tolist() for k, v in db.job_columns("applied").items()}
+    assert patched["key"] == ["B", "C"]
+    assert patched["platform"] == ["Xing", "Indeed"]
+    assert str(patched) == str(rebuilt(db, "applied"))
+
+
+def test_scouted_append_patches_and_snapshot_is_reused(db):
+    db.save_scouted_jobs([job(1, platform="LinkedIn"), job(2, Platform="Xing")])
+    assert db.job_columns("scouted")["platform"].tolist() == ["LinkedIn", "Xing"]
+
+    db.save_scouted_jobs([job(3), job(1, language="en")], append=True)
+    columns = db.job_columns("scouted")
+    assert columns["key"].tolist() == ["https://x/1", "https://x/2", "https://x/3"]
+    assert columns["language"].tolist() == ["en", "Unknown", "Unknown"]
+
+    # A fresh process reads the saved snapshot instead of the store
+    job_columns_cache.invalidate()
+    read_cache.invalidate()
+    db.iter_scouted = None
+    assert db.job_columns("scouted")["language"].tolist() == ["en", "Unknown", "Unknown"]
+
+
+def test_changed_store_is_not_served_from_stale_snapshot(db):
+    db.save_applied("A", {"Platform": "LinkedIn"})
+    db.job_columns("applied")
+    job_columns_cache.invalidate()
+    with open(APPLIED_FILE, "w", encoding="utf-8") as f:
+        f.write('{"Z": {"job_details": {"platform": "Manual"}, "created_at": "2024-01-01"}}')
+    if os.path.exists(journal_path_for(APPLIED_FILE)):
+        os.remove(journal_path_for(APPLIED_FILE))
+    read_cache.invalidate()
+
+    assert db.job_columns("applied")["platform"].tolist() == ["Manual"]
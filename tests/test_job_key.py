@@ -0,0 +1,63 @@
+from job_hunter.data_manager import DataManager, read_cache, CACHE_FILE, SCOUTED_FILE
+from job_hunter.job_key import JobKey, job_key_indexes, link_id
+from job_hunter.journal import JsonJournal
+import json
+import pickle
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    job_key_indexes.invalidate()
+    return DataManager()
+
+
+JOB = {"title": "Data Engineer (m/w/d)\nData Engineer", "company": " Acme GmbH ", "platform": "LinkedIn",
+       "link": "https://www.linkedin.com/jobs/view/data-engineer-at-acme-4012345678/?refId=abc"}
+
+
+def test_key_is_stable_across_field_variants():
+    key = JobKey.of(JOB)
+    same = JobKey.of({"Job Title": "data  engineer (m/w/d)", "Company": "ACME GmbH",
+                      "Web Address": "https://de.linkedin.com/jobs/view/4012345678"})
+    assert key == same and len(key) == 16
+    assert key.fields() == {"platform": "linkedin", "link_id": "linkedin:4012345678",
+                            "title": "data engineer (m/w/d)", "company": "acme gmbh"}
+    assert JobKey.of(dict(JOB, company="Other")) != key
+    assert pickle.loads(pickle.dumps(key)).fields() == key.fields()
+    assert link_id("https://de.indeed.com/viewjob?jk=abc123&from=serp") == "indeed:abc123"
+    assert JobKey.of({"title": "", "company": ""}) is None
+
+
+def test_records_are_stamped_and_cache_joins_exactly(db):
+    db.save_scouted_jobs([dict(JOB)])
+    key = db.load_scouted()[0]["job_key"]
+    db.save_cache("Data Engineer (m/w/d)\nData Engineer-Acme GmbH-CV", {"score": 1}, JOB, "CV.pdf")
+    db.save_cache("Other-Co-CV", {"score": 2}, {"title": "Other", "company": "Co"}, "CV.pdf")
+    db.save_applied("A", dict(JOB))
+
+    assert db.load_applied()["A"]["job_key"] == key
+    # Same posting, different casing and title line: still found by key
+    row = {"title": "DATA ENGINEER (m/w/d)", "company": "acme gmbh", "platform": "LinkedIn",
+           "link": "https://de.linkedin.com/jobs/view/4012345678"}
+    assert db.cache_keys_for_job(row) == ["Data Engineer (m/w/d)\nData Engineer-Acme GmbH-CV"]
+    assert db.cache_keys_for_job(row, "Other.pdf") == []
+    assert db.load_cache()["Other-Co-CV"]["_resume"] == "CV"
+
+
+def test_migrator_keys_legacy_records(db):
+    with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+        json.dump([{"title": "Dev", "company": "Co", "link": "https://x.org/jobs/dev-123456"}], f)
+    JsonJournal(CACHE_FILE).compact({"Dev-Co-CV": {"score": 5}, "Dev-Co": {"score": 6}, "Gone-X-CV": {"score": 7}})
+    read_cache.invalidate()
+
+    assert db.migrate_job_keys() == {"scouted": 1, "parked": 0, "applied": 0, "cache": 2}
+    key = db.load_scouted()[0]["job_key"]
+    cache = db.load_cache()
+    assert cache["Dev-Co-CV"]["_job_key"] == key and cache["Dev-Co-CV"]["_resume"] == "CV"
+    assert "_resume" not in cache["Dev-Co"] and "_job_key" not in cache["Gone-X-CV"]
+    assert db.migrate_job_keys() == {"scouted": 0, "parked": 0, "applied": 0, "cache": 0}
+    assert db.cache_keys_for_job({"title": "Dev", "company": "Co", "link": "https://x.org/jobs/dev-123456"}) \
+        == ["Dev-Co-CV", "Dev-Co"]
@@ -0,0 +1,97 @@
+from job_hunter.data_manager import DataManager, read_cache, CACHE_FILE
+from job_hunter.journal import JsonJournal
+import json
+import os
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_save_cache_appends_instead_of_rewriting(db):
+    snapshot_before = os.path.getsize(CACHE_FILE)
+    db.save_cache("A-B-CV", {"score": 1})
+    db.save_cache("C-D-CV", {"score": 2})
+    db.save_cache("A-B-CV", {"score": 3})
+
+    assert os.path.getsize(CACHE_FILE) == snapshot_before
+    with open(JsonJournal(CACHE_FILE).journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+
+    # Re-saved key moves to the end, as before
+    assert list(db.load_cache().keys()) == ["C-D-CV", "A-B-CV"]
+    assert list(db.load_cache(fresh=True).keys()) == ["C-D-CV", "A-B-CV"]
+    assert db.load_cache()["A-B-CV"]["score"] == 3
+
+
+def test_applied_update_keeps_position_and_delete(db):
+    db.save_applied("A-B", {"title": "A", "company": "B"})
+    db.save_applied("C-D", {"title": "C", "company": "D"})
+    db.save_applied("A-B", status="interview")
+
+    applied = db.load_applied(fresh=True)
+    assert list(applied.keys()) == ["A-B", "C-D"]
+    assert applied["A-B"]["job_details"]["title"] == "A"
+
+    db.delete_applied("A-B")
+    assert list(db.load_applied().keys()) == ["C-D"]
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    snapshot = tmp_path / "store.json"
+    snapshot.write_text("{}")
+    journal = JsonJournal(str(snapshot), max_bytes=200, min_bytes=0)
+    for i in range(10):
+        journal.set(f"k{i}", {"v": i})
+    journal.delete("k0")
+    assert journal.needs_compaction()
+
+    data = journal.compact()
+    assert journal.journal_size() == 0
+    assert json.loads(snapshot.read_text()) == data
+    assert "k0" not in data and len(data) == 9
+    assert sorted(os.listdir(tmp_path)) == ["store.journal.jsonl", "store.json"]  # replaced atomically, no temp left
+
+
+def test_torn_trailing_line_is_ignored(db):
+    db.save_cache("A-B-CV", {"score": 1})
+    with open(JsonJournal(CACHE_FILE).journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "set", "key": "broken", "val')
+    assert list(db.load_cache().keys()) == ["A-B-CV"]
+
+    # The next write after the crash starts on a line of its own instead of joining the torn one
+    db.save_cache("C-D-CV", {"score": 2})
+    assert list(db.load_cache(fresh=True).keys()) == ["A-B-CV", "C-D-CV"]
+
+
+def test_clean_database_compacts_cache(db):
+    db.save_applied("A-B-CV", {"title": "A", "company": "B"})
+    db.save_cache("A-B-CV", {"score": 1})
+    db.save_cache("X-Y-CV", {"score": 2})
+
+    stats = db.clean_database()
+    assert stats["cache_entries_removed"] == 1
+    assert JsonJournal(CACHE_FILE).journal_size() == 0
+    assert list(db.load_cache().keys()) == ["A-B-CV"]
+
+
+def test_journal_mode_off_rewrites_snapshot(db, monkeypatch):
+    monkeypatch.setenv("STORAGE_JOURNAL", "off")
+    plain = DataManager()
+    plain.save_cache("A-B-CV", {"score": 1})
+    with open(CACHE_FILE, encoding="utf-8") as f:
+        assert "A-B-CV" in json.load(f)
+
+
+def test_cached_view_is_patched_without_reparsing(db):
+    db.save_cache("A-B-CV", {"score": 1})
+    db.load_cache()
+    read_cache.reset_stats()
+
+    db.save_cache("C-D-CV", {"score": 2})
+    assert "C-D-CV" in db.load_cache()
+    assert read_cache.stats()["misses"] == 0
@@ -0,0 +1,53 @@
+from job_hunter.data_manager import DataManager, read_cache, SCOUTED_FILE
+from job_hunter.journal import JsonJournal
+from job_hunter.json_stream import iter_array, iter_object
+import io
+import json
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_stream_parsers_across_chunk_boundaries():
+    items = [{"title": f"Job {i}", "n": i * 1000, "tags": ["a", "b"], "x": 1.5e3} for i in range(50)] + [12345, "s"]
+    text = json.dumps(items, indent=2)
+    assert list(iter_array(io.StringIO(text), chunk_size=7)) == items
+    obj = {f"k{i}": v for i, v in enumerate(items)}
+    assert list(iter_object(io.StringIO(json.dumps(obj)), chunk_size=5)) == list(obj.items())
+    assert list(iter_array(io.StringIO(" [ ] "))) == []
+
+
+def test_journal_overlay_matches_replay(tmp_path):
+    journal = JsonJournal(str(tmp_path / "store.json"))
+    snapshot = {"a": 1, "b": 2, "c": 3, "d": 4}
+    journal.set("b", 20)
+    journal.set("e", 5)
+    journal.set("a", 10, move_to_end=True)
+    journal.delete("c")
+    journal.set("c", 30)
+    journal.set("f", 6, move_to_end=True)
+    journal.set("e", 50)
+    journal.delete("f")
+    expected = journal.replay(dict(snapshot))
+    assert list(journal.iter_items(iter(snapshot.items()))) == list(expected.items())
+
+
+def test_iterators_stream_uncached_stores(db):
+    db.save_scouted_jobs([{"title": f"T{i}", "company": "C", "link": f"l{i}"} for i in range(5)], append=False)
+    db.save_applied("T1-C", {"title": "T1", "company": "C"})
+    db.save_applied("T9-C", {"title": "T9", "company": "C"})
+    read_cache.invalidate()
+
+    assert [j for j in db.iter_scouted(fields=("link",))][:2] == [{"link": "l0"}, {"link": "l1"}]
+    assert read_cache.peek(SCOUTED_FILE) is None  # streamed, not cached
+    assert [job_id for job_id, _ in db.iter_applied(fields=())] == list(db.load_applied())
+    assert dict(db.iter_applied())["T1-C"] == db.load_applied()["T1-C"]
+
+    assert db.archive_applied_jobs() == 1
+    assert db.archive_applied_jobs() == 0
+    assert [j["title"] for j in db.iter_scouted(("title",))] == ["T0", "T2", "T3", "T4"]
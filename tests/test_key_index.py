@@ -0,0 +1,49 @@
+from job_hunter.data_manager import DataManager, read_cache, ACTIVE_RESUMES_FILE
+from job_hunter.key_index import SortedKeyIndex
+from job_hunter.storage import read_json
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_prefix_lookup_in_store_order():
+    index = SortedKeyIndex(["Dev-Co-B", "Dev-Co-A", "Dev-Corp-A", "Ops-Co-A"])
+    assert index.with_prefix("Dev-Co") == ["Dev-Co-B", "Dev-Co-A", "Dev-Corp-A"]  # same as startswith
+    index.add("Dev-Co-B", move_to_end=True)
+    index.discard("Dev-Corp-A")
+    assert index.with_prefix("Dev-Co-") == ["Dev-Co-A", "Dev-Co-B"]
+    assert index.with_any_prefix(["Ops", "Nope"]) == {"Ops-Co-A"}
+    assert len(index) == 3
+
+
+def test_cache_key_index_follows_journal_writes(db):
+    db.save_cache("Dev-Co-A", {"score": 1})
+    db.save_cache("Ops-Co-A", {"score": 1})
+    db.save_cache("Dev-Co-B", {"score": 2})
+    assert db.cache_keys_with_prefix("Dev-Co") == ["Dev-Co-A", "Dev-Co-B"]
+
+    db.save_cache("Dev-Co-A", {"score": 3})  # moves to the end
+    assert db.cache_keys_with_prefix("Dev-Co") == ["Dev-Co-B", "Dev-Co-A"]
+
+    assert db.delete_cache_for_job("Dev", "Co") == 2
+    assert db.cache_keys_with_prefix("Dev-Co") == []
+    assert list(db.load_cache(fresh=True)) == ["Ops-Co-A"]
+
+
+def test_clean_database_keeps_protected_prefixes(db):
+    db.save_applied("Dev-Co-A", {"title": "Dev", "company": "Co"})
+    db.save_cache("Dev-Co-A", {"score": 1})
+    db.save_cache("Ops-Co-A", {"score": 1})
+    db.save_active_resume("Dev", "Co-A", "cv.pdf")
+    db.save_active_resume("Ops", "Co", "cv.pdf")
+
+    result = db.clean_database()
+    assert result["cache_entries_removed"] == 1
+    assert list(db.load_cache(fresh=True)) == ["Dev-Co-A"]
+    assert db.cache_keys_with_prefix("Ops") == []
+    assert list(read_json(ACTIVE_RESUMES_FILE)) == ["Dev-Co-A"]
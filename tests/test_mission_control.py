@@ -0,0 +1,61 @@
+from job_hunter.data_manager import read_cache
+from job_hunter.mission_control import RESOLVED, MissionControl, control_events, mission_control
+from job_hunter.mission_state import MissionProgress
+import os
+import socket
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    progress = MissionProgress(mission_type="Vision Batch Apply", is_active=True)
+    progress.save()
+    return progress
+
+
+def test_control_events():
+    events = [("set", "is_paused", True), ("add", "jobs_applied", 1), ("set", "pending_question", None),
+              ("set", "is_active", False), ("set", "is_active", True)]
+    assert control_events(events) == ["pause", "resolved", "stop"]
+
+
+def test_waiter_wakes_on_resolved_question(state):
+    state.update(pending_question="Solve the captcha")
+    woke = []
+
+    def waiter():
+        t0 = time.perf_counter()
+        resolved = mission_control.wait_until(lambda: MissionProgress.load().pending_question is None,
+                                              timeout=10, interval=60)
+        woke.append((resolved, time.perf_counter() - t0))
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.1)
+    MissionProgress.load().update(pending_question=None)  # "I've answered it" in the UI
+    thread.join(5)
+    assert woke and woke[0][0] and woke[0][1] < 1
+    assert mission_control.last_event == RESOLVED
+    assert mission_control.wait_until(lambda: False, timeout=0.05) is False
+
+
+def test_events_reach_other_processes(tmp_path):
+    # Two channels on one directory talk through their sockets like two processes would
+    ui, mission = MissionControl(str(tmp_path / "control")), MissionControl(str(tmp_path / "control"))
+    ui.listen()
+    mission.listen()
+    version = mission.version
+    ui.publish("pause")
+    assert mission.wait(version, timeout=5) != version and mission.last_event == "pause"
+
+    mission._close()
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    dead.bind(str(tmp_path / "control" / "1-dead.sock"))
+    dead.close()  # its process died, leaving the socket file behind
+    ui.publish("resume")
+    assert [path.name for path in (tmp_path / "control").iterdir()] == [os.path.basename(ui._listener[0])]
+    ui._close()
@@ -0,0 +1,75 @@
+from job_hunter.blob_store import is_blob_ref
+from job_hunter.data_manager import DataManager, read_cache
+from job_hunter.mission_state import EVENTS_FILE, STATE_FILE, MissionProgress, load_state
+from job_hunter.storage import read_json
+import os
+import pytest
+
+JD = "Build data pipelines. " * 200
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def start(n_jobs):
+    progress = MissionProgress(mission_type="Scout & Analyze", is_active=True)
+    progress.tasks = [{"label": "Scrape", "completed": False, "type": "scout"},
+                      {"label": "Analyze", "completed": False, "type": "analyze"}]
+    progress.scouting_backlog = [{"keyword": "Data", "resume_text": JD}]
+    progress.analysis_backlog = [{"title": f"Job {i}", "rich_description": JD + str(i)} for i in range(n_jobs)]
+    progress.save()
+    return progress
+
+
+def test_steps_append_events_instead_of_rewriting(db):
+    progress = start(50)
+    checkpoint = os.path.getsize(STATE_FILE)
+
+    progress.update(status="Scouting Data...", current_step=1)
+    progress.extend_backlog("analysis_backlog", [{"title": "New", "rich_description": JD + "new"}])
+    progress.update_task(0, completed=True)
+    progress.increment("jobs_scouted", 3)
+    assert progress.pop_backlog("scouting_backlog")["keyword"] == "Data"
+    for _ in range(10):
+        progress.pop_backlog("analysis_backlog")
+
+    assert os.path.getsize(STATE_FILE) == checkpoint  # untouched: only the journal grew
+    assert os.path.getsize(EVENTS_FILE) < 4096
+    loaded = MissionProgress.load()
+    assert (loaded.status, loaded.current_step, loaded.jobs_scouted) == ("Scouting Data...", 1, 3)
+    assert loaded.tasks[0]["completed"] and not loaded.scouting_backlog
+    assert [job["title"] for job in loaded.analysis_backlog][:1] + [loaded.analysis_backlog[-1]["title"]] == ["Job 10", "New"]
+    assert is_blob_ref(read_json(STATE_FILE)["analysis_backlog"][0]["rich_description"])
+    new_ref = load_state()["analysis_backlog"][-1]["rich_description"]
+    assert is_blob_ref(new_ref) and new_ref in db._live_blob_refs()  # only referenced from the journal
+
+def test_other_instances_steps_are_merged(db):
+    mission = start(3)
+    ui = MissionProgress.load()
+    ui.update(is_paused=True, status="Paused (Manual)")
+    mission.increment("jobs_applied")
+    assert mission.is_paused and mission.jobs_applied == 1
+    loaded = MissionProgress.load()
+    assert loaded.is_paused and loaded.status == "Paused (Manual)" and loaded.jobs_applied == 1
+
+
+def test_checkpoint_folds_the_journal(db, monkeypatch):
+    monkeypatch.setattr("job_hunter.mission_state.CHECKPOINT_MIN_BYTES", 512)
+    progress = start(3)
+    epoch = progress.epoch
+    for i in range(30):
+        progress.update(status=f"Step {i}")
+    assert progress.epoch != epoch and os.path.getsize(EVENTS_FILE) < 1024
+    assert MissionProgress.load().status == "Step 29"
+
+    # Crash after a checkpoint but before its journal: the old journal is not replayed again
+    stale = open(EVENTS_FILE, "rb").read()
+    progress.pop_backlog("analysis_backlog")
+    progress.save()
+    with open(EVENTS_FILE, "wb") as f:
+        f.write(stale + b'{"op":"pop","key":"analysis_backlog"}\n')
+    assert len(MissionProgress.load().analysis_backlog) == 2
@@ -0,0 +1,53 @@
+from job_hunter.data_manager import DataManager, read_cache
+from job_hunter.near_duplicates import NearDuplicateIndex, normalize_company, normalize_title
+import pytest
+
+JD = "We are looking for a data engineer to build and run our streaming platform. " * 20
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def job(title, company, location="Berlin, Germany", **extra):
+    return {"title": title, "company": company, "location": location, **extra}
+
+
+def test_normalization():
+    assert normalize_title("Data Engineer (m/w/d)") == normalize_title("data engineer") == "data engineer"
+    assert normalize_title("Data Engineer (all genders)") == "data engineer"
+    assert normalize_company("ACME GmbH") == normalize_company("Acme AG") == "acme"
+
+
+def test_index_links_platform_variants_only():
+    index = NearDuplicateIndex.build([job("Data Engineer", "ACME GmbH"), job("Sales Manager", "Other AG")],
+                                     lambda j: f"{j['title']}-{j['company']}")
+    assert index.find(job("Data Engineer (m/w/d)", "Acme AG", "Berlin")).job_id == "Data Engineer-ACME GmbH"
+    assert index.find(job("Data Engineers", "ACME", "Berlin")) is not None
+    assert index.find(job("Senior Data Engineer", "ACME GmbH")) is None  # different level
+    assert index.find(job("Data Engineer", "ACME GmbH", "Munich")) is None  # different location
+    assert index.find(job("Data Engineer", "Globex GmbH")) is None
+    assert index.find(job("Data Engineer", "Unknown")) is None
+
+
+def test_scouted_duplicates_reuse_description_and_analysis(db):
+    db.save_scouted_jobs([job("Data Engineer", "ACME GmbH", link="https://linkedin/1", rich_description=JD)],
+                         append=True)
+    db.save_cache("Data Engineer-ACME GmbH-cv", {"fit_report": {"score": 90}})
+
+    fresh = [job("Data Engineer (m/w/d)", "Acme AG", link="https://indeed/9")]
+    assert db.link_near_duplicates(fresh) == 1
+    assert fresh[0]["duplicate_of"] == "Data Engineer-ACME GmbH"
+    assert fresh[0]["rich_description"]  # no deep scrape needed
+
+    saved = db.save_scouted_jobs([job("Data Engineer", "Acme", link="https://xing/3")], append=True)
+    assert len(saved) == 2 and saved[1]["duplicate_of"] == "Data Engineer-ACME GmbH"
+    assert db.near_duplicate_index().find(saved[1]).job_id == "Data Engineer-ACME GmbH"
+
+    jid = db.generate_job_id("Data Engineer", "Acme", "cv.pdf")
+    reused = db.reuse_duplicate_analysis(saved[1], jid, "cv.pdf")
+    assert reused["fit_report"]["score"] == 90
+    assert db.load_cache()[jid]["duplicate_of"] == "Data Engineer-ACME GmbH"
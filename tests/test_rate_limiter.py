@@ -0,0 +1,73 @@
+from job_hunter.rate_limiter import MAX_FACTOR, MIN_FACTOR, Pace, RateLimiter, jitter, looks_blocked
+from job_hunter.scrapers.base_scraper import BaseScraper
+import job_hunter.scrapers.base_scraper as base_scraper
+import pytest
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    pace = Pace("Test", per_minute=60, burst=2)
+    assert pace.reserve() == 0 and pace.reserve() == 0
+    assert 0.9 < pace.reserve() <= 1.0           # one token a second
+    assert 1.9 < pace.reserve() <= 2.0           # queued behind the previous reservation
+
+
+def test_blocks_tighten_and_clean_responses_loosen(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_TEST", "6000/100")  # the bucket never limits here
+    limiter = RateLimiter(sleep=lambda seconds: None)
+    assert limiter.delay("Test", 1, 1) == 1
+
+    limiter.blocked("Test", "captcha")
+    limiter.blocked("Test", "captcha")
+    assert limiter.delay("Test", 1, 1) == 4
+    for _ in range(10):
+        limiter.blocked("Test")
+    assert limiter.delay("Test", 1, 1) == MAX_FACTOR
+
+    for _ in range(100):
+        limiter.clean("Test")
+    assert limiter.delay("Test", 1, 1) == MAX_FACTOR  # never faster than a pace that was blocked
+    assert limiter.snapshot()["Test"] == {"factor": MAX_FACTOR, "blocks": 12}
+
+    for _ in range(100):  # keys are paced independently
+        limiter.clean("Other")
+    assert limiter.delay("Other", 1, 1) == MIN_FACTOR
+    limiter.blocked("Other")
+    for _ in range(100):
+        limiter.clean("Other")
+    assert MIN_FACTOR < limiter.pace("Other").factor < 1
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "triangular", "gauss"])
+def test_jitter_stays_in_range(distribution):
+    assert all(2 <= jitter(2, 4, distribution) <= 4 for _ in range(200))
+
+
+class FakeDriver:
+    current_url = "https://www.linkedin.com/jobs/view/1"
+    title = "Data Engineer | Acme"
+
+
+class FakeScraper(BaseScraper):
+    def __init__(self):
+        self.platform_name = "LinkedIn"
+        self.driver = FakeDriver()
+
+    def search(self, keyword, location, limit=10):
+        return []
+
+    def fetch_details(self, job_url):
+        return None
+
+
+def test_scraper_pace_reacts_to_block_pages(monkeypatch):
+    slept = []
+    limiter = RateLimiter(sleep=slept.append)
+    monkeypatch.setattr(base_scraper, "rate_limiter", limiter)
+    scraper = FakeScraper()
+
+    scraper.pace(2, 2)
+    assert slept == [2] and limiter.pace("LinkedIn").factor < 1
+    scraper.driver.current_url = "https://www.linkedin.com/checkpoint/challenge/abc"
+    scraper.pace(2, 2)
+    assert limiter.pace("LinkedIn").blocks == 1 and limiter.pace("LinkedIn").factor > 1
+    assert looks_blocked("Just a moment...") and not looks_blocked("Senior Security Engineer")
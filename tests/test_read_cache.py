@@ -0,0 +1,59 @@
+from job_hunter.data_manager import DataManager, read_cache, thaw
+import copy
+import json
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    read_cache.reset_stats()
+    return DataManager()
+
+
+def test_repeated_loads_hit_cache(db):
+    db.save_scouted_jobs([{"title": "Data Analyst", "company": "ACME", "link": "https://x/1"}])
+    read_cache.reset_stats()
+
+    first = db.load_scouted()
+    second = db.load_scouted()
+    assert first is second
+    assert db.read_cache_stats()["misses"] == 1
+    assert db.read_cache_stats()["hits"] == 1
+
+
+def test_external_write_invalidates(db):
+    assert db.load_cache() == {}
+    with open("data/analysis_cache.json", "w", encoding="utf-8") as f:
+        json.dump({"A-B-CV": {"score": 1}}, f)
+    assert "A-B-CV" in db.load_cache()
+
+
+def test_cached_views_are_read_only(db):
+    db.save_cache("A-B-CV", {"qna_history": [{"role": "user"}]})
+    cache = db.load_cache()
+    with pytest.raises(TypeError):
+        cache["X"] = {}
+    with pytest.raises(TypeError):
+        cache["A-B-CV"]["qna_history"].append({})
+
+    mutable = thaw(cache)
+    mutable["A-B-CV"]["qna_history"].append({})
+    assert copy.deepcopy(cache)["A-B-CV"]["qna_history"] == [{"role": "user"}]
+    assert len(db.load_cache()["A-B-CV"]["qna_history"]) == 1
+
+
+def test_mutating_methods_still_work(db):
+    db.save_blacklist(["BadCorp"], [])
+    assert db.load_blacklist()["safe_phrases"] == []
+    db.add_answer("Notice period", "1 month")
+    db.save_applied("A-B", {"title": "A", "company": "B"})
+    db.save_applied("A-B", status="interview")
+    assert db.load_applied()["A-B"]["status"] == "interview"
+    assert db.load_bot_config()["answers"]["notice period"] == "1 month"
+
+    db.save_scouted_jobs([{"title": "A2", "company": "B"}], append=True)
+    db.save_scouted_jobs([{"title": "A2", "company": "B", "language": "de"}], append=True)
+    assert pd.DataFrame(db.load_scouted())["language"].tolist() == ["de"]
@@ -0,0 +1,40 @@
+from job_hunter.data_manager import DataManager, read_cache
+from job_hunter.resume_files import resume_file, resume_pdf_bytes
+from job_hunter.storage import atomic_write_bytes, read_json
+import hashlib
+import os
+import pytest
+
+PDF = b"%PDF-1.4 fake resume " * 100
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_entries_carry_lazy_shared_handles(db, tmp_path):
+    path = tmp_path / "data" / "resumes" / "cv.pdf"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(PDF)
+    db.save_resume_config({"cv.pdf": {"file_path": str(path), "text": "cv", "pdf": resume_file(path)}})
+    assert "pdf" not in read_json(os.path.join("data", "resume_config.json"))["cv.pdf"]
+
+    first, second = db.load_resume_config()["cv.pdf"], db.load_resume_config()["cv.pdf"]
+    handle = first["pdf"]
+    assert second["pdf"] is handle  # one handle (and one read) for every session
+    assert handle._data is None  # nothing read at load time
+    assert handle.size == len(PDF)
+
+    assert bytes(resume_pdf_bytes(first)) == PDF
+    assert handle.sha256 == hashlib.sha256(PDF).hexdigest()
+    assert resume_pdf_bytes({"pdf_bytes": b"legacy"}) == b"legacy"
+
+    atomic_write_bytes(str(path), b"%PDF-1.4 v2")
+    assert bytes(handle.read()) == b"%PDF-1.4 v2"
+    assert handle.sha256 == hashlib.sha256(b"%PDF-1.4 v2").hexdigest()
+
+    os.remove(path)
+    assert handle.read() == b"" and not handle.exists()
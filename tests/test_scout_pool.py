@@ -0,0 +1,152 @@
+from job_hunter.data_manager import read_cache
+from job_hunter.mission_state import MissionProgress
+from job_hunter.scout_pool import DONE, EMITTED, FAILED, STAGE_DONE, STARTED, STATUS, ScoutPool, Stage
+import threading
+import time
+import pytest
+
+ITEMS = [{"keyword": kw, "location": "Berlin", "platform": p}
+         for kw in ("Data Engineer", "Analyst") for p in ("LinkedIn", "Indeed", "Xing")]
+
+
+class Tracker:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {"total": 0}
+
+    def work(self, worker, item, report, emit):
+        platform = item["platform"]
+        with self.lock:
+            self.running[platform] = self.running.get(platform, 0) + 1
+            self.peak[platform] = max(self.peak.get(platform, 0), self.running[platform])
+            self.peak["total"] = max(self.peak["total"], sum(self.running.values()))
+        report(f"searching {item['keyword']}")
+        time.sleep(self.delay)
+        with self.lock:
+            self.running[platform] -= 1
+        return [f"{item['keyword']} on {platform}"]
+
+
+def test_platforms_run_in_parallel_within_limits():
+    tracker = Tracker()
+    t0 = time.perf_counter()
+    events = list(ScoutPool(workers=3, per_platform=1).run(ITEMS, tracker.work))
+    elapsed = time.perf_counter() - t0
+
+    assert sorted(payload[0] for event, _, _, payload in events if event == DONE) == sorted(
+        f"{item['keyword']} on {item['platform']}" for item in ITEMS)
+    assert [event for event, *_ in events].count(STATUS) == len(ITEMS)
+    assert tracker.peak == {"total": 3, "LinkedIn": 1, "Indeed": 1, "Xing": 1}
+    assert elapsed < 0.5  # 2 rounds of 3 searches, not 6 in a row
+
+
+def test_failed_item_is_retried_and_stop_drains():
+    failures = []
+
+    def flaky(worker, item, report, emit):
+        if item["platform"] == "Indeed" and not failures:
+            failures.append(item)
+            raise RuntimeError("captcha")
+        return []
+
+    events = [(event, item["platform"]) for event, _, item, _ in
+              ScoutPool(workers=2, retry_delay=0.05).run(ITEMS[:3], flaky)]
+    assert (FAILED, "Indeed") in events and events.count((DONE, "Indeed")) == 1
+    assert sum(1 for event, _ in events if event == DONE) == 3
+
+    # can_dispatch False (mission stopped): nothing new starts, running items finish
+    dispatched = []
+    def can_dispatch():
+        dispatched.append(1)
+        return len(dispatched) <= 2
+    events = list(ScoutPool(workers=3).run(ITEMS, Tracker(0.05).work, can_dispatch))
+    assert [e[0] for e in events].count(STARTED) == 2 and [e[0] for e in events].count(DONE) == 2
+
+
+def test_stage_streams_with_back_pressure():
+    lock = threading.Lock()
+    counts = {"emitted": 0, "analyzed": 0, "peak": 0}
+
+    def search(worker, item, report, emit):
+        for i in range(5):
+            emit({"job": f"{item['platform']}-{i}"})
+            with lock:
+                counts["emitted"] += 1
+                counts["peak"] = max(counts["peak"], counts["emitted"] - counts["analyzed"])
+        time.sleep(0.2)  # e.g. saving: the first analyses are done meanwhile
+        return []
+
+    def analyze(stage, job):
+        time.sleep(0.01)
+        with lock:
+            counts["analyzed"] += 1
+        return job["job"]
+
+    events = list(ScoutPool(workers=2).run(ITEMS[:2], search, stage=Stage("analysis", analyze, size=3),
+                                           carried=[{"job": "left over"}]))
+    kinds = [event for event, *_ in events]
+    assert kinds.count(EMITTED) == 10 and kinds.count(STAGE_DONE) == 11
+    assert kinds.index(STAGE_DONE) < kinds.index(DONE)  # analysis starts before the first search is done
+    assert counts["peak"] <= 3 + 1  # emit blocks while 3 jobs wait (one more may be counted mid-handoff)
+    assert "left over" in [payload for event, _, _, payload in events if event == STAGE_DONE]
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    progress = MissionProgress(mission_type="Scout & Analyze", is_active=True, scouting_backlog=list(ITEMS))
+    progress.save()
+    return progress
+
+
+def test_backlog_items_finish_out_of_order(state):
+    state.remove_backlog("scouting_backlog", ITEMS[4])
+    state.update_worker("worker-2", platform="Indeed", status="Scouting")
+    state.update_worker("worker-2", jobs=7)
+    loaded = MissionProgress.load()
+    assert loaded.scouting_backlog == ITEMS[:4] + ITEMS[5:]
+    assert loaded.workers == {"worker-2": {"platform": "Indeed", "status": "Scouting", "jobs": 7}}
+
+
+class StatusBox:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+
+def test_mission_pipeline_scouts_and_analyzes(state, monkeypatch):
+    import job_hunter.mission_manager as mission_manager
+
+    profiles, analyzed = set(), []
+
+    class FakeScout:
+        def __init__(self, profile_name="default"):
+            profiles.add(profile_name)
+
+        def launch_mission(self, keyword, location, limit, platforms, easy_apply, deep_scrape, status_callback, extra_fields, on_job):
+            status_callback("found 1 job")
+            job = dict(title=keyword, company=platforms[0], rich_description="JD")
+            for fields in extra_fields:  # one copy per resume sharing the search
+                on_job(dict(job, **fields))
+            return [dict(job, **extra_fields[0])]
+
+    monkeypatch.setattr(mission_manager, "Scout", FakeScout)
+    monkeypatch.setattr(mission_manager, "is_internet_available", lambda: True)
+    monkeypatch.setattr(mission_manager.MissionManager, "_analyze_job", lambda self, job: analyzed.append(job["title"]))
+    carried = {"title": "Carried over", "company": "Acme"}  # scraped before the mission was interrupted
+    state.update(tasks=[{"label": f"Scrape for {i['keyword']} in {i['location']} on {i['platform']}",
+                         "completed": False, "type": "scout"} for i in ITEMS]
+                       + [{"label": "Run AI Analysis for all found jobs", "completed": False, "type": "analyze"}],
+                 analysis_backlog=[carried], config_context={"scout_workers": 3}, total_steps=len(ITEMS) + 1)
+
+    mm = mission_manager.MissionManager(db=None)
+    mm._execute_scouting_loop(StatusBox())
+
+    loaded = MissionProgress.load()
+    assert loaded.scouting_backlog == [] and loaded.phase == "Analysis" and loaded.workers == {}
+    assert loaded.jobs_scouted == len(ITEMS) and loaded.analysis_backlog == []  # analyzed while scouting
+    assert sorted(analyzed) == sorted([i["keyword"] for i in ITEMS] + ["Carried over"])
+    assert all(task["completed"] for task in loaded.tasks)
+    assert profiles == {"default", "scout_worker-2", "scout_worker-3"}
@@ -0,0 +1,102 @@
+from job_hunter.data_manager import read_cache
+from job_hunter.models import JobRecord
+from job_hunter.rate_limiter import RateLimiter
+from job_hunter.search_cache import SearchCache, load_search_cache, query_key
+import job_hunter.scout as scout
+import pytest
+import time
+
+JD = "We are looking for a data engineer to build and run our streaming platform. " * 20
+ROLES = [{"_role_name": "Data", "_resume_filename": "data.pdf"}, {"_role_name": "Backend", "_resume_filename": "backend.pdf"}]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return SearchCache()
+
+
+def test_key_ignores_case_and_spacing():
+    assert query_key("LinkedIn", " Data  Engineer", "Berlin ") == query_key("linkedin", "data engineer", "BERLIN")
+    assert query_key("LinkedIn", "Data Engineer", "Berlin") != query_key("LinkedIn", "Data Engineer", "Berlin", easy_apply=True)
+
+
+def test_entries_expire(cache):
+    cache.put("LinkedIn", "Data Engineer", "Berlin", False, [{"title": "Data Engineer", "rich_description": JD}])
+    assert cache.get("linkedin", "data engineer", "berlin") == [{"title": "Data Engineer", "rich_description": JD}]
+    assert cache.get("LinkedIn", "Data Engineer", "Berlin", easy_apply=True) is None
+    assert SearchCache(ttl_hours=0).get("LinkedIn", "Data Engineer", "Berlin") is None
+    # Long texts go to the blob store
+    assert load_search_cache()[query_key("LinkedIn", "Data Engineer", "Berlin")]["jobs"][0]["rich_description"] != JD
+
+    short = SearchCache(ttl_hours=0.01 / 3600)
+    time.sleep(0.02)
+    assert short.get("LinkedIn", "Data Engineer", "Berlin") is None
+    short.put("Indeed", "Data Engineer", "Berlin", False, [])
+    assert list(load_search_cache()) == [query_key("Indeed", "Data Engineer", "Berlin")]  # expired ones dropped
+
+
+class FakeScraper:
+    def __init__(self):
+        self.searches, self.fetches = 0, 0
+
+    def search(self, keyword, location, limit, easy_apply=False):
+        self.searches += 1
+        return [JobRecord(title=keyword, company="Acme", location=location, link="https://example.com/1", platform="LinkedIn")]
+
+    def fetch_details(self, url):
+        self.fetches += 1
+        return {"description": JD, "language": "en"}
+
+
+def test_one_search_serves_every_resume(cache, monkeypatch):
+    monkeypatch.setattr(scout, "rate_limiter", RateLimiter(sleep=lambda seconds: None))
+    scraper = FakeScraper()
+    s = scout.Scout(search_cache=cache)
+    s.scrapers = {"LinkedIn": scraper}
+    streamed = []
+
+    jobs = s.launch_mission("Data Engineer", "Berlin", 5, ["LinkedIn"], deep_scrape=True, extra_fields=ROLES,
+                            on_job=streamed.append)
+    assert [job["_role_name"] for job in streamed] == ["Data", "Backend"]  # analyzed against each resume
+    assert [(job["_role_names"], job["rich_description"]) for job in jobs] == [(["Data", "Backend"], JD)]
+
+    # The same search again (another resume, or a resumed mission): neither searched nor fetched
+    jobs = s.launch_mission("data engineer", "Berlin", 5, ["LinkedIn"], deep_scrape=True,
+                            extra_fields={"_role_name": "Analyst"})
+    assert [(job["_role_name"], job["rich_description"]) for job in jobs] == [("Analyst", JD)]
+    assert (scraper.searches, scraper.fetches) == (1, 1)
+    assert "_role_name" not in load_search_cache()[query_key("LinkedIn", "Data Engineer", "Berlin")]["jobs"][0]
+
+    # One stored posting, tagged with every resume it was scouted for
+    stored = s.db.load_scouted(fresh=True)
+    assert [(job["_role_name"], job["_role_names"]) for job in stored] == [("Data", ["Data", "Backend", "Analyst"])]
+
+    # A mission asking for more results than the cached search had searches again
+    s.launch_mission("Data Engineer", "Berlin", 50, ["LinkedIn"], deep_scrape=False)
+    assert scraper.searches == 2
+
+
+class StatusBox:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+
+def test_backlog_runs_shared_searches_once(cache, monkeypatch):
+    import job_hunter.mission_manager as mission_manager
+    from job_hunter.data_manager import DataManager
+    from job_hunter.mission_state import MissionProgress
+
+    monkeypatch.setattr(mission_manager.MissionManager, "resume_mission", lambda self, status_box: None)
+    resumes = {"data.pdf": {"target_keywords": "Data Engineer; Analyst", "text": "data"},
+               "backend.pdf": {"target_keywords": "data engineer", "text": "backend"}}
+    mission_manager.MissionManager(DataManager()).run_standard_scrape_mission(
+        resumes, "Berlin", 5, ["LinkedIn", "Indeed"], False, False, StatusBox())
+
+    state = MissionProgress.load()
+    assert [(item["keyword"], item["platform"], [role["role_name"] for role in item["roles"]])
+            for item in state.scouting_backlog] == [
+        ("Data Engineer", "LinkedIn", ["data.pdf", "backend.pdf"]), ("Data Engineer", "Indeed", ["data.pdf", "backend.pdf"]),
+        ("Analyst", "LinkedIn", ["data.pdf"]), ("Analyst", "Indeed", ["data.pdf"])]
+    assert len(state.tasks) == 4
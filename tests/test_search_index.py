@@ -0,0 +1,82 @@
+from job_hunter.data_manager import DataManager, read_cache, SCOUTED_FILE, SEARCH_INDEX_FILE
+from job_hunter.job_key import JobKey
+from job_hunter.search_index import SearchIndex, fts_match, parse_query, search_index_for
+from job_hunter.sqlite_store import SQLiteDataManager
+import json
+import pytest
+
+JOBS = [
+    {"title": "Data Engineer", "company": "Acme", "link": "https://x.org/jobs/data-engineer-100001",
+     "rich_description": "Build the data platform in Python. Spark and Airflow. On call rotation."},
+    {"title": "Backend Developer", "company": "Beta", "link": "https://x.org/jobs/backend-100002",
+     "rich_description": "Python and Java services; our data platform team is next door."},
+    {"title": "Frontend Developer", "company": "Gamma", "link": "https://x.org/jobs/frontend-100003",
+     "rich_description": "React and TypeScript. Some Python scripting. Platform for data."},
+]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_parse_query():
+    assert parse_query('Python "data  platform" -java NOT "on call" -') == (
+        [["python"], ["data", "platform"]], [["java"], ["on", "call"]])
+    assert fts_match('python -"on call"') == '("python") NOT ("on call")'
+    assert fts_match("-python") is None
+
+
+def test_ranked_phrase_and_excluded_terms(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.ensure({"scouted": 1}, lambda: (("scouted", job["title"], job["rich_description"]) for job in JOBS))
+    assert {hit[1] for hit in index.search('"data platform"')} == {"Data Engineer", "Backend Developer"}
+    assert [hit[1] for hit in index.search('python "data platform" -java')] == ["Data Engineer"]
+    assert {hit[1] for hit in index.search("python NOT spark")} == {"Backend Developer", "Frontend Developer"}
+    assert index.search("-python") == [] and index.search("cobol") == []
+
+    index.discard("scouted", "Data Engineer").set("applied", "A", "Python on call")
+    assert [hit[:2] for hit in index.search('"on call"')] == [("applied", "A")]
+    assert index.search("python on call", kinds=("scouted",)) == []
+
+    index.set("scouted", "1", "python java cobol fortran").set("scouted", "2", "python python java")
+    assert [hit[1] for hit in index.search("python java", kinds=("scouted",))][:2] == ["2", "1"]
+
+
+def test_data_manager_index_follows_writes(db):
+    db.save_scouted_jobs([dict(JOBS[0])])
+    assert [hit[:2] for hit in db.search_jobs("airflow")] == [("scouted", JobKey.of(JOBS[0]))]
+
+    db.save_scouted_jobs([dict(job) for job in JOBS[1:]], append=True)
+    db.save_applied("Backend Developer-Beta-CV", dict(JOBS[1]))
+    index = search_index_for(SEARCH_INDEX_FILE)
+    assert index.signatures() == json.loads(json.dumps(db._search_signatures()))  # patched, not rebuilt
+    assert [hit[:2] for hit in db.search_jobs('"data platform" -spark')] == [
+        ("scouted", JobKey.of(JOBS[1])), ("applied", "Backend Developer-Beta-CV")]
+
+    db.delete_applied("Backend Developer-Beta-CV")
+    assert db.search_jobs("java", kinds=("applied",)) == []
+
+    # Changed behind our back: rebuilt on the next search
+    with open(SCOUTED_FILE, "w", encoding="utf-8") as f:
+        json.dump([JOBS[2]], f)
+    read_cache.invalidate()
+    assert [hit[:2] for hit in db.search_jobs("python")] == [("scouted", JobKey.of(JOBS[2]))]
+    assert len(index) == 1
+
+
+def test_sqlite_full_text_search(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+    db.save_scouted_jobs([dict(job) for job in JOBS])
+    db.save_applied("A", dict(JOBS[0]))
+
+    hits = db.search_jobs('python "data platform" -java')
+    assert {hit[:2] for hit in hits} == {("scouted", JobKey.of(JOBS[0])), ("applied", "A")}
+    db.delete_applied("A")
+    db.delete_scouted_job("Data Engineer", "Acme")
+    assert db.search_jobs("airflow") == []
+    assert db.reindex_search() == 2
+    assert len(db.search_jobs("python")) == 2
@@ -0,0 +1,104 @@
+from job_hunter.data_manager import DataManager
+from job_hunter.sqlite_store import SQLiteDataManager, migrate_json_to_sqlite, SQLiteStore
+import os
+
+
+def test_backend_selected_from_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("STORAGE_BACKEND", "sqlite")
+    db = DataManager()
+    assert isinstance(db, SQLiteDataManager)
+    assert os.path.exists(os.path.join("data", "career_commander.db"))
+
+
+def test_scouted_dedupe_and_applied_filter(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+
+    db.save_scouted_jobs([
+        {"title": "Data Analyst", "company": "ACME", "link": "https://x/1"},
+        {"title": "BI Developer", "company": "Initech", "link": "https://x/2"},
+    ], append=True)
+    # Same link -> update in place, longer description wins
+    db.save_scouted_jobs([{"title": "Data Analyst", "company": "ACME", "link": "https://x/1", "rich_description": "Long JD"}], append=True)
+
+    scouted = db.load_scouted()
+    assert len(scouted) == 2
+    assert scouted[0]["rich_description"] == "Long JD"
+
+    db.save_applied("Data Analyst-ACME-CV", {"title": "Data Analyst", "company": "ACME", "link": "https://x/1"})
+    assert db.archive_applied_jobs() == 1
+    assert [j["title"] for j in db.load_scouted()] == ["BI Developer"]
+
+    # Applied jobs are filtered from new scouting results
+    result = db.save_scouted_jobs([{"title": "Data Analyst", "company": "ACME", "link": "https://x/1"}], append=True)
+    assert len(result) == 1
+
+
+def test_cache_order_and_prefix_delete(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+    db.save_cache("A-B-CV1", {"score": 1})
+    db.save_cache("C-D-CV1", {"score": 2})
+    db.save_cache("A-B-CV1", {"score": 3})
+
+    assert list(db.load_cache().keys()) == ["C-D-CV1", "A-B-CV1"]
+    assert db.delete_cache_for_job("A", "B") == 1
+    assert list(db.load_cache().keys()) == ["C-D-CV1"]
+
+
+def test_cache_delete_by_job_key(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+    job = {"title": "Data Analyst", "company": "ACME", "link": "https://x/1"}
+    other = {"title": "Data Analyst", "company": "ACME", "link": "https://x/2"}  # same title and company
+    db.save_cache("Data Analyst-ACME-CV1", {"score": 1}, dict(job), "CV1.pdf")
+    db.save_cache("Data Analyst-ACME-CV2", {"score": 2}, dict(other), "CV2.pdf")
+
+    assert db.delete_cache_for_job("Data Analyst", "ACME", dict(job)) == 1
+    assert list(db.load_cache().keys()) == ["Data Analyst-ACME-CV2"]
+
+
+def test_park_job_removes_from_scouted(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+    db.save_scouted_jobs([{"title": "Data Analyst", "company": "ACME", "link": "https://x/1"}])
+    db.park_job("Data Analyst", "ACME", {"link": "https://x/1"})
+    db.park_job("Data Analyst", "ACME")
+
+    assert db.load_scouted() == []
+    assert len(db.load_parked()) == 1
+
+
+def test_migrate_existing_json(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    json_db = DataManager()
+    json_db.save_scouted_jobs([{"title": "Data Analyst", "company": "ACME", "link": "https://x/1"}])
+    json_db.save_cache("Data Analyst-ACME-CV", {"score": 80})
+    json_db.save_blacklist(["BadCorp"], ["Intern"], ["Analyst"])
+    json_db.save_messaged_contact("Jane Doe")
+
+    counts = migrate_json_to_sqlite(SQLiteStore())
+    assert counts["scouted"] == 1
+    assert counts["cache"] == 1
+
+    db = SQLiteDataManager()
+    assert db.load_scouted()[0]["company"] == "ACME"
+    assert db.load_blacklist() == {"companies": ["BadCorp"], "titles": ["Intern"], "safe_phrases": ["Analyst"]}
+    assert db.load_messaged_contacts()[0]["name"] == "Jane Doe"
+    # Already migrated: second call is a no-op
+    assert migrate_json_to_sqlite(SQLiteStore()) == {}
+
+
+def test_cache_job_keys(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = SQLiteDataManager()
+    job = {"title": "Dev", "company": "Co", "link": "https://x.org/jobs/dev-123456"}
+    db.save_scouted_jobs([dict(job)])
+    db.save_cache("Dev-Co-Old", {"score": 1})
+    db.save_cache("Dev-Co-CV", {"score": 2}, job, "CV.pdf")
+
+    assert db.cache_keys_for_job({"title": "dev", "company": "co", "link": job["link"]}) == ["Dev-Co-CV"]
+    assert db.migrate_job_keys()["cache"] == 1
+    assert db.cache_keys_for_job(job) == ["Dev-Co-Old", "Dev-Co-CV"]
+    assert db.cache_keys_for_job(job, "Old.pdf") == ["Dev-Co-Old"]
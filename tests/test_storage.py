@@ -0,0 +1,73 @@
+from job_hunter.data_manager import DataManager, read_cache, PARKED_FILE
+from job_hunter.mission_state import MissionProgress, STATE_FILE
+from job_hunter.storage import atomic_write_json, fsync_batcher, lock_path_for, read_json, write_lock
+import os
+import threading
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    read_cache.invalidate()
+    return DataManager()
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    path = str(tmp_path / "store.json")
+    atomic_write_json(path, {"a": 1})
+    os.chmod(path, 0o600)
+    atomic_write_json(path, {"a": 2})
+
+    assert read_json(path) == {"a": 2}
+    assert sorted(os.listdir(tmp_path)) == [".locks", "store.json"]
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    path = str(tmp_path / "store.json")
+    atomic_write_json(path, {"a": 1})
+    with pytest.raises(TypeError):
+        atomic_write_json(path, {"a": object()})
+
+    assert read_json(path) == {"a": 1}
+    assert sorted(os.listdir(tmp_path)) == [".locks", "store.json"]
+
+
+def test_write_lock_is_reentrant_and_uses_sidecar(tmp_path):
+    path = str(tmp_path / "store.json")
+    with write_lock(path):
+        with write_lock(path):
+            atomic_write_json(path, [])
+        assert read_json(path) == []  # read under our own write lock must not block
+    assert os.path.exists(lock_path_for(path))
+
+
+def test_fsync_batcher_flush(tmp_path):
+    fsync_batcher.flush()
+    atomic_write_json(str(tmp_path / "a.json"), {})
+    atomic_write_json(str(tmp_path / "b.json"), {})
+    assert fsync_batcher.flush() == 1  # the files were fsynced before their rename: only the directory is left
+    assert fsync_batcher.flush() == 0
+
+
+def test_concurrent_read_modify_write_loses_nothing(db):
+    def park(i):
+        db.park_job(f"Job {i}", f"Company {i}")
+
+    threads = [threading.Thread(target=park, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(read_json(PARKED_FILE)) == 20
+    assert not [f for f in os.listdir("data") if f.endswith(".tmp")]
+
+
+def test_mission_state_roundtrip(db):
+    MissionProgress(mission_type="Batch Apply", jobs_applied=3).save()
+    assert os.path.exists(STATE_FILE)
+    loaded = MissionProgress.load()
+    assert loaded.mission_type == "Batch Apply"
+    assert loaded.jobs_applied == 3
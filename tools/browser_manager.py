@@ -1,20 +1,79 @@
 from tools.logger import logger
 import os
 import json
+import threading
+from contextlib import contextmanager
 import undetected_chromedriver as uc
 from selenium import webdriver
 
+class _DriverSlot:
+    """One browser: the driver and the mode/profile it was started with."""
+    def __init__(self):
+        self.driver = None
+        self.is_headless = False
+        self.profile = None
+
 class BrowserManager:
     _instance = None
-    _driver = None
-    _is_headless = False
-    _current_profile = None
+    _shared = _DriverSlot()      # the app's browser
+    _dedicated = {}              # thread id -> slot of a worker thread (see dedicated)
+    _local = threading.local()
+    _slots_lock = threading.Lock()
+    _launch_lock = threading.Lock()   # undetected_chromedriver patches its binary on launch: one at a time
+    _cookies_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(BrowserManager, cls).__new__(cls)
         return cls._instance
 
+    # The driver of the calling thread: its dedicated one inside dedicated(), else the shared one
+    def _slot(self):
+        return getattr(self._local, "slot", None) or self._shared
+
+    @property
+    def _driver(self):
+        return self._slot().driver
+
+    @_driver.setter
+    def _driver(self, driver):
+        self._slot().driver = driver
+
+    @property
+    def _is_headless(self):
+        return self._slot().is_headless
+
+    @_is_headless.setter
+    def _is_headless(self, headless):
+        self._slot().is_headless = headless
+
+    @property
+    def _current_profile(self):
+        return self._slot().profile
+
+    @_current_profile.setter
+    def _current_profile(self, profile_name):
+        self._slot().profile = profile_name
+
+    @contextmanager
+    def dedicated(self):
+        """
+        with BrowserManager().dedicated(): ...
+        Gives the calling thread a driver of its own while inside the block, so worker
+        threads (parallel scouting) each drive their own Chrome. They must use distinct
+        profiles: Chrome locks a profile directory. The driver is closed on exit.
+        """
+        slot = self._local.slot = _DriverSlot()
+        with self._slots_lock:
+            self._dedicated[threading.get_ident()] = slot
+        try:
+            yield self
+        finally:
+            self.close_driver()
+            with self._slots_lock:
+                self._dedicated.pop(threading.get_ident(), None)
+            self._local.slot = None
+
     def get_driver(self, headless=False, profile_name="default"):
         """Returns the existing driver or creates a new one for the specified profile."""
         if self._driver is not None:
@@ -33,7 +92,8 @@ class BrowserManager:
                 # Driver died, recreate
                 self._driver = None
         
-        return self._init_driver(headless, profile_name)
+        with self._launch_lock:
+            return self._init_driver(headless, profile_name)
 
     def _init_driver(self, headless=False, profile_name="default"):
         self._is_headless = headless
@@ -198,8 +258,9 @@ class BrowserManager:
             cookie_path = os.path.join(project_dir, "data", "cookies.json")
 
             os.makedirs(os.path.dirname(cookie_path), exist_ok=True)
-            with open(cookie_path, 'w', encoding='utf-8') as f:
-                json.dump(unique_cookies, f, indent=2)
+            with self._cookies_lock:
+                with open(cookie_path, 'w', encoding='utf-8') as f:
+                    json.dump(unique_cookies, f, indent=2)
             logger.info(f"Saved {len(unique_cookies)} unique cookies to {cookie_path}")
         except Exception as e:
             logger.error(f"Failed to save cookies: {e}")
@@ -273,5 +334,15 @@ class BrowserManager:
             self._current_profile = None
 
     def close_all_drivers(self):
-        """Alias for close_driver — single driver only."""
+        """Closes this thread's driver and the ones of all worker threads (see dedicated)."""
         self.close_driver()
+        with self._slots_lock:
+            slots = [self._shared] + list(self._dedicated.values())
+        for slot in slots:
+            if slot.driver:
+                try:
+                    slot.driver.quit()
+                except:
+                    pass
+                slot.driver = None
+                slot.profile = None
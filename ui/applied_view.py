@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-from ui.metrics import render_metrics_dashboard
+from job_hunter.blob_store import resolve_text
+from ui.metrics import frame_from_columns, render_metrics_dashboard
 
 @st.dialog("📋 Application Details", width="large")
 def show_details_dialog(job_record):
@@ -29,7 +30,7 @@ def show_details_dialog(job_record):
             st.info("No AI Intel available for this application.")
 
     with tab2:
-        cl = analysis.get('cover_letter')
+        cl = resolve_text(analysis.get('cover_letter'))
         if cl:
             st.text_area("Generated Cover Letter", cl, height=400)
             st.download_button("📥 Download Cover Letter", cl, file_name=f"Cover_Letter_{details.get('Company')}.txt")
@@ -46,7 +47,7 @@ def show_details_dialog(job_record):
 
     with tab4:
         # Check for tailored resume first
-        tailored = analysis.get('tailored_resume')
+        tailored = resolve_text(analysis.get('tailored_resume'))
         if tailored:
             st.markdown("### ✨ Tailored Resume Highlights")
             st.markdown(tailored)
@@ -63,18 +64,15 @@ def render_applied_view(db):
     st.title("📂 Applied Jobs History")
 
     # --- RENDER DASHBOARD ---
-    current_scouted_data = db.load_scouted()
-    if current_scouted_data:
-        current_df_stats = pd.DataFrame(current_scouted_data)
-    else:
-        current_df_stats = pd.DataFrame(columns=["Platform"])
+    # Columnar snapshots: no per-rerun frame building from the raw records
+    current_df_stats = frame_from_columns(db.job_columns("scouted"))
 
     # Ensure applied_jobs is in session state
     if 'applied_jobs' not in st.session_state or not st.session_state['applied_jobs']:
          st.session_state['applied_jobs'] = db.load_applied()
 
     applied_dict = st.session_state['applied_jobs']
-    render_metrics_dashboard(current_df_stats, applied_dict, len(db.load_parked()))
+    render_metrics_dashboard(current_df_stats, frame_from_columns(db.job_columns("applied")), len(db.load_parked()))
 
     # --- GRAND MASTER STRATEGIST (CAREER AUDIT) ---
     st.markdown("---")
@@ -102,6 +100,17 @@ def render_applied_view(db):
              st.markdown("### ♟️ Grand Master Strategy Report")
              st.markdown(st.session_state['last_audit_result'])
 
+        # Only the newest entries of the logbook are read, never the whole history
+        previous = db.load_audit_reports(4)
+        if st.session_state.get('last_audit_result'):
+             previous = previous[1:]
+        if previous:
+             st.markdown("#### 📚 Previous Audits")
+             for audit_at, report in previous[:3]:
+                  st.caption(f"Audit from {audit_at}")
+                  st.markdown(report)
+                  st.markdown("---")
+
     # --- APPLIED JOBS LIST ---
     if not applied_dict:
         st.info("No applied jobs yet.")
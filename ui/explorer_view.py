@@ -1,12 +1,16 @@
 import streamlit as st
 import pandas as pd
 import base64
-from job_hunter.data_manager import DataManager
+from job_hunter.blob_store import resolve_text
+from job_hunter.data_manager import thaw
+from job_hunter.job_key import job_key_of
+from job_hunter.resume_files import resume_pdf_bytes
 from tools.logger import logger
-from tools.browser_manager import BrowserManager
-from ui.metrics import render_metrics_dashboard
+from ui.metrics import frame_from_columns, render_metrics_dashboard
 import os
 
+SEARCH_LIMIT = 200  # best matches shown for a search box query
+
 def get_mapped_resume_name(db, row):
     """Resolves the best resume filename for a given job row, prioritizing the most recent analysis."""
     resumes = st.session_state.get('resumes', {})
@@ -31,16 +35,17 @@ def get_mapped_resume_name(db, row):
     latest_ts = ""
     last_resume_order = None  # Fallback: last matching key in dict order
 
-    for cache_key, entry in cache.items():
-        if not cache_key.startswith(base_id):
-            continue
-        if "error" in entry:
+    for cache_key in db.cache_keys_for_job(row):
+        entry = cache.get(cache_key)
+        if entry is None or "error" in entry:
             continue
         
-        # Extract resume name from cache key: "title-company-ResumeName"
-        suffix = cache_key[len(base_id):]  # e.g., "-Sheikh Ali Mateen - Data Analyst"
-        if suffix.startswith("-"):
-            suffix = suffix[1:]  # Remove leading dash
+        # Resume of the entry: stamped by save_cache, else from the key "title-company-ResumeName"
+        suffix = entry.get('_resume')
+        if not suffix:
+            suffix = cache_key[len(base_id):]  # e.g., "-Sheikh Ali Mateen - Data Analyst"
+            if suffix.startswith("-"):
+                suffix = suffix[1:]  # Remove leading dash
         
         # Find matching resume in session
         matched_resume = None
@@ -72,7 +77,12 @@ def get_mapped_resume_name(db, row):
     res_file = row.get('_resume_filename')
     if res_file in resumes:
         return res_file
-        
+    # A search shared by several resumes tags the job with all of them
+    role_names = row.get('_role_names')
+    for role_name in role_names if isinstance(role_names, list) else []:
+        if role_name in resumes:
+            return role_name
+
     # 3. Lookup role in history
     history = db.load_all_resume_history()
     role = row.get('_role_name') or row.get('Found_job')
@@ -129,6 +139,7 @@ def render_explorer_view(db):
     """, unsafe_allow_html=True)
 
     st.title("🔎 Explorer / Scouted")
+    stats_before = db.read_cache_stats()
 
     # Load data
     scouted_jobs = db.load_scouted()
@@ -158,6 +169,17 @@ def render_explorer_view(db):
     # Use all jobs without filtering as requested
     filtered = df
 
+    # Full-text search over titles, companies and descriptions (ranked, best first)
+    search_query = st.text_input("🔍 Search jobs", key="explorer_search", placeholder='python "data platform" -java',
+                                 help='All words must occur. "Quotes" for phrases, -word or NOT word to exclude.')
+    if search_query.strip():
+        hits = db.search_jobs(search_query, limit=SEARCH_LIMIT)
+        rank = {doc_id: i for i, (kind, doc_id, _) in enumerate(hits) if kind == "scouted"}
+        positions = [rank.get(job_key_of(job)) for job in scouted_jobs]
+        filtered = df.assign(_rank=positions).dropna(subset=["_rank"]).sort_values("_rank").drop(columns="_rank")
+        applied_hits = sum(1 for kind, _, _ in hits if kind == "applied")
+        st.caption(f"{len(filtered)} scouted jobs match" + (f" · {applied_hits} applied jobs match too" if applied_hits else ""))
+
     # Quick Blacklist Config
     with st.expander("🚫 Quick Blacklist Config", expanded=False):
         st.caption("Logic: Jobs matching 'Blocked' are dropped UNLESS they contain a 'Safe Phrase'.")
@@ -233,7 +255,7 @@ def render_explorer_view(db):
                 job_id = f"{row['title']}-{row['company']}"
                 if job_id in st.session_state['selected_jobs']:
                     db.delete_scouted_job(row['title'], row['company'])
-                    db.delete_cache_for_job(row['title'], row['company'])
+                    db.delete_cache_for_job(row['title'], row['company'], row.to_dict())
                     deleted += 1
             st.session_state['selected_jobs'] = set()
             st.toast(f"🗑️ Deleted {deleted} jobs + their AI analysis", icon="✅")
@@ -243,7 +265,7 @@ def render_explorer_view(db):
         if st.button("🧹 Clean DB", use_container_width=True, help="Wipe scouted + orphaned AI cache. Keep only Applied & Parked."):
             stats = db.clean_database()
             st.session_state['selected_jobs'] = set()
-            st.session_state['job_cache'] = db.load_cache()
+            st.session_state['job_cache'] = thaw(db.load_cache())
             st.toast(f"🧹 Cleaned! Removed {stats['cache_entries_removed']} orphaned cache entries. Kept {stats['cache_entries_kept']}.", icon="✅")
             st.rerun()
 
@@ -275,7 +297,7 @@ def render_explorer_view(db):
                         resume_data = st.session_state['resumes'].get(sel_resume, {})
 
                         # JD Fallback matches single analysis mode
-                        jd = job.get('rich_description') or job.get('description', '')
+                        jd = resolve_text(job.get('rich_description') or job.get('description', ''))
                         context = f"Title: {job['title']}\nCompany: {job['company']}\nJD: {jd}"
 
                         try:
@@ -285,9 +307,9 @@ def render_explorer_view(db):
 
                             if results and "error" not in results:
                                 job_cache_id = db.generate_job_id(job['title'], job['company'], sel_resume)
-                                db.save_cache(job_cache_id, results)
+                                db.save_cache(job_cache_id, results, job, sel_resume)
                                 db.save_active_resume(job['title'], job['company'], sel_resume)
-                                st.session_state['job_cache'] = db.load_cache()
+                                st.session_state['job_cache'] = thaw(db.load_cache())
                                 st.write(f"✅ Success: {job['company']}")
                             else:
                                 err = results.get('error', 'Unknown Error')
@@ -315,8 +337,9 @@ def render_explorer_view(db):
         st.session_state['selected_jobs'] = set()
         st.rerun()
 
-    # Sort by Platform, then Title
-    filtered = filtered.sort_values(by=["platform", "title"])
+    # Sort by Platform, then Title (search results keep their relevance order)
+    if not search_query.strip():
+        filtered = filtered.sort_values(by=["platform", "title"])
 
     # Cache for analysis status
     cache = db.load_cache()
@@ -423,7 +446,7 @@ def render_explorer_view(db):
                     from tools.pdf_generator import generate_cover_letter_pdf
                     bot_config = db.load_bot_config()
                     custom_path = bot_config.get("settings", {}).get("cover_letter_path", "data/Cover_Letter.pdf")
-                    path = generate_cover_letter_pdf(results["cover_letter"], output_path=custom_path)
+                    path = generate_cover_letter_pdf(resolve_text(results["cover_letter"]), output_path=custom_path)
                     if path:
                         st.toast(f"✅ Saved ({resume_name}): {path}", icon="📄")
 
@@ -432,12 +455,13 @@ def render_explorer_view(db):
 
             # 4. Details
             if act_cols[3].button("ⓘ", key=f"det_{job_id}_{idx}_{title_label}", help="View Details"):
-                st.info(f"Language: {row.get('language', 'Unknown')}\n\nDescription Snippet:\n{row.get('rich_description', 'No detailed description available.')[:1000]}...")
+                st.info(f"Language: {row.get('language', 'Unknown')}\n\nDescription Snippet:\n{resolve_text(row.get('rich_description', 'No detailed description available.'))[:1000]}...")
 
             # 5. Applied Status
             if act_cols[4].button("✔", key=f"status_{job_id}_{idx}_{title_label}", help="Mark Applied"):
-                db.save_applied(full_job_id, job_data=row.to_dict(), analysis_data=results)
-                db.delete_scouted_job(row['title'], row['company'])
+                with db.batch():
+                    db.save_applied(full_job_id, job_data=row.to_dict(), analysis_data=results)
+                    db.delete_scouted_job(row['title'], row['company'])
                 st.toast("🚀 Marked as Applied!", icon="✅")
                 st.rerun()
 
@@ -453,11 +477,12 @@ def render_explorer_view(db):
                 
             # 8. Block
             if act_cols[7].button("⛔", key=f"block_{job_id}_{idx}_{title_label}", help="Blacklist this Title"):
-                bl = db.load_blacklist()
+                bl = thaw(db.load_blacklist())
                 if row['title'] not in bl['titles']:
                     bl['titles'].append(row['title'])
-                    db.save_blacklist(bl['companies'], bl['titles'], bl['safe_phrases'])
-                    db.delete_scouted_job(row['title'], row['company'])
+                    with db.batch():
+                        db.save_blacklist(bl['companies'], bl['titles'], bl['safe_phrases'])
+                        db.delete_scouted_job(row['title'], row['company'])
                     st.toast(f"🚫 Blacklisted: {row['title']}")
                     st.rerun()
 
@@ -471,7 +496,12 @@ def render_explorer_view(db):
     with st.expander("📈 Metrics and Visualisations", expanded=False):
         # Count valid (non-error) AI analyses
         analyzed_count = sum(1 for v in cache.values() if isinstance(v, dict) and "error" not in v and "ats_report" in v)
-        render_metrics_dashboard(filtered, st.session_state['applied_jobs'], len(db.load_parked()), analyzed_count)
+        render_metrics_dashboard(filtered, frame_from_columns(db.job_columns("applied")),
+                                 len(db.load_parked()), analyzed_count)
+
+    stats_after = db.read_cache_stats()
+    logger.debug(f"Explorer render: {stats_after['hits'] - stats_before['hits']} cached reads, "
+                 f"{stats_after['misses'] - stats_before['misses']} file parses")
 
 @st.dialog("🧠 Job Analysis", width="large")
 def render_analysis_dialog(job, db):
@@ -500,6 +530,7 @@ def render_analysis_dialog(job, db):
 
     # Check if in cache
     cache = db.load_cache()
+    db.note_cache_access(job_id, original_job_id)
     is_analyzed = job_id in cache and "error" not in cache[job_id]
     original_is_analyzed = original_job_id in cache and "error" not in cache[original_job_id]
     analysis_results = cache.get(job_id, {})
@@ -529,12 +560,12 @@ def render_analysis_dialog(job, db):
     if st.button(btn_label, type="primary"):
         from job_hunter.analysis_crew import JobAnalysisCrew
         with st.spinner(f"Analyzing with **{selected_resume_key}**..."):
-            jd = job.get('rich_description') or job.get('description', '')
+            jd = resolve_text(job.get('rich_description') or job.get('description', ''))
             context = f"Title: {job.get('title')}\nCompany: {job.get('company')}\nJD: {jd}"
             crew = JobAnalysisCrew(context, selected_resume_data.get('text', ''))
             results = crew.run_analysis(use_browser=True)
             if results and "error" not in results:
-                db.save_cache(job_id, results)
+                db.save_cache(job_id, results, job, selected_resume_key)
                 db.save_active_resume(job['title'], job['company'], selected_resume_key)
                 st.session_state['job_cache'][job_id] = results
                 st.success(f"✅ Analysis Complete with **{selected_resume_key}**!")
@@ -563,7 +594,7 @@ def render_analysis_dialog(job, db):
             if is_resume_switched and not is_analyzed:
                 st.caption(f"⚠️ Showing cover letter from **{resolved_resume}**. Re-run to generate for **{selected_resume_key}**.")
             st.write(f"**Humanization Level:** {display_results.get('humanization_score', 0)}%")
-            st.text_area("Cover Letter", display_results.get("cover_letter", ""), height=400)
+            st.text_area("Cover Letter", resolve_text(display_results.get("cover_letter", "")), height=400)
 
     with tab2:
         if not display_analyzed: st.info("Run AI Analysis first.")
@@ -577,7 +608,7 @@ def render_analysis_dialog(job, db):
 
     with tab3:
         st.markdown("### Job Description")
-        jd_text = job.get('rich_description', 'No detailed description available.')
+        jd_text = resolve_text(job.get('rich_description', 'No detailed description available.'))
         st.markdown(jd_text, unsafe_allow_html=True)
 
     with tab4:
@@ -605,15 +636,16 @@ def render_analysis_dialog(job, db):
                 st.caption(f"⚠️ Showing tailored resume from **{resolved_resume}**. Re-run to tailor for **{selected_resume_key}**.")
             c_res1, c_res2 = st.columns([1, 1])
             with c_res1:
-                st.text_area("Tailored Resume", display_results.get("tailored_resume", ""), height=600)
+                st.text_area("Tailored Resume", resolve_text(display_results.get("tailored_resume", "")), height=600)
             with c_res2:
                 st.markdown("### Original Resume Preview")
-                if "pdf_bytes" in selected_resume_data:
-                    base64_pdf = base64.b64encode(selected_resume_data['pdf_bytes']).decode('utf-8')
+                pdf_bytes = resume_pdf_bytes(selected_resume_data)
+                if pdf_bytes:
+                    base64_pdf = base64.b64encode(pdf_bytes).decode('utf-8')
                     pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600" type="application/pdf"></iframe>'
                     st.markdown(pdf_display, unsafe_allow_html=True)
                 else:
-                    st.warning("PDF bytes not found in session. Try re-uploading.")
+                    st.warning("Resume PDF not found. Try re-uploading.")
 
     with tab6:
         render_chat_tab(job, selected_resume_key, selected_resume_data, display_results, db)
@@ -626,8 +658,9 @@ def render_chat_tab(job, resume_name, resume_data, analysis_results, db):
 
     with c_chat2:
         st.markdown("### Resume Preview")
-        if "pdf_bytes" in resume_data:
-            base64_pdf = base64.b64encode(resume_data['pdf_bytes']).decode('utf-8')
+        pdf_bytes = resume_pdf_bytes(resume_data)
+        if pdf_bytes:
+            base64_pdf = base64.b64encode(pdf_bytes).decode('utf-8')
             pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="600" type="application/pdf"></iframe>'
             st.markdown(pdf_display, unsafe_allow_html=True)
 
@@ -635,7 +668,7 @@ def render_chat_tab(job, resume_name, resume_data, analysis_results, db):
         st.subheader("💬 Ask AI")
     if "chat_history" not in st.session_state: st.session_state.chat_history = {}
     if job_id not in st.session_state.chat_history:
-        st.session_state.chat_history[job_id] = analysis_results.get("qna_history", [])
+        st.session_state.chat_history[job_id] = thaw(analysis_results.get("qna_history", []))
 
     for msg in st.session_state.chat_history[job_id]:
         with st.chat_message(msg["role"]): st.write(msg["content"])
@@ -655,7 +688,7 @@ def render_chat_tab(job, resume_name, resume_data, analysis_results, db):
                 # Start fresh for chat
                 browser_llm.new_chat()
 
-                jd = job.get('rich_description', '')
+                jd = resolve_text(job.get('rich_description', ''))
                 context = f"Job: {job['title']} at {job['company']}\nJD: {jd}\nResume: {resume_data.get('text', '')}"
                 prompt = f"Context:\n{context}\n\nQuestion: {user_query}\nAnswer in 2-3 sentences max. Do NOT use markdown code blocks."
 
@@ -671,7 +704,7 @@ def render_chat_tab(job, resume_name, resume_data, analysis_results, db):
                 st.session_state.chat_history[job_id].append({"role": "assistant", "content": response})
                 if job_id not in st.session_state['job_cache']: st.session_state['job_cache'][job_id] = {}
                 st.session_state['job_cache'][job_id]['qna_history'] = st.session_state.chat_history[job_id]
-                db.save_cache(job_id, st.session_state['job_cache'][job_id])
+                db.save_cache(job_id, st.session_state['job_cache'][job_id], job, resume_name)
                 st.rerun()
 
 @st.dialog("🚀 Confirm Batch Apply")
@@ -785,7 +818,7 @@ def render_batch_analysis_confirm(jobs_to_analyze_df, db):
                 add_log(f"Starting {job['company']}...")
                 
                 # JD Fallback matches single analysis mode
-                jd = job.get('rich_description') or job.get('description', '')
+                jd = resolve_text(job.get('rich_description') or job.get('description', ''))
                 context = f"Title: {job['title']}\nCompany: {job['company']}\nJD: {jd}"
                 
                 crew = JobAnalysisCrew(context, resume_data.get('text', ''))
@@ -799,9 +832,9 @@ def render_batch_analysis_confirm(jobs_to_analyze_df, db):
                 
                 if results and "error" not in results:
                     job_cache_id = db.generate_job_id(job['title'], job['company'], selected_resume)
-                    db.save_cache(job_cache_id, results)
+                    db.save_cache(job_cache_id, results, job, selected_resume)
                     db.save_active_resume(job['title'], job['company'], selected_resume)
-                    st.session_state['job_cache'] = db.load_cache()
+                    st.session_state['job_cache'] = thaw(db.load_cache())
                     add_log(f"✅ Success: {job['company']}")
                 else:
                     err = results.get('error', 'Unknown Error')
@@ -1,6 +1,9 @@
 import streamlit as st
 import time
 import os
+from job_hunter.resume_files import resume_file
+from job_hunter.scout_pool import SCOUT_WORKERS
+from job_hunter.storage import atomic_write_bytes
 
 def render_home_view(db):
     st.title("🚀 CareerCommander (Mini)")
@@ -26,18 +29,17 @@ def render_home_view(db):
                     if uploaded_file.name not in st.session_state['resumes']:
                         # Save to local resumes folder
                         save_path = f"data/resumes/{uploaded_file.name}"
-                        with open(save_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
+                        # Atomic replace: a previous version of this file may still be memory-mapped
+                        atomic_write_bytes(save_path, uploaded_file.getvalue())
 
-                        # Parse text
-                        from job_hunter.resume_parser import parse_resume
-                        text = parse_resume(save_path)
+                        # Parse text (cached on the shared handle)
+                        text = resume_file(save_path).text
 
                         st.session_state['resumes'][uploaded_file.name] = {
                             "filename": uploaded_file.name,
                             "file_path": os.path.abspath(save_path),
                             "text": text,
-                            "pdf_bytes": uploaded_file.getvalue(),
+                            "pdf": resume_file(save_path),
                             "target_keywords": ""
                         }
                         new_upload = True
@@ -133,6 +135,7 @@ def render_home_view(db):
     with m_col1:
         scrape_location = st.text_input("Target Locations (separate by ';')", value="Germany; Remote", help="e.g. Berlin; London; Remote")
         scrape_limit = st.number_input("Max jobs per keyword per platform", min_value=1, max_value=100, value=5, help="Specify how many jobs to fetch for each keyword on each selected platform.")
+        scout_workers = st.number_input("Parallel browsers", min_value=1, max_value=8, value=min(max(SCOUT_WORKERS, 1), 8), help="Searches on different platforms run side by side, each in its own Chrome window and profile (at most one per platform at a time).")
 
     with m_col2:
         available_platforms = ["LinkedIn", "Indeed", "Xing", "Stepstone", "ZipRecruiter"]
@@ -178,7 +181,8 @@ def render_home_view(db):
                     platforms=selected_platforms,
                     deep_scrape=deep_scrape_toggle,
                     use_browser_analysis=use_browser_analysis,
-                    status_box=status_box
+                    status_box=status_box,
+                    scout_workers=scout_workers
                 )
 
             st.cache_data.clear()
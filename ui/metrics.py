@@ -3,9 +3,24 @@ import pandas as pd
 from datetime import datetime
 import altair as alt
 
+def frame_from_columns(columns):
+    """DataFrame with the dashboard's column names from DataManager.job_columns() arrays."""
+    frame = pd.DataFrame({
+        "Platform": columns["platform"],
+        "Language": columns["language"],
+        "Found_job": columns["found_job"],
+        "created_at": columns["created_at"],
+    })
+    for name in ("status", "fit_score", "ats_score"):
+        if name in columns:
+            frame[name] = columns[name]
+    return frame
+
+
 def render_metrics_dashboard(current_df, applied_dict, parked_count=0, analyzed_count=0):
     """
     Renders Dashboard 2.1: Cards on Top, Stacked Timeline, Toggle-only.
+    applied_dict may also be a frame_from_columns() DataFrame (already normalized).
     """
 
     # --- 0. PRE-PROCESSING ---
@@ -28,18 +43,23 @@ def render_metrics_dashboard(current_df, applied_dict, parked_count=0, analyzed_
         elif 'Language' not in current_df.columns:
             current_df['Language'] = "Unknown"
 
-    # Convert Applied Dict to DataFrame
-    applied_rows = []
-    for jid, data in applied_dict.items():
-        details = data.get('job_details', {})
-        applied_rows.append({
-            # Handle both casing variants for robustness
-            "Platform": details.get('Platform') or details.get('platform') or "Unknown",
-            "Found_job": details.get('Found_job') or details.get('found_job') or "Unknown",
-            "Language": details.get('Language') or details.get('language') or "Unknown",
-            "created_at": data.get('created_at', datetime.now().isoformat())
-        })
-    applied_df = pd.DataFrame(applied_rows)
+    # Convert Applied Dict (or streamed (job_id, record) pairs, see DataManager.iter_applied) to DataFrame
+    if isinstance(applied_dict, pd.DataFrame):
+        applied_df = applied_dict.copy()
+        applied_df.loc[applied_df['created_at'] == "", 'created_at'] = datetime.now().isoformat()
+    else:
+        applied_rows = []
+        applied_items = applied_dict.items() if isinstance(applied_dict, dict) else applied_dict
+        for jid, data in applied_items:
+            details = data.get('job_details', {})
+            applied_rows.append({
+                # Handle both casing variants for robustness
+                "Platform": details.get('Platform') or details.get('platform') or "Unknown",
+                "Found_job": details.get('Found_job') or details.get('found_job') or "Unknown",
+                "Language": details.get('Language') or details.get('language') or "Unknown",
+                "created_at": data.get('created_at', datetime.now().isoformat())
+            })
+        applied_df = pd.DataFrame(applied_rows)
 
     # --- 1. METRICS (Displayed FIRST) ---
 
@@ -1,10 +1,11 @@
 import streamlit as st
+from job_hunter.data_manager import thaw
 
 def render_settings_view(db):
     st.title("⚙️ Bot Settings")
     st.caption("Configure auto-answers for LinkedIn Easy Apply questions. Unknown questions are logged here.")
 
-    bot_config = db.load_bot_config()
+    bot_config = thaw(db.load_bot_config())
     answers = bot_config.get("answers", {})
     unknown = bot_config.get("unknown_questions", [])
 